@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+Async Batch Engine - Validación live de comandos DRS sobre asyncio
+
+Versión asíncrona del camino live de BatchCommandsValidator, pensada para
+ejecutarse dentro del event loop de uvicorn sin bloquearlo:
+
+- Conexiones con ``asyncio.open_connection`` (sin sockets bloqueantes ni sleeps)
+- Una sesión por dispositivo y estrictamente un comando en vuelo por sesión
+- Varios dispositivos en paralelo, limitados por un semáforo de dispositivos en vuelo
+- Mismo formato de resultados que ``validate_batch_commands``
+- Resultados incrementales por comando (``iter_device``) para streaming
+
+Validar una flota de N remotos tarda aproximadamente lo que tarda el más
+lento, no la suma de todos.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from .batch_commands_validator import (
+    BATCH_EVENT_RESULT, BATCH_EVENT_SUMMARY, BatchCommandsValidator, BatchEvent, CommandTestResult, CommandType
+)
+from .frame_reader import SantoneFrameReader
+from .metrics import BATCHES_IN_FLIGHT, observe_command_result
+from .spans import (
+    CommandTimeline, PHASE_CONNECT, PHASE_FIRST_BYTE, PHASE_FRAME_COMPLETE, PHASE_SEND, export_batch_spans
+)
+from .tracing import get_tracer
+from .santone_session import DRS_PORT, COMMAND_OFFSET, MAX_STALE_FRAMES, ResponseMismatchError, SessionResponse
+
+tracer = get_tracer(__name__)
+
+# Dispositivos validados en paralelo por defecto
+DEFAULT_MAX_CONCURRENT_DEVICES = 50
+
+
+class AsyncSantoneSession:
+    """
+    Sesión asyncio persistente con un dispositivo DRS.
+
+    Equivalente asíncrono de SantoneSession: conexión perezosa, reconexión
+    si el dispositivo cierra el socket y latencias de handshake/petición
+    medidas por separado. Un lock garantiza un único comando en vuelo.
+    """
+
+    def __init__(self, ip_address: str, port: int = DRS_PORT, timeout: float = 3.0, max_retries: int = 1):
+        self.ip_address = ip_address
+        self.port = port
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._frame_reader = SantoneFrameReader()
+        self._frames: Deque[bytes] = deque()
+        self._lock = asyncio.Lock()
+
+        # Estadísticas de la sesión
+        self.connections = 0
+        self.reconnects = 0
+        self.requests = 0
+        self.total_connect_ms = 0.0
+        self.total_request_ms = 0.0
+        self.stale_frames = 0
+
+    # ==================== CICLO DE VIDA ====================
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def connect(self) -> float:
+        """Abre la conexión si no está abierta y devuelve la latencia del handshake en ms."""
+        if self._writer is not None:
+            return 0.0
+
+        start = time.perf_counter()
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.ip_address, self.port),
+            timeout=self.timeout
+        )
+        connect_ms = (time.perf_counter() - start) * 1000
+
+        if self.connections > 0:
+            self.reconnects += 1
+        self.connections += 1
+        self.total_connect_ms += connect_ms
+        self._frame_reader.reset()
+        self._frames.clear()
+
+        tracer.event("connected", device=self.ip_address, port=self.port, connect_ms=round(connect_ms, 2))
+        return connect_ms
+
+    async def close(self) -> None:
+        """Cierra la conexión (la siguiente petición reconecta)."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def __aenter__(self) -> "AsyncSantoneSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    # ==================== PETICIONES ====================
+
+    async def request(self, frame: bytes, timeline: Optional[CommandTimeline] = None) -> SessionResponse:
+        """
+        Envía una trama y espera la respuesta completa.
+
+        Misma semántica que ``SantoneSession.request``: reconexión y reintento
+        si el socket se cae, sin reintento (pero cerrando) tras un timeout.
+        """
+        timeline = timeline or CommandTimeline()
+        async with self._lock:
+            connect_ms = 0.0
+            reconnected = False
+            attempts = 0
+
+            while True:
+                try:
+                    connect_ms += await self.connect()
+                except asyncio.TimeoutError:
+                    timeline.mark(PHASE_CONNECT)
+                    return SessionResponse(None, connect_ms, 0.0, reconnected, True, "Connect timeout")
+                except OSError as e:
+                    timeline.mark(PHASE_CONNECT)
+                    return SessionResponse(None, connect_ms, 0.0, reconnected, False, f"Connect error: {e}")
+                timeline.mark(PHASE_CONNECT)
+
+                start = time.perf_counter()
+                try:
+                    self._writer.write(frame)
+                    await self._writer.drain()
+                    timeline.mark(PHASE_SEND)
+                    tracer.event("frame_tx", device=self.ip_address, frame=frame)
+                    response = await asyncio.wait_for(self._read_response(frame, timeline), timeout=self.timeout)
+                except asyncio.TimeoutError:
+                    timeline.mark_wait()
+                    request_ms = (time.perf_counter() - start) * 1000
+                    self._record_request(request_ms)
+                    tracer.event("response_timeout", device=self.ip_address, request_ms=round(request_ms, 2))
+                    await self.close()
+                    return SessionResponse(None, connect_ms, request_ms, reconnected, True, "Response timeout")
+                except ResponseMismatchError as e:
+                    timeline.mark_wait()
+                    request_ms = (time.perf_counter() - start) * 1000
+                    self._record_request(request_ms)
+                    tracer.event("response_mismatch", device=self.ip_address, error=str(e))
+                    await self.close()
+                    return SessionResponse(None, connect_ms, request_ms, reconnected, False, f"Response mismatch: {e}")
+                except OSError as e:
+                    await self.close()
+                    if attempts < self.max_retries:
+                        attempts += 1
+                        reconnected = True
+                        tracer.event("session_dropped", device=self.ip_address, error=str(e), attempt=attempts)
+                        continue
+                    request_ms = (time.perf_counter() - start) * 1000
+                    self._record_request(request_ms)
+                    return SessionResponse(None, connect_ms, request_ms, reconnected, False, f"Socket error: {e}")
+
+                timeline.mark(PHASE_FRAME_COMPLETE)
+                request_ms = (time.perf_counter() - start) * 1000
+                self._record_request(request_ms)
+                tracer.event("frame_rx", device=self.ip_address, frame=response, request_ms=round(request_ms, 2))
+                return SessionResponse(response, connect_ms, request_ms, reconnected)
+
+    async def _read_frame(self, timeline: Optional[CommandTimeline] = None) -> bytes:
+        while not self._frames:
+            data = await self._reader.read(self._frame_reader.capacity)
+            if not data:
+                raise ConnectionResetError("Connection closed by device")
+            if timeline is not None:
+                timeline.mark_once(PHASE_FIRST_BYTE)
+            self._frames.extend(self._frame_reader.feed(data))
+        return self._frames.popleft()
+
+    async def _read_response(self, frame: bytes, timeline: Optional[CommandTimeline] = None) -> bytes:
+        """Lee tramas hasta la respuesta con el mismo COMMAND_NUMBER que la petición."""
+        expected = frame[COMMAND_OFFSET] if len(frame) > COMMAND_OFFSET else None
+        for _ in range(MAX_STALE_FRAMES):
+            response = await self._read_frame(timeline)
+            if expected is None or len(response) <= COMMAND_OFFSET or response[COMMAND_OFFSET] == expected:
+                return response
+            self.stale_frames += 1
+            tracer.event("stale_frame_discarded", device=self.ip_address, frame=response)
+        raise ResponseMismatchError(expected)
+
+    def _record_request(self, request_ms: float) -> None:
+        self.requests += 1
+        self.total_request_ms += request_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas acumuladas de la sesión (mismo formato que SantoneSession)."""
+        return {
+            "ip_address": self.ip_address,
+            "port": self.port,
+            "connections": self.connections,
+            "reconnects": self.reconnects,
+            "requests": self.requests,
+            "stale_frames": self.stale_frames,
+            "total_connect_ms": round(self.total_connect_ms, 2),
+            "total_request_ms": round(self.total_request_ms, 2),
+            "average_request_ms": round(self.total_request_ms / self.requests, 2) if self.requests else 0,
+        }
+
+
+class AsyncBatchEngine:
+    """
+    Motor asíncrono de validación batch en modo live.
+
+    Reutiliza BatchCommandsValidator para la selección de tramas, la
+    decodificación y las estadísticas, de modo que los resultados son
+    idénticos a los del camino síncrono.
+    """
+
+    def __init__(
+        self,
+        timeout_per_command: int = 3,
+        device_port: int = DRS_PORT,
+        max_concurrent_devices: int = DEFAULT_MAX_CONCURRENT_DEVICES
+    ):
+        """
+        Args:
+            timeout_per_command: Timeout en segundos para connect y para cada respuesta
+            device_port: Puerto TCP Santone de los dispositivos
+            max_concurrent_devices: Máximo de dispositivos validándose a la vez
+        """
+        self.timeout_per_command = timeout_per_command
+        self.device_port = device_port
+        self.max_concurrent_devices = max(1, max_concurrent_devices)
+        self._validator = BatchCommandsValidator(timeout_per_command=timeout_per_command, device_port=device_port)
+
+    async def validate_device(
+        self,
+        ip_address: str,
+        command_type: CommandType,
+        selected_commands: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Valida un batch de comandos contra un dispositivo.
+
+        Returns:
+            Mismo diccionario que ``BatchCommandsValidator.validate_batch_commands`` en modo live
+        """
+        report = None
+        async for event, payload in self.iter_device(ip_address, command_type, selected_commands):
+            if event == BATCH_EVENT_SUMMARY:
+                report = payload
+        return report
+
+    async def iter_device(
+        self,
+        ip_address: str,
+        command_type: CommandType,
+        selected_commands: List[str] = None
+    ) -> AsyncIterator[BatchEvent]:
+        """
+        Valida un batch contra un dispositivo entregando cada resultado en cuanto llega.
+
+        Yields:
+            Los mismos eventos que ``BatchCommandsValidator.iter_batch_commands``
+        """
+        start_time = time.time()
+        commands = self._validator._get_commands_to_run(command_type, selected_commands)
+        results = []
+
+        with BATCHES_IN_FLIGHT.track_inprogress():
+            async with AsyncSantoneSession(ip_address, self.device_port, self.timeout_per_command) as session:
+                for command in commands:
+                    result = await self._execute_command(session, command, command_type)
+                    results.append(result)
+                    observe_command_result(result, "live")
+                    yield BATCH_EVENT_RESULT, result
+
+        export_batch_spans(ip_address, command_type.value, "live", results)
+        total_duration = int((time.time() - start_time) * 1000)
+        yield BATCH_EVENT_SUMMARY, self._validator._build_batch_report(
+            ip_address, command_type, "live", commands, results, total_duration, session.get_stats()
+        )
+
+    async def validate_fleet(
+        self,
+        ip_addresses: List[str],
+        command_type: CommandType,
+        selected_commands: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Valida el mismo batch contra varios dispositivos en paralelo.
+
+        Como mucho ``max_concurrent_devices`` dispositivos están en vuelo a la
+        vez; cada uno tiene su propia sesión con un solo comando pendiente.
+
+        Returns:
+            Diccionario con el reporte de cada dispositivo y estadísticas de flota
+        """
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(self.max_concurrent_devices)
+
+        async def run_device(ip_address: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.validate_device(ip_address, command_type, selected_commands)
+
+        devices = await asyncio.gather(*(run_device(ip) for ip in ip_addresses))
+        total_duration = int((time.time() - start_time) * 1000)
+
+        passed = len([d for d in devices if d["overall_status"] == "PASS"])
+        total = len(devices)
+        return {
+            "overall_status": "PASS" if total and passed == total else "FAIL",
+            "command_type": command_type.value,
+            "mode": "live",
+            "total_devices": total,
+            "statistics": {
+                "devices_passed": passed,
+                "devices_failed": total - passed,
+                "success_rate": round(passed / total * 100, 1) if total > 0 else 0,
+                "max_concurrent_devices": self.max_concurrent_devices,
+                "slowest_device_ms": max((d["duration_ms"] for d in devices), default=0)
+            },
+            "devices": list(devices),
+            "duration_ms": total_duration,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    async def _execute_command(self, session: AsyncSantoneSession, command: str, command_type: CommandType) -> CommandTestResult:
+        """Ejecuta un comando sobre la sesión (equivalente async de _execute_single_live_command)."""
+        timeline = CommandTimeline()
+        try:
+            frame_bytes, error_result = self._validator._prepare_live_frame(command, command_type)
+            if error_result is not None:
+                return error_result
+
+            session_response = await session.request(frame_bytes, timeline)
+            return self._validator._build_live_result(command, command_type, session_response, timeline)
+
+        except Exception as e:
+            return self._validator._build_error_result(command, command_type, e, timeline)
+
+
+# Función de conveniencia para uso directo
+async def validate_fleet_commands(
+    ip_addresses: List[str],
+    command_type: str = "remote",
+    timeout: int = 3,
+    selected_commands: List[str] = None,
+    max_concurrent_devices: int = DEFAULT_MAX_CONCURRENT_DEVICES
+) -> Dict[str, Any]:
+    """
+    Función de conveniencia para validar comandos DRS en varios dispositivos.
+
+    Args:
+        ip_addresses: IPs de los dispositivos DRS
+        command_type: "master", "remote", o "set"
+        timeout: Timeout por comando en segundos
+        selected_commands: Lista específica de comandos (opcional)
+        max_concurrent_devices: Máximo de dispositivos en paralelo
+
+    Returns:
+        Resultados de validación de la flota
+    """
+    cmd_type_map = {
+        "master": CommandType.MASTER,
+        "remote": CommandType.REMOTE,
+        "set": CommandType.SET
+    }
+    cmd_type = cmd_type_map.get(command_type.lower(), CommandType.REMOTE)
+    engine = AsyncBatchEngine(timeout_per_command=timeout, max_concurrent_devices=max_concurrent_devices)
+    return await engine.validate_fleet(ip_addresses, cmd_type, selected_commands)
@@ -7,10 +7,11 @@ usando tramas hexadecimales pre-generadas y SantoneDecoder
 
 import sys
 import json
+import logging
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 # Add project paths
@@ -18,9 +19,14 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src" / "plugins"))
 sys.path.insert(0, str(project_root))
 
+from validation.tracing import configure_logging, get_tracer, shutdown_logging
+
+tracer = get_tracer(__name__)
+
 try:
     from validation.hex_frames import DRS_MASTER_FRAMES, DRS_REMOTE_FRAMES
     from validation.decoder_integration import CommandDecoderMapping
+    from validation.santone_codec import FrameError, decode_frame
     IMPORTS_AVAILABLE = True
     print("✅ Imports loaded successfully")
 except ImportError as e:
@@ -128,17 +134,20 @@ class BatchCommandsTester:
     
     def decode_response(self, command_name: str, response_hex: str) -> Optional[Dict[str, Any]]:
         """
-        Decodifica respuesta usando SantoneDecoder si está disponible
+        Decodifica respuesta usando el codec Santone si está disponible
         """
         try:
-            if CommandDecoderMapping.has_decoder(command_name):
-                # Simulamos decodificación (en implementación real usaría SantoneDecoder)
+            # Las tramas Santone se decodifican por su propio COMMAND_NUMBER;
+            # el mapping por nombre sólo decide para respuestas simuladas
+            parsed_values, crc_valid = self._parse_response(command_name, response_hex)
+            if crc_valid is not None or CommandDecoderMapping.has_decoder(command_name):
                 decoded = {
                     "raw_hex": response_hex,
                     "decoded": True,
+                    "crc_valid": crc_valid,
                     "timestamp": datetime.now().isoformat(),
                     "decoder_method": CommandDecoderMapping.get_decoder_method(command_name),
-                    "parsed_values": self._simulate_parsed_values(command_name, response_hex)
+                    "parsed_values": parsed_values
                 }
                 return decoded
             else:
@@ -154,6 +163,20 @@ class BatchCommandsTester:
                 "error": str(e)
             }
     
+    def _parse_response(self, command_name: str, response_hex: str) -> Tuple[Dict[str, Any], Optional[bool]]:
+        """
+        Decodifica una respuesta Santone (7E ... 7E) con el codec.
+        Las respuestas que no son tramas Santone usan valores simulados
+        y devuelven crc_valid=None.
+        """
+        try:
+            frame = bytes.fromhex(response_hex.replace(" ", ""))
+            decoded = decode_frame(frame, command_name.replace('remote_', ''), escaped=True)
+        except (ValueError, FrameError):
+            return self._simulate_parsed_values(command_name, response_hex), None
+        crc_valid = decoded.pop("_frame")["crc_valid"]
+        return decoded, crc_valid
+    
     def _simulate_parsed_values(self, command_name: str, response_hex: str) -> Dict[str, Any]:
         """
         Simula valores parseados basados en el comando
@@ -230,23 +253,21 @@ class BatchCommandsTester:
         self.start_time = time.time()
         self.results = []
         
-        # Test Master Commands (15)
-        print("\n📡 Testing MASTER Commands:")
-        for command_name, hex_frame in DRS_MASTER_FRAMES.items():
-            print(f"  🔍 Testing: {command_name}")
-            result = self.test_single_command(command_name, "MASTER", hex_frame)
-            self.results.append(result)
-            status = "✅" if result.success else "❌"
-            print(f"    {status} {result.duration_ms:.1f}ms")
-        
-        # Test Remote Commands (13) 
-        print("\n📡 Testing REMOTE Commands:")
-        for command_name, hex_frame in DRS_REMOTE_FRAMES.items():
-            print(f"  🔍 Testing: {command_name}")
-            result = self.test_single_command(command_name, "REMOTE", hex_frame)
-            self.results.append(result)
-            status = "✅" if result.success else "❌"
-            print(f"    {status} {result.duration_ms:.1f}ms")
+        # Test Master Commands (15) y Remote Commands (13)
+        for command_type, frames in (("MASTER", DRS_MASTER_FRAMES), ("REMOTE", DRS_REMOTE_FRAMES)):
+            print(f"\n📡 Testing {command_type} Commands: {len(frames)}")
+            for command_name, hex_frame in frames.items():
+                result = self.test_single_command(command_name, command_type, hex_frame)
+                self.results.append(result)
+                tracer.event(
+                    "command_tested",
+                    level=logging.DEBUG if result.success else logging.WARNING,
+                    command=command_name,
+                    command_type=command_type,
+                    success=result.success,
+                    duration_ms=round(result.duration_ms, 1),
+                    error=result.error_message
+                )
         
         self.end_time = time.time()
         
@@ -471,16 +492,23 @@ class BatchCommandsTester:
         
         return html
 
-def main():
+def main(argv: List[str] = None):
     """
     Función principal para ejecutar el testing
     """
+    import argparse
+    parser = argparse.ArgumentParser(description="DRS Batch Commands Tester")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar el resultado de cada comando")
+    args = parser.parse_args(argv)
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO)
+    
     print("🚀 DRS Batch Commands Tester - Iniciando...")
     
     tester = BatchCommandsTester()
     
     # Ejecutar suite completa
     report = tester.run_full_test_suite()
+    shutdown_logging()
     
     # Mostrar resumen en consola
     print("\n" + "=" * 50)
@@ -11,34 +11,35 @@ Características:
 - Integración completa con SantoneDecoder
 - Decodificación profesional de respuestas Santone
 - Timeouts configurables por comando
+- Sesión TCP persistente por dispositivo en modo live (un handshake por batch)
 - Resultados detallados por comando individual
+- Resultados incrementales (``iter_batch_commands``) para streaming
+- Latencias y resultados por comando en las métricas Prometheus
+- Desglose por fases de cada comando live (``phases_ms``) exportable como spans
 - Mapeo automático comando->decodificador
 """
 
-import socket
 import time
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterator, List, Any, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
 # Import hex frames and decoder integration
-from .hex_frames import get_master_frame, get_remote_frame, validate_frame_format
 from .decoder_integration import (
     CommandDecoderMapping, 
     create_mock_decoder_response
 )
+from .santone_session import SantoneSession, SessionResponse, DRS_PORT
+from .mock_profiles import MockLatencyModel, DEFAULT_MOCK_PROFILE
+from .santone_codec import SantoneFrame, FrameError, BODY_OFFSET, parse_frame, decode_body, get_decoder
+from .metrics import BATCHES_IN_FLIGHT, observe_command_result
+from .spans import CommandTimeline, PHASE_CRC_CHECK, PHASE_DECODE, export_batch_spans
 
 from .hex_frames import (
-    DRS_MASTER_FRAMES, 
-    DRS_REMOTE_FRAMES,
-    DRS_SET_FRAMES,
     get_all_master_commands,
     get_all_remote_commands,
     get_all_set_commands,
-    get_master_frame,
-    get_remote_frame,
-    get_set_frame,
-    validate_frame_format
+    get_frame_bytes
 )
 
 class CommandType(Enum):
@@ -54,6 +55,12 @@ class ValidationResult(Enum):
     TIMEOUT = "TIMEOUT"
     ERROR = "ERROR"
 
+# Eventos de iter_batch_commands: un "result" por comando y un "summary" final
+BATCH_EVENT_RESULT = "result"
+BATCH_EVENT_SUMMARY = "summary"
+
+BatchEvent = Tuple[str, Any]
+
 @dataclass
 class CommandTestResult:
     """Resultado de un test individual de comando"""
@@ -64,8 +71,12 @@ class CommandTestResult:
     details: str = ""
     response_data: str = ""
     decoded_values: Dict[str, Any] = None
-    duration_ms: int = 0
+    duration_ms: float = 0
     error: str = ""
+    connect_ms: float = 0.0
+    request_ms: float = 0.0
+    phases_ms: Dict[str, float] = None
+    started_unix_ns: int = 0
 
 class BatchCommandsValidator:
     """
@@ -75,22 +86,25 @@ class BatchCommandsValidator:
     con soporte para modo mock (simulación) y live (conexión real).
     """
     
-    def __init__(self, timeout_per_command: int = 3):
+    def __init__(self, timeout_per_command: int = 3, device_port: int = DRS_PORT):
         """
         Inicializar el validador batch.
         
         Args:
             timeout_per_command: Timeout en segundos para cada comando individual
+            device_port: Puerto TCP Santone del dispositivo
         """
         self.timeout_per_command = timeout_per_command
         self.socket_timeout = timeout_per_command
+        self.device_port = device_port
         
     def validate_batch_commands(
         self, 
         ip_address: str,
         command_type: CommandType,
         mode: str = "mock",
-        selected_commands: List[str] = None
+        selected_commands: List[str] = None,
+        mock_profile: Union[str, MockLatencyModel] = DEFAULT_MOCK_PROFILE.value
     ) -> Dict[str, Any]:
         """
         Valida un batch de comandos DRS.
@@ -100,29 +114,97 @@ class BatchCommandsValidator:
             command_type: Tipo de comandos (MASTER o REMOTE)
             mode: Modo de validación ("mock" o "live")  
             selected_commands: Lista específica de comandos (None = todos)
+            mock_profile: Perfil de duraciones del modo mock ("fast" o
+                "realistic") o un MockLatencyModel ya configurado
             
         Returns:
             Diccionario con resultados de validación batch
+            
+        Raises:
+            ValueError: Si el perfil mock no existe
+        """
+        report = None
+        for event, payload in self.iter_batch_commands(ip_address, command_type, mode, selected_commands, mock_profile):
+            if event == BATCH_EVENT_SUMMARY:
+                report = payload
+        return report
+    
+    def iter_batch_commands(
+        self, 
+        ip_address: str,
+        command_type: CommandType,
+        mode: str = "mock",
+        selected_commands: List[str] = None,
+        mock_profile: Union[str, MockLatencyModel] = DEFAULT_MOCK_PROFILE.value
+    ) -> Iterator[BatchEvent]:
+        """
+        Valida un batch de comandos DRS entregando cada resultado en cuanto termina.
+        
+        Mismos argumentos que ``validate_batch_commands``.
+        
+        Yields:
+            (BATCH_EVENT_RESULT, CommandTestResult) por cada comando y, al
+            final, (BATCH_EVENT_SUMMARY, reporte) con el mismo diccionario que
+            devuelve ``validate_batch_commands``
+            
+        Raises:
+            ValueError: Si el perfil mock no existe
         """
         start_time = time.time()
         
         # Obtener lista de comandos a probar
-        if selected_commands:
-            commands = selected_commands
-        else:
-            commands = self._get_commands_for_type(command_type)
+        commands = self._get_commands_to_run(command_type, selected_commands)
+        results = []
         
         # Ejecutar tests según el modo
         if mode.lower() == "mock":
-            results = self._execute_mock_batch(commands, command_type)
-        else:
-            results = self._execute_live_batch(ip_address, commands, command_type)
+            latency_model = mock_profile if isinstance(mock_profile, MockLatencyModel) else MockLatencyModel(mock_profile)
+            with BATCHES_IN_FLIGHT.track_inprogress():
+                for result in self._iter_mock_results(commands, command_type, latency_model):
+                    results.append(result)
+                    observe_command_result(result, "mock")
+                    yield BATCH_EVENT_RESULT, result
+            # Tiempo virtual: la duración del batch es la suma de las simuladas
+            total_duration = sum(result.duration_ms for result in results)
+            report = self._build_batch_report(ip_address, command_type, mode, commands, results, total_duration)
+            report["mock_profile"] = latency_model.describe()
+            yield BATCH_EVENT_SUMMARY, report
+            return
         
-        # Calcular estadísticas
+        # Una única sesión TCP para todo el batch del dispositivo
+        with BATCHES_IN_FLIGHT.track_inprogress(), SantoneSession(ip_address, self.device_port, self.socket_timeout) as session:
+            for command in commands:
+                result = self._execute_single_live_command(session, command, command_type)
+                results.append(result)
+                observe_command_result(result, "live")
+                yield BATCH_EVENT_RESULT, result
+        
+        export_batch_spans(ip_address, command_type.value, mode, results)
         total_duration = int((time.time() - start_time) * 1000)
+        yield BATCH_EVENT_SUMMARY, self._build_batch_report(
+            ip_address, command_type, mode, commands, results, total_duration, session.get_stats()
+        )
+    
+    def _get_commands_to_run(self, command_type: CommandType, selected_commands: Optional[List[str]]) -> List[str]:
+        """Comandos seleccionados o, si no hay selección, todos los del tipo."""
+        if selected_commands:
+            return selected_commands
+        return self._get_commands_for_type(command_type)
+    
+    def _build_batch_report(
+        self,
+        ip_address: str,
+        command_type: CommandType,
+        mode: str,
+        commands: List[str],
+        results: List[CommandTestResult],
+        total_duration: int,
+        session_stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Construye el diccionario de resultados de un batch (sync o async)."""
         stats = self._calculate_batch_statistics(results)
         
-        return {
+        report = {
             "overall_status": self._determine_overall_status(results),
             "command_type": command_type.value,
             "mode": mode,
@@ -134,6 +216,9 @@ class BatchCommandsValidator:
             "duration_ms": total_duration,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
+        if session_stats is not None:
+            report["session"] = session_stats
+        return report
     
     def _get_commands_for_type(self, command_type: CommandType) -> List[str]:
         """Obtiene la lista de comandos para el tipo especificado."""
@@ -146,23 +231,15 @@ class BatchCommandsValidator:
         else:
             return []
     
-    def _execute_mock_batch(self, commands: List[str], command_type: CommandType) -> List[CommandTestResult]:
-        """
-        Ejecuta validación batch en modo mock (simulado).
-        
-        En modo mock, todos los comandos simulan respuestas exitosas
-        con datos realistas para propósitos de testing.
-        """
-        results = []
-        
+    def _iter_mock_results(
+        self,
+        commands: List[str],
+        command_type: CommandType,
+        latency_model: MockLatencyModel
+    ) -> Iterator[CommandTestResult]:
+        """Genera los resultados mock de uno en uno."""
         for command in commands:
-            start_time = time.time()
-            
-            # Simular duración realista (50-200ms)
-            import random
-            time.sleep(random.uniform(0.05, 0.2))
-            
-            duration = int((time.time() - start_time) * 1000)
+            duration = latency_model.duration_ms(command, command_type.value)
             
             # Generar respuesta mock realista
             mock_response = self._generate_mock_response(command)
@@ -179,264 +256,190 @@ class BatchCommandsValidator:
                 duration_ms=duration
             )
             
-            results.append(result)
-        
-        return results
+            yield result
     
-    def _execute_live_batch(self, ip_address: str, commands: List[str], command_type: CommandType) -> List[CommandTestResult]:
+    def _execute_single_live_command(self, session: SantoneSession, command: str, command_type: CommandType) -> CommandTestResult:
         """
-        Ejecuta validación batch en modo live (conexión real).
-        
-        Conecta al dispositivo DRS y ejecuta comandos reales usando
-        tramas hexadecimales del protocolo Santone.
+        Ejecuta un comando individual en modo live sobre la sesión del dispositivo.
         """
-        results = []
-        
-        for command in commands:
-            result = self._execute_single_live_command(ip_address, command, command_type)
-            results.append(result)
-            
-            # Pequeña pausa entre comandos para evitar saturar el dispositivo
-            time.sleep(0.1)
-        
-        return results
-    
-    def _execute_single_live_command(self, ip_address: str, command: str, command_type: CommandType) -> CommandTestResult:
-        """
-        Ejecuta un comando individual en modo live.
-        """
-        start_time = time.time()
+        timeline = CommandTimeline()
         
         try:
-            # Obtener trama hexadecimal para el comando
-            if command_type == CommandType.MASTER:
-                frame = get_master_frame(command)
-            elif command_type == CommandType.REMOTE:
-                frame = get_remote_frame(command)
-            elif command_type == CommandType.SET:
-                frame = get_set_frame(command)
-            else:
-                frame = ""
-            
-            if not frame:
-                return CommandTestResult(
-                    command=command,
-                    command_type=command_type,
-                    status=ValidationResult.ERROR,
-                    message=f"❌ No hex frame found for command: {command}",
-                    duration_ms=0,
-                    error="Frame not found"
-                )
-            
-            # Validar formato de trama
-            if not validate_frame_format(frame):
-                return CommandTestResult(
-                    command=command,
-                    command_type=command_type,
-                    status=ValidationResult.ERROR,
-                    message=f"❌ Invalid frame format for command: {command}",
-                    duration_ms=0,
-                    error="Invalid frame format"
-                )
+            frame_bytes, error_result = self._prepare_live_frame(command, command_type)
+            if error_result is not None:
+                return error_result
             
             # Ejecutar comando via TCP
-            response = self._send_command_via_tcp(ip_address, frame)
-            duration = int((time.time() - start_time) * 1000)
-            
-            if response is None:
-                return CommandTestResult(
-                    command=command,
-                    command_type=command_type,
-                    status=ValidationResult.TIMEOUT,
-                    message=f"⏱️ Timeout sending command: {command}",
-                    duration_ms=duration,
-                    error="TCP timeout"
-                )
-            
-            # Decodificar respuesta
-            decoded_values = self._decode_response(command, response)
+            session_response = session.request(frame_bytes, timeline)
             
-            return CommandTestResult(
-                command=command,
-                command_type=command_type,
-                status=ValidationResult.PASS,
-                message=f"✅ Command {command} executed successfully",
-                details=f"Received {len(response)} bytes response",
-                response_data=response.hex() if isinstance(response, (bytes, bytearray)) else str(response),
-                decoded_values=decoded_values,
-                duration_ms=duration
-            )
+            return self._build_live_result(command, command_type, session_response, timeline)
             
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            return CommandTestResult(
+            return self._build_error_result(command, command_type, e, timeline)
+    
+    def _prepare_live_frame(self, command: str, command_type: CommandType) -> Tuple[Optional[bytes], Optional[CommandTestResult]]:
+        """
+        Obtiene la trama a enviar para un comando.
+        
+        Las tramas del registro ya están codificadas y validadas al importar
+        hex_frames, así que aquí sólo se busca la trama.
+        
+        Returns:
+            (trama en bytes, None) si el comando existe, o
+            (None, CommandTestResult de error) si no hay trama
+        """
+        frame = get_frame_bytes(command, command_type.value)
+        
+        if frame is None:
+            return None, CommandTestResult(
                 command=command,
                 command_type=command_type,
                 status=ValidationResult.ERROR,
-                message=f"❌ Error executing command: {command}",
-                duration_ms=duration,
-                error=str(e)
+                message=f"❌ No hex frame found for command: {command}",
+                duration_ms=0,
+                error="Frame not found"
             )
+        
+        return frame, None
     
-    def _send_command_via_tcp(self, ip_address: str, hex_frame: str) -> Optional[bytes]:
+    def _build_live_result(
+        self,
+        command: str,
+        command_type: CommandType,
+        session_response: SessionResponse,
+        timeline: CommandTimeline
+    ) -> CommandTestResult:
         """
-        Envía un comando hexadecimal via TCP al dispositivo DRS.
+        Construye el resultado de un comando live a partir de la respuesta de la sesión.
         
-        Args:
-            ip_address: IP del dispositivo
-            hex_frame: Trama hexadecimal a enviar
-            
-        Returns:
-            Respuesta del dispositivo o None si hay timeout/error
+        El parseo/CRC y la decodificación se marcan en ``timeline`` y la
+        duración del comando se toma de ahí, así que incluye ambas fases.
         """
+        response = session_response.data
+        
+        if response is None and session_response.timed_out:
+            return self._finish_timing(CommandTestResult(
+                command=command,
+                command_type=command_type,
+                status=ValidationResult.TIMEOUT,
+                message=f"⏱️ Timeout sending command: {command}",
+                details=session_response.error,
+                error="TCP timeout",
+                connect_ms=round(session_response.connect_ms, 2),
+                request_ms=round(session_response.request_ms, 2)
+            ), timeline)
+        
+        # Conexión rechazada, socket caído o sólo respuestas de otros comandos
+        if response is None:
+            return self._finish_timing(CommandTestResult(
+                command=command,
+                command_type=command_type,
+                status=ValidationResult.ERROR,
+                message=f"❌ No response to command: {command}",
+                details=session_response.error,
+                error=session_response.error,
+                connect_ms=round(session_response.connect_ms, 2),
+                request_ms=round(session_response.request_ms, 2)
+            ), timeline)
+        
+        # Una trama mal formada o con CRC incorrecto no cuenta como respuesta válida
         try:
-            # Convertir trama hex a bytes
-            frame_bytes = bytes.fromhex(hex_frame)
-            print(f"DEBUG: Connecting to {ip_address}:65050 with frame {hex_frame}")
-            
-            # Crear socket TCP
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.socket_timeout)
-            
-            # Conectar al puerto DRS (65050)
-            sock.connect((ip_address, 65050))
-            print(f"DEBUG: Connected successfully")
-            
-            # Enviar comando
-            sock.send(frame_bytes)
-            print(f"DEBUG: Frame sent, waiting for response...")
-            
-            # Recibir respuesta
-            response = sock.recv(1024)  # Buffer de 1KB
-            print(f"DEBUG: Response received: {response.hex().upper()}")
-            
-            sock.close()
-            return response
-            
-        except socket.timeout:
-            print(f"DEBUG: Socket timeout after {self.socket_timeout}s")
-            return None
-        except Exception as e:
-            print(f"DEBUG: Exception during TCP send: {type(e).__name__}: {e}")
-            return None
+            frame = parse_frame(response)
+        except FrameError as e:
+            timeline.mark(PHASE_CRC_CHECK)
+            return self._finish_timing(CommandTestResult(
+                command=command,
+                command_type=command_type,
+                status=ValidationResult.FAIL,
+                message=f"❌ Malformed response to command: {command}",
+                details=f"Received {len(response)} bytes response",
+                response_data=response.hex(),
+                error=f"Malformed frame: {e}",
+                connect_ms=round(session_response.connect_ms, 2),
+                request_ms=round(session_response.request_ms, 2)
+            ), timeline)
+        timeline.mark(PHASE_CRC_CHECK)
+        
+        if not frame.crc_valid:
+            return self._finish_timing(CommandTestResult(
+                command=command,
+                command_type=command_type,
+                status=ValidationResult.FAIL,
+                message=f"❌ CRC mismatch in response to command: {command}",
+                details=f"Received {len(response)} bytes response",
+                response_data=response.hex(),
+                error="CRC mismatch",
+                connect_ms=round(session_response.connect_ms, 2),
+                request_ms=round(session_response.request_ms, 2)
+            ), timeline)
+        
+        # Decodificar respuesta
+        decoded_values = self._decode_frame(command, frame)
+        timeline.mark(PHASE_DECODE)
+        
+        return self._finish_timing(CommandTestResult(
+            command=command,
+            command_type=command_type,
+            status=ValidationResult.PASS,
+            message=f"✅ Command {command} executed successfully",
+            details=f"Received {len(response)} bytes response",
+            response_data=response.hex() if isinstance(response, (bytes, bytearray)) else str(response),
+            decoded_values=decoded_values,
+            connect_ms=round(session_response.connect_ms, 2),
+            request_ms=round(session_response.request_ms, 2)
+        ), timeline)
+    
+    def _build_error_result(self, command: str, command_type: CommandType, error: Exception, timeline: CommandTimeline) -> CommandTestResult:
+        """Construye el resultado de un comando que lanzó una excepción."""
+        return self._finish_timing(CommandTestResult(
+            command=command,
+            command_type=command_type,
+            status=ValidationResult.ERROR,
+            message=f"❌ Error executing command: {command}",
+            error=str(error)
+        ), timeline)
+    
+    def _finish_timing(self, result: CommandTestResult, timeline: CommandTimeline) -> CommandTestResult:
+        """Añade al resultado la duración total y el desglose por fases."""
+        result.duration_ms = round(timeline.elapsed_ms(), 2)
+        result.phases_ms = timeline.phases_ms()
+        result.started_unix_ns = timeline.start_unix_ns
+        return result
     
     def _decode_response(self, command: str, response: bytes) -> Dict[str, Any]:
         """
-        Decodifica la respuesta de un comando DRS usando integración SantoneDecoder.
+        Decodifica la respuesta de un comando DRS con el codec Santone.
         
         Args:
             command: Nombre del comando
-            response: Respuesta raw del dispositivo
+            response: Respuesta del dispositivo (trama completa sin escapes)
             
         Returns:
-            Valores decodificados usando decodificadores profesionales
+            Valores decodificados más metadatos en ``_decoder_info``
         """
         try:
-            # Check if we have a specific decoder mapping for this command
-            if CommandDecoderMapping.has_decoder(command):
-                decoder_method = CommandDecoderMapping.get_decoder_method(command)
-                command_value = CommandDecoderMapping.get_command_value(command)
-                
-                # Extract command body from Santone response frame
-                if len(response) >= 9:  # Minimum valid response
-                    command_body = bytearray(response[7:-3])  # Skip header and CRC/flags
-                    
-                    # Use enhanced mock decoder (will be replaced with actual SantoneDecoder)
-                    decoded = create_mock_decoder_response(command, command_body)
-                    
-                    # Add metadata about decoding process
-                    decoded["_decoder_info"] = {
-                        "method": decoder_method,
-                        "command_hex": f"0x{command_value:02x}",
-                        "frame_length": len(response),
-                        "body_length": len(command_body),
-                        "integration_phase": "enhanced_mock"
-                    }
-                    
-                    return decoded
-                else:
-                    return {"decode_error": "Response too short", "raw_response": response.hex()}
-            
-            # Fallback to basic decoding for unmapped commands
-            else:
-                # Use legacy decoding methods
-                if command == "device_id":
-                    return self._decode_device_id_response(response)
-                elif command == "temperature":
-                    return self._decode_temperature_response(response)
-                elif "power" in command:
-                    return self._decode_power_response(response)
-                elif "optical_port" in command:
-                    return self._decode_optical_port_response(response)
-                else:
-                    return {
-                        "raw_response": response.hex(), 
-                        "length": len(response),
-                        "_decoder_info": {"method": "legacy_fallback"}
-                    }
-                    
-        except Exception as e:
+            frame = parse_frame(response)
+        except FrameError as e:
             return {
-                "decode_error": str(e), 
+                "decode_error": str(e),
                 "raw_response": response.hex(),
                 "_decoder_info": {"method": "error_handler"}
             }
+        return self._decode_frame(command, frame)
     
-    def _decode_device_id_response(self, response: bytes) -> Dict[str, Any]:
-        """Decodifica respuesta de device_id"""
-        if len(response) >= 9:  # Mínimo para respuesta válida
-            # Extraer datos del command body (después del header)
-            data = bytearray(response[7:-3])  # Skip header y CRC/flags
-            if len(data) >= 2:
-                device_id = int(data[1] << 8 | data[0])
-                return {"device_id": device_id, "status": "decoded"}
-        return {"device_id": None, "status": "decode_failed"}
-    
-    def _decode_temperature_response(self, response: bytes) -> Dict[str, Any]:
-        """Decodifica respuesta de temperature"""
-        if len(response) >= 9:
-            data = bytearray(response[7:-3])
-            if len(data) >= 2:
-                # Temperatura en formato signed 16-bit
-                temp_raw = data[0] | (data[1] << 8)
-                if temp_raw & 0x8000:
-                    temp_raw = -(temp_raw & 0x7FFF)
-                temperature = temp_raw / 256.0  # Factor de conversión típico
-                return {"temperature_celsius": round(temperature, 2), "status": "decoded"}
-        return {"temperature_celsius": None, "status": "decode_failed"}
-    
-    def _decode_power_response(self, response: bytes) -> Dict[str, Any]:
-        """Decodifica respuesta de power commands"""
-        if len(response) >= 9:
-            data = bytearray(response[7:-3])
-            if len(data) >= 4:  # Input y output power
-                input_power = self._convert_power_value(data[0:2])
-                output_power = self._convert_power_value(data[2:4])
-                return {
-                    "input_power_dbm": input_power,
-                    "output_power_dbm": output_power,
-                    "status": "decoded"
-                }
-        return {"input_power_dbm": None, "output_power_dbm": None, "status": "decode_failed"}
-    
-    def _decode_optical_port_response(self, response: bytes) -> Dict[str, Any]:
-        """Decodifica respuesta de optical port commands"""  
-        if len(response) >= 9:
-            data = bytearray(response[7:-3])
-            return {
-                "port_data": data.hex(),
-                "data_length": len(data),
-                "status": "decoded"
-            }
-        return {"port_data": None, "status": "decode_failed"}
-    
-    def _convert_power_value(self, data: bytearray) -> float:
-        """Convierte valor de potencia de bytes a dBm"""
-        if len(data) < 2:
-            return 0.0
-        value = data[0] | (data[1] << 8)
-        value = -(value & 0x8000) | (value & 0x7fff)
-        return round(value / 256, 2)
+    def _decode_frame(self, command: str, frame: SantoneFrame) -> Dict[str, Any]:
+        """Decodifica una trama ya parseada (el decoder se elige por COMMAND_NUMBER)."""
+        decoder = get_decoder(frame.command)
+        decoded = decode_body(frame.command, frame.body, command)
+        decoded["_decoder_info"] = {
+            "method": decoder.__name__ if decoder is not None else "_decode_generic",
+            "command_hex": frame.command_hex,
+            "frame_length": BODY_OFFSET + frame.length + 3,
+            "body_length": frame.length,
+            "crc_valid": frame.crc_valid,
+            "integration_phase": "santone_codec"
+        }
+        return decoded
     
     def _generate_mock_response(self, command: str) -> str:
         """Genera respuesta mock realista para un comando"""
@@ -502,6 +505,8 @@ class BatchCommandsValidator:
         errors = len([r for r in results if r.status == ValidationResult.ERROR])
         
         avg_duration = sum(r.duration_ms for r in results) / total if total > 0 else 0
+        avg_connect = sum(r.connect_ms for r in results) / total if total > 0 else 0
+        avg_request = sum(r.request_ms for r in results) / total if total > 0 else 0
         
         return {
             "total_commands": total,
@@ -510,7 +515,9 @@ class BatchCommandsValidator:
             "timeouts": timeouts,
             "errors": errors,
             "success_rate": round(passed / total * 100, 1) if total > 0 else 0,
-            "average_duration_ms": round(avg_duration, 1)
+            "average_duration_ms": round(avg_duration, 1),
+            "average_connect_ms": round(avg_connect, 2),
+            "average_request_ms": round(avg_request, 2)
         }
     
     def _determine_overall_status(self, results: List[CommandTestResult]) -> str:
@@ -531,7 +538,8 @@ def validate_drs_commands(
     command_type: str = "master", 
     mode: str = "mock",
     timeout: int = 3,
-    selected_commands: List[str] = None
+    selected_commands: List[str] = None,
+    mock_profile: str = DEFAULT_MOCK_PROFILE.value
 ) -> Dict[str, Any]:
     """
     Función de conveniencia para validar comandos DRS.
@@ -542,6 +550,7 @@ def validate_drs_commands(
         mode: "mock" o "live"
         timeout: Timeout por comando en segundos
         selected_commands: Lista específica de comandos (opcional)
+        mock_profile: "fast" o "realistic" (sólo modo mock)
         
     Returns:
         Resultados de validación batch
@@ -553,4 +562,4 @@ def validate_drs_commands(
     }
     cmd_type = cmd_type_map.get(command_type.lower(), CommandType.MASTER)
     validator = BatchCommandsValidator(timeout_per_command=timeout)
-    return validator.validate_batch_commands(ip_address, cmd_type, mode, selected_commands)
\ No newline at end of file
+    return validator.validate_batch_commands(ip_address, cmd_type, mode, selected_commands, mock_profile)
\ No newline at end of file
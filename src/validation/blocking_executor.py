@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Blocking Executor - Trabajo bloqueante fuera del event loop
+
+Los validadores síncronos (``validate_device``, pings por subprocess,
+lectura del historial en disco) bloquean el hilo donde se ejecutan. Si se
+llaman desde un handler ``async def`` congelan el event loop: un ping a un
+equipo apagado detiene todas las peticiones, ``/health`` incluido, hasta
+que vence su timeout.
+
+``BlockingExecutor`` ejecuta esas funciones en un pool de hilos propio y
+acotado:
+- Como mucho ``max_workers`` llamadas en curso; el resto espera en el loop
+  (sin ocupar hilos) hasta ``max_queued`` llamadas en espera
+- Con la espera llena rechaza con ``ExecutorSaturatedError`` en lugar de
+  acumular trabajo sin límite
+- Métricas de profundidad de cola, llamadas activas y tiempos de espera
+
+Se usa un pool por tipo de trabajo (validación, disco) para que una
+ráfaga de validaciones no deje sin hilos a la lectura del historial.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .metrics import EXECUTOR_REJECTED
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_QUEUED = 100
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """El executor tiene la cola de espera llena"""
+
+
+class BlockingExecutor:
+    """
+    Pool de hilos acotado con métricas para llamadas bloqueantes.
+
+    Uso::
+
+        validation = BlockingExecutor("validation", max_workers=8)
+        result = await validation.run(validate_device, config)
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_MAX_WORKERS, max_queued: int = DEFAULT_MAX_QUEUED):
+        """
+        Args:
+            name: Nombre del pool (aparece en métricas y en el nombre de los hilos)
+            max_workers: Llamadas ejecutándose a la vez
+            max_queued: Llamadas esperando turno como máximo (0 = sin límite)
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max_queued
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Métricas
+        self.queued = 0
+        self.active = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self.total_wait_ms = 0.0
+        self.total_run_ms = 0.0
+        # Serie a 0 desde el arranque para que rate() vea el primer rechazo
+        EXECUTOR_REJECTED.labels(name).inc(0)
+
+    def _ensure_started(self) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{self.name}-exec")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Ejecuta ``func(*args, **kwargs)`` en el pool y espera su resultado.
+
+        Raises:
+            ExecutorSaturatedError: Si ya hay ``max_queued`` llamadas esperando
+            Exception: La que lance ``func``
+        """
+        self._ensure_started()
+        if self.max_queued and self.queued >= self.max_queued:
+            self.rejected += 1
+            EXECUTOR_REJECTED.labels(self.name).inc()
+            raise ExecutorSaturatedError(f"Executor '{self.name}' saturated ({self.queued} calls waiting)")
+
+        self.submitted += 1
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        enqueued = time.perf_counter()
+
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        self.total_wait_ms += (started - enqueued) * 1000
+        self.active += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.active -= 1
+            self.total_run_ms += (time.perf_counter() - started) * 1000
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidad de cola y contadores del pool."""
+        finished = self.completed + self.failed
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+            "queued": self.queued,
+            "active": self.active,
+            "peak_queued": self.peak_queued,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "average_wait_ms": round(self.total_wait_ms / self.submitted, 2) if self.submitted else 0,
+            "average_run_ms": round(self.total_run_ms / finished, 2) if finished else 0,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Libera los hilos del pool (las llamadas en curso terminan si ``wait``)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+        self._slots = None
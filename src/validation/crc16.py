@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+CRC16/XMODEM para tramas Santone
+
+El protocolo Santone protege cada trama con un CRC-16-CCITT (polinomio
+0x1021, valor inicial 0x0000, variante XMODEM) calculado sobre todos los
+bytes entre los flags 7E, excluyendo el propio CRC. El CRC viaja en
+little-endian (byte bajo primero) y cada uno de sus bytes se escapa
+(5E -> 5E 5D, 7E -> 5E 7D).
+
+El cálculo usa ``binascii.crc_hqx`` de la librería estándar, que es
+exactamente esta variante implementada en C con tabla de 256 entradas y
+acepta ``bytes``, ``bytearray`` y ``memoryview`` sin copiarlos. El escape
+de cada byte del CRC también se resuelve con una tabla precalculada.
+"""
+
+import binascii
+from typing import Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+FRAME_FLAG = 0x7E
+ESCAPE_BYTE = 0x5E
+
+# Secuencia escapada para cada valor de byte (la mayoría se representan a sí mismos)
+ESCAPED_BYTES: Tuple[bytes, ...] = tuple(
+    bytes([ESCAPE_BYTE, 0x7D]) if value == FRAME_FLAG
+    else bytes([ESCAPE_BYTE, 0x5D]) if value == ESCAPE_BYTE
+    else bytes([value])
+    for value in range(256)
+)
+
+
+def crc16_xmodem(data: BytesLike, crc: int = 0) -> int:
+    """
+    Calcula CRC16/XMODEM.
+
+    Args:
+        data: Bytes sobre los que calcular el CRC
+        crc: Valor inicial (permite cálculo incremental por bloques)
+
+    Returns:
+        CRC de 16 bits como entero
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def escape_crc(crc: int) -> bytes:
+    """
+    Serializa el CRC como lo envía el dispositivo: little-endian y escapado.
+
+    Args:
+        crc: CRC de 16 bits
+
+    Returns:
+        2 a 4 bytes listos para insertar antes del flag de fin
+    """
+    return ESCAPED_BYTES[crc & 0xFF] + ESCAPED_BYTES[crc >> 8]
+
+
+def frame_crc(frame: BytesLike) -> int:
+    """
+    Extrae el CRC de una trama ya sin escapes (7E ... CRC_L CRC_H 7E).
+    """
+    return frame[-3] | (frame[-2] << 8)
+
+
+def verify_frame_crc(frame: BytesLike) -> bool:
+    """
+    Verifica el CRC de una trama entrante.
+
+    La trama debe llegar sin escapes (como la entrega SantoneFrameReader) e
+    incluir los flags de inicio y fin.
+
+    Args:
+        frame: Trama completa 7E ... 7E
+
+    Returns:
+        True si el CRC recibido coincide con el calculado
+    """
+    if len(frame) < 5:
+        return False
+    return binascii.crc_hqx(frame[1:-3], 0) == (frame[-3] | (frame[-2] << 8))
+
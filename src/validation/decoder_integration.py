@@ -8,6 +8,8 @@ decoder functions in SantoneDecoder, ensuring proper response parsing.
 from typing import Dict, Callable, Any
 from enum import IntEnum
 
+from .santone_codec import decode_body
+
 # Import path mappings - these will be updated when integrating with main codebase
 # For now, we'll create interfaces that match the expected signatures
 
@@ -105,43 +107,10 @@ class MockCommandType(IntEnum):
 
 def create_mock_decoder_response(command_name: str, raw_data: bytes) -> Dict[str, Any]:
     """
-    Create mock decoder response for testing integration.
-    This will be replaced with actual SantoneDecoder calls.
+    Decodifica el cuerpo de una respuesta con el codec Santone.
+
+    Se mantiene con este nombre por compatibilidad; la lógica de
+    decodificación vive en santone_codec.decode_body.
     """
-    if command_name == "device_id":
-        # Mock device ID decoding (16-bit little endian)
-        if len(raw_data) >= 2:
-            device_id = int(raw_data[1] << 8 | raw_data[0])
-            return {"device_id": device_id}
-    
-    elif command_name == "temperature":
-        # Mock temperature decoding (signed 16-bit, scale 0.1)
-        if len(raw_data) >= 2:
-            value = raw_data[0] | (raw_data[1] << 8)
-            if value & 0x8000:
-                value = -(value & 0x7fff)
-            temperature = round(value * 0.1, 2)
-            return {"temperature": temperature}
-    
-    elif "optical_port_devices_connected" in command_name:
-        # Mock device count
-        if len(raw_data) >= 1:
-            return {command_name: raw_data[0]}
-    
-    elif command_name == "central_frequency_point":
-        # Mock frequency point (32-bit little endian, scale 0.0001)
-        if len(raw_data) >= 4:
-            value = int.from_bytes(raw_data[:4], byteorder='little')
-            frequency = str(value / 10000)
-            return {"central_frequency_point": frequency}
-    
-    elif "power" in command_name:
-        # Mock power decoding (signed 16-bit, scale 1/256 dBm)
-        if len(raw_data) >= 2:
-            value = raw_data[0] | (raw_data[1] << 8)
-            value = -(value & 0x8000) | (value & 0x7fff)
-            power = round(value / 256, 2)
-            return {command_name.replace("_", "_"): power}
-    
-    # Generic fallback
-    return {command_name: f"raw_hex_{raw_data.hex() if raw_data else '00'}"}
\ No newline at end of file
+    command_value = CommandDecoderMapping.get_command_value(command_name)
+    return decode_body(command_value, bytes(raw_data), command_name)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Device Discovery - Descubrimiento concurrente de dispositivos DRS en una subred
+
+Recorre un rango CIDR con connects TCP asyncio al puerto Santone (65050)
+dentro de una ventana de concurrencia configurable. A cada equipo que
+acepta la conexión se le consulta por la misma sesión:
+
+- ``device_id`` (0x97): si no responde, el puerto está abierto pero no habla
+  Santone y el equipo queda como ``unknown``
+- ``optical_port_devices_connected_1..4`` (0xF8-0xFB): dispositivos
+  colgando de cada puerto óptico
+
+Clasificación: la DMU expone cuatro puertos ópticos y la DRU sólo dos (el
+juego de comandos Remote sólo incluye los puertos 1 y 2), así que un equipo
+que responde a los puertos 3 o 4 es una DMU; si responde a ``device_id``
+pero no a los puertos 3-4, una DRU. Tener dispositivos en los puertos 1-2
+no decide nada: una DRU en cascada también tiene remotas colgando.
+
+Los hosts que no escuchan cuestan un RST o, como mucho, el timeout de
+conexión, y todos se sondean en paralelo: un /24 se recorre en uno o dos
+segundos en lugar de los minutos de un bucle secuencial.
+"""
+
+import asyncio
+import ipaddress
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .async_batch_engine import AsyncSantoneSession
+from .hex_frames import MASTER_FRAME_BYTES
+from .santone_codec import FrameError, decode_body, parse_frame
+from .santone_session import DRS_PORT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT = 0.5
+DEFAULT_COMMAND_TIMEOUT = 1.0
+DEFAULT_MAX_CONCURRENT_HOSTS = 256
+MAX_DISCOVERY_HOSTS = 4096  # /20
+
+OPTICAL_PORT_COMMANDS = [f"optical_port_devices_connected_{port}" for port in range(1, 5)]
+DMU_ONLY_PORTS = (3, 4)
+
+
+class DeviceKind:
+    """Clasificación de un equipo descubierto"""
+    DMU = "dmu"
+    DRU = "dru"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class DiscoveredDevice:
+    """Equipo que aceptó la conexión en el puerto Santone"""
+    ip_address: str
+    port: int
+    device_type: str = DeviceKind.UNKNOWN
+    connect_ms: float = 0.0
+    device_id: Optional[int] = None
+    optical_ports: Dict[int, int] = field(default_factory=dict)  # puerto -> dispositivos conectados
+    error: str = ""
+
+
+def classify_device(device_id: Optional[int], optical_ports: Dict[int, int]) -> str:
+    """DMU / DRU / unknown según las respuestas a device_id y a los puertos ópticos 3-4 (sólo Master)."""
+    if device_id is None:
+        return DeviceKind.UNKNOWN
+    if any(port in optical_ports for port in DMU_ONLY_PORTS):
+        return DeviceKind.DMU
+    return DeviceKind.DRU
+
+
+def expand_cidr(cidr: str, max_hosts: int = MAX_DISCOVERY_HOSTS) -> List[str]:
+    """
+    IPs de host de un rango CIDR (una IP suelta cuenta como /32).
+
+    Raises:
+        ValueError: Si el rango no es válido o supera ``max_hosts``
+    """
+    network = ipaddress.ip_network(cidr, strict=False)
+    if network.num_addresses > max_hosts + 2:
+        raise ValueError(f"Range {cidr} has {network.num_addresses} addresses (max {max_hosts})")
+    hosts = [str(host) for host in network.hosts()]
+    return hosts or [str(network.network_address)]
+
+
+class DiscoveryEngine:
+    """
+    Escáner asyncio de subredes DRS.
+
+    Uso::
+
+        engine = DiscoveryEngine(max_concurrent=256)
+        report = await engine.discover("192.168.11.0/24")
+    """
+
+    def __init__(
+        self,
+        port: int = DRS_PORT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_HOSTS
+    ):
+        """
+        Args:
+            port: Puerto Santone a sondear
+            connect_timeout: Segundos de espera del connect por host
+            command_timeout: Segundos de espera por respuesta de cada consulta
+            max_concurrent: Hosts sondeándose a la vez (ventana de concurrencia)
+        """
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
+        self.max_concurrent = max(1, max_concurrent)
+
+    async def discover(self, cidr: str) -> Dict[str, Any]:
+        """
+        Recorre un rango y clasifica los equipos que responden.
+
+        Returns:
+            Reporte con los dispositivos encontrados y estadísticas del barrido
+
+        Raises:
+            ValueError: Si el rango no es válido o es demasiado grande
+        """
+        hosts = expand_cidr(cidr)
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(ip_address: str) -> Optional[DiscoveredDevice]:
+            async with semaphore:
+                return await self.probe_host(ip_address)
+
+        found = await asyncio.gather(*(bounded(host) for host in hosts))
+        devices = [device for device in found if device is not None]
+        total_duration = int((time.time() - start_time) * 1000)
+
+        counts = {kind: 0 for kind in (DeviceKind.DMU, DeviceKind.DRU, DeviceKind.UNKNOWN)}
+        for device in devices:
+            counts[device.device_type] += 1
+
+        return {
+            "cidr": cidr,
+            "port": self.port,
+            "hosts_scanned": len(hosts),
+            "devices_found": len(devices),
+            "devices": [asdict(device) for device in devices],
+            "statistics": {
+                **counts,
+                "max_concurrent": self.max_concurrent,
+                "connect_timeout_ms": int(self.connect_timeout * 1000),
+            },
+            "duration_ms": total_duration,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    async def probe_host(self, ip_address: str) -> Optional[DiscoveredDevice]:
+        """Conecta y consulta un host; None si no acepta la conexión."""
+        session = AsyncSantoneSession(ip_address, self.port, timeout=self.connect_timeout, max_retries=0)
+        try:
+            connect_ms = await session.connect()
+        except (asyncio.TimeoutError, OSError):
+            return None
+
+        device = DiscoveredDevice(ip_address, self.port, connect_ms=round(connect_ms, 2))
+        session.timeout = self.command_timeout
+        try:
+            identity = await self._query(session, "device_id")
+            if identity is not None:
+                device.device_id = identity.get("device_id")
+                for port, command in enumerate(OPTICAL_PORT_COMMANDS, start=1):
+                    value = await self._query(session, command)
+                    if value is not None and isinstance(value.get(command), int):
+                        device.optical_ports[port] = value[command]
+            else:
+                device.error = "No Santone response to device_id"
+        except Exception as e:
+            device.error = str(e)
+        finally:
+            await session.close()
+
+        device.device_type = classify_device(device.device_id, device.optical_ports)
+        logger.debug("Discovered %s as %s", ip_address, device.device_type)
+        return device
+
+    async def _query(self, session: AsyncSantoneSession, command: str) -> Optional[Dict[str, Any]]:
+        """Valores decodificados de un comando, o None si no hay respuesta útil."""
+        response = await session.request(MASTER_FRAME_BYTES[command])
+        if response.data is None:
+            return None
+        try:
+            frame = parse_frame(response.data)
+        except FrameError:
+            return None
+        # Un ACK con cuerpo vacío no aporta datos del comando
+        if not frame.crc_valid or frame.length == 0:
+            return None
+        return decode_body(frame.command, frame.body, command)
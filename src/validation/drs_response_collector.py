@@ -3,21 +3,37 @@
 DRS Response Collector - Capturador de Respuestas Reales
 Ejecuta las 28 tramas DRS contra dispositivo real y guarda respuestas
 para usar como mock data en el testing suite
+
+Captura de muchos dispositivos a la vez:
+- Una sesión TCP por dispositivo para todas sus tramas, sin pausas fijas
+  (cada comando espera su respuesta antes de enviar el siguiente)
+- Varios dispositivos en paralelo, limitados por ``max_concurrent_devices``
+- Cada respuesta se añade al fichero de captura JSONL en cuanto llega
+- Reanudable: los comandos ya capturados en el fichero no se repiten
 """
 
 import sys
 import json
+import asyncio
+import logging
 import time
 import socket
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 
 # Add project paths
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src" / "plugins"))
 sys.path.insert(0, str(project_root))
 
+from validation.frame_reader import SantoneFrameReader
+from validation.async_batch_engine import AsyncSantoneSession
+from validation.santone_session import DRS_PORT
+from validation.tracing import configure_logging, get_tracer, shutdown_logging
+
+tracer = get_tracer(__name__)
+
 try:
     from validation.hex_frames import DRS_MASTER_FRAMES, DRS_REMOTE_FRAMES
     FRAMES_AVAILABLE = True
@@ -26,6 +42,60 @@ except ImportError as e:
     print(f"❌ Could not load hex frames: {e}")
     FRAMES_AVAILABLE = False
 
+# Dispositivos capturados en paralelo por defecto
+DEFAULT_MAX_CONCURRENT_DEVICES = 32
+
+
+class CaptureLog:
+    """
+    Fichero JSONL de captura: una línea por comando enviado.
+
+    Cada línea se escribe y se vuelca en cuanto llega la respuesta, así
+    que una captura interrumpida conserva todo lo recibido hasta entonces.
+    """
+    
+    def __init__(self, path: Union[str, Path], restart: bool = False):
+        """
+        Args:
+            path: Fichero de captura (se crea si no existe)
+            restart: Descartar la captura anterior en lugar de reanudarla
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if restart and self.path.exists():
+            self.path.unlink()
+        self._file = None
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Líneas ya escritas (se ignora una última línea cortada por una interrupción)."""
+        if not self.path.exists():
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+    
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a+", encoding="utf-8")
+            # Línea cortada por una interrupción: la nueva empieza en su propia línea
+            if self._file.tell() > 0:
+                self._file.seek(self._file.tell() - 1)
+                if self._file.read(1) != "\n":
+                    self._file.write("\n")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class DRSResponseCollector:
     """
     Colector de respuestas reales de dispositivos DRS
@@ -36,16 +106,19 @@ class DRSResponseCollector:
     - Guarda respuestas para uso como mock data
     - Maneja timeouts y errores de conexión
     - Genera archivo de configuración para mockup
+    - Una sola conexión para todas las tramas del dispositivo (``capture``)
     """
     
-    def __init__(self, target_host: str = "192.168.11.22", target_port: int = 65050):
+    def __init__(self, target_host: str = "192.168.11.22", target_port: int = DRS_PORT, timeout: float = 5.0):
         self.target_host = target_host
         self.target_port = target_port
-        self.timeout = 5.0  # 5 segundos timeout
+        self.timeout = timeout
         self.responses: Dict[str, Dict[str, Any]] = {}
         self.connection_attempts = 0
         self.successful_commands = 0
         self.failed_commands = 0
+        # Lector de tramas reutilizado entre comandos (buffer preasignado)
+        self.frame_reader = SantoneFrameReader()
         
     def hex_string_to_bytes(self, hex_string: str) -> bytes:
         """
@@ -79,8 +152,6 @@ class DRSResponseCollector:
             # Convertir frame a bytes
             frame_bytes = self.hex_string_to_bytes(hex_frame)
             
-            print(f"  📤 Enviando: {self.bytes_to_hex_string(frame_bytes)}")
-            
             # Crear socket TCP
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.settimeout(self.timeout)
@@ -91,72 +162,121 @@ class DRSResponseCollector:
                 
                 # Enviar comando
                 sock.send(frame_bytes)
+                tracer.event("frame_tx", device=self.target_host, command=command_name, frame=frame_bytes)
                 
-                # Esperar respuesta
-                response_data = sock.recv(1024)  # Buffer de 1KB
+                # Esperar una trama completa (puede llegar en varios segmentos)
+                self.frame_reader.reset()
+                try:
+                    response_data = self.frame_reader.read_frame(sock)
+                except ConnectionResetError:
+                    response_data = b""
                 
                 if response_data:
-                    response_hex = self.bytes_to_hex_string(response_data)
-                    print(f"  📥 Respuesta: {response_hex}")
+                    tracer.event("frame_rx", device=self.target_host, command=command_name, frame=response_data)
                     self.successful_commands += 1
-                    return True, response_hex, ""
+                    return True, self.bytes_to_hex_string(response_data), ""
                 else:
                     error_msg = "No response received"
-                    print(f"  ❌ {error_msg}")
-                    self.failed_commands += 1
-                    return False, "", error_msg
                     
         except socket.timeout:
             error_msg = f"Timeout after {self.timeout}s"
-            print(f"  ⏱️ {error_msg}")
-            self.failed_commands += 1
-            return False, "", error_msg
             
         except socket.error as e:
             error_msg = f"Socket error: {str(e)}"
-            print(f"  🔌 {error_msg}")
-            self.failed_commands += 1
-            return False, "", error_msg
             
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            print(f"  💥 {error_msg}")
-            self.failed_commands += 1
-            return False, "", error_msg
+        
+        tracer.event("command_failed", level=logging.WARNING, device=self.target_host, command=command_name, error=error_msg)
+        self.failed_commands += 1
+        return False, "", error_msg
+    
+    def _frame_sets(self) -> List[Tuple[str, Dict[str, str]]]:
+        return [("MASTER", DRS_MASTER_FRAMES), ("REMOTE", DRS_REMOTE_FRAMES)]
+    
+    def _record(self, command_type: str, command_name: str, hex_frame: str, success: bool,
+                response_hex: str, error_msg: str, request_ms: float = 0.0) -> Dict[str, Any]:
+        """Guarda el resultado de un comando en ``responses`` y lo devuelve."""
+        record = {
+            "command_type": command_type,
+            "hex_frame_sent": hex_frame,
+            "success": success,
+            "response_hex": response_hex if success else "",
+            "error_message": error_msg if not success else "",
+            "timestamp": datetime.now().isoformat(),
+            "target_device": f"{self.target_host}:{self.target_port}",
+            "request_ms": round(request_ms, 2)
+        }
+        self.responses[command_name] = record
+        return record
     
-    def collect_responses_for_command_set(self, frames_dict: Dict[str, str], command_type: str) -> None:
+    def load_capture(self, log: CaptureLog) -> Set[Tuple[str, str]]:
         """
-        Colecta respuestas para un set de comandos (MASTER o REMOTE)
+        Recupera de una captura anterior las respuestas de este dispositivo.
+        
+        Returns:
+            (command_type, command) ya capturados con éxito, que no hay que repetir
         """
-        print(f"\n📡 Colectando respuestas {command_type}:")
-        print(f"Target: {self.target_host}:{self.target_port}")
-        print("=" * 50)
+        done = set()
+        target_device = f"{self.target_host}:{self.target_port}"
+        for record in log.records():
+            if record.get("target_device") != target_device or not record.get("success"):
+                continue
+            command = record["command"]
+            self.responses[command] = {key: value for key, value in record.items() if key not in ("command", "target_host")}
+            self.successful_commands += 1
+            done.add((record["command_type"], command))
+        return done
+    
+    async def capture(self, log: Optional[CaptureLog] = None) -> None:
+        """
+        Captura todas las tramas MASTER y REMOTE por una única sesión TCP.
         
-        for command_name, hex_frame in frames_dict.items():
-            print(f"🔍 Comando: {command_name}")
-            
-            # Pequeña pausa entre comandos
-            time.sleep(0.5)
-            
-            # Enviar comando y capturar respuesta
-            success, response_hex, error_msg = self.send_drs_command(hex_frame, command_name)
-            
-            # Guardar resultado
-            self.responses[command_name] = {
-                "command_type": command_type,
-                "hex_frame_sent": hex_frame,
-                "success": success,
-                "response_hex": response_hex if success else "",
-                "error_message": error_msg if not success else "",
-                "timestamp": datetime.now().isoformat(),
-                "target_device": f"{self.target_host}:{self.target_port}"
-            }
+        Con ``log`` cada respuesta se escribe en cuanto llega y se saltan
+        los comandos que ya estaban capturados en el fichero.
+        """
+        done = self.load_capture(log) if log is not None else set()
+        
+        connect_error = ""
+        
+        async with AsyncSantoneSession(self.target_host, self.target_port, self.timeout, max_retries=1) as session:
+            for command_type, frames in self._frame_sets():
+                for command_name, hex_frame in frames.items():
+                    if (command_type, command_name) in done:
+                        continue
+                    
+                    if connect_error:
+                        # El dispositivo no acepta conexiones: no se espera otro timeout por comando
+                        response, error_msg, request_ms = None, connect_error, 0.0
+                    else:
+                        result = await session.request(self.hex_string_to_bytes(hex_frame))
+                        response, error_msg, request_ms = result.data, result.error, result.request_ms
+                        if response is None and session.connections == 0:
+                            connect_error = error_msg
+                    
+                    if response is not None:
+                        tracer.event("frame_rx", device=self.target_host, command=command_name, frame=response)
+                        self.successful_commands += 1
+                        record = self._record(command_type, command_name, hex_frame, True,
+                                              self.bytes_to_hex_string(response), "", request_ms)
+                    else:
+                        tracer.event("command_failed", level=logging.WARNING, device=self.target_host,
+                                     command=command_name, error=error_msg)
+                        self.failed_commands += 1
+                        record = self._record(command_type, command_name, hex_frame, False, "", error_msg, request_ms)
+                    
+                    if log is not None:
+                        log.append({"target_host": self.target_host, "command": command_name, **record})
             
-            print()  # Línea en blanco para legibilidad
+            self.connection_attempts += session.connections
     
-    def collect_all_responses(self) -> Dict[str, Any]:
+    def collect_all_responses(self, capture_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """
         Colecta respuestas de todos los comandos DRS disponibles
+        
+        Args:
+            capture_path: Fichero JSONL para guardar cada respuesta al
+                llegar y reanudar una captura interrumpida
         """
         print("🚀 DRS Response Collector - Iniciando captura...")
         print(f"🎯 Target Device: {self.target_host}:{self.target_port}")
@@ -166,20 +286,17 @@ class DRSResponseCollector:
             return self._create_error_report("Hex frames not available")
         
         start_time = time.time()
+        log = CaptureLog(capture_path) if capture_path else None
         
         try:
-            # Colectar respuestas MASTER
-            if DRS_MASTER_FRAMES:
-                self.collect_responses_for_command_set(DRS_MASTER_FRAMES, "MASTER")
-            
-            # Colectar respuestas REMOTE  
-            if DRS_REMOTE_FRAMES:
-                self.collect_responses_for_command_set(DRS_REMOTE_FRAMES, "REMOTE")
-                
+            asyncio.run(self.capture(log))
         except KeyboardInterrupt:
             print("\n⚠️ Captura interrumpida por usuario")
         except Exception as e:
             print(f"\n💥 Error durante captura: {str(e)}")
+        finally:
+            if log is not None:
+                log.close()
         
         end_time = time.time()
         
@@ -312,56 +429,119 @@ def get_all_responses() -> dict:
         
         return filename
 
-def main():
+async def collect_fleet(
+    hosts: List[str],
+    capture_path: Union[str, Path],
+    port: int = DRS_PORT,
+    timeout: float = 3.0,
+    max_concurrent_devices: int = DEFAULT_MAX_CONCURRENT_DEVICES,
+    restart: bool = False
+) -> Dict[str, DRSResponseCollector]:
+    """
+    Captura las respuestas de varios dispositivos en paralelo.
+    
+    Todos escriben en el mismo fichero de captura; volver a ejecutar con
+    el mismo fichero sólo consulta los comandos que faltan o fallaron.
+    
+    Returns:
+        Colector de cada host (``responses`` incluye lo recuperado de la captura anterior)
+    """
+    log = CaptureLog(capture_path, restart=restart)
+    semaphore = asyncio.Semaphore(max(1, max_concurrent_devices))
+    collectors = {host: DRSResponseCollector(host, port, timeout) for host in hosts}
+    
+    async def run_device(collector: DRSResponseCollector) -> None:
+        async with semaphore:
+            await collector.capture(log)
+    
+    try:
+        await asyncio.gather(*(run_device(collector) for collector in collectors.values()))
+    finally:
+        log.close()
+    return collectors
+
+
+def _read_hosts(args) -> List[str]:
+    hosts = list(args.host or [])
+    if args.hosts_file:
+        for line in Path(args.hosts_file).read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                hosts.append(line)
+    return hosts or ["192.168.11.22"]
+
+
+def main(argv: List[str] = None):
     """
     Función principal para ejecutar la captura de respuestas
     """
+    import argparse
+    parser = argparse.ArgumentParser(description="DRS Response Collector")
+    parser.add_argument("--host", action="append", help="Dispositivo a capturar (repetible, por defecto 192.168.11.22)")
+    parser.add_argument("--hosts-file", help="Fichero con una IP por línea")
+    parser.add_argument("--port", type=int, default=DRS_PORT, help="Puerto Santone")
+    parser.add_argument("--timeout", type=float, default=3.0, help="Timeout de conexión y de cada respuesta (s)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENT_DEVICES, help="Dispositivos en paralelo")
+    parser.add_argument("--capture", default="drs_responses_capture.jsonl", help="Fichero JSONL de captura (se reanuda si existe)")
+    parser.add_argument("--restart", action="store_true", help="Empezar de cero en lugar de reanudar la captura")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Trazar cada trama enviada y recibida")
+    args = parser.parse_args(argv)
+    configure_logging(logging.DEBUG if args.verbose else logging.INFO)
+    
     print("🚀 DRS Response Collector - Capturador de Respuestas Reales")
     print("=" * 60)
     
     # Verificar si estamos ejecutando desde el MiniPC
-    import socket
     hostname = socket.gethostname()
     local_ip = socket.gethostbyname(hostname)
     
     print(f"🖥️  Ejecutando desde: {hostname} ({local_ip})")
     
-    # Crear colector
-    collector = DRSResponseCollector(
-        target_host="192.168.11.22",
-        target_port=65050
-    )
+    hosts = _read_hosts(args)
+    if not FRAMES_AVAILABLE:
+        print("❌ Error: Hex frames not available")
+        return None
     
+    print(f"🎯 {len(hosts)} dispositivo(s), {args.concurrency} en paralelo -> {args.capture}")
+    start_time = time.time()
     try:
-        # Ejecutar colección completa
-        report = collector.collect_all_responses()
-        
-        # Mostrar resumen
-        print("\n" + "=" * 60)
-        print("📊 RESUMEN DE CAPTURA:")
-        summary = report["collection_summary"]
-        print(f"✅ Comandos exitosos: {summary['successful_commands']}")
-        print(f"❌ Comandos fallidos: {summary['failed_commands']}")
-        print(f"📈 Tasa de éxito: {summary['success_rate']:.1f}%")
-        print(f"⏱️  Duración: {summary.get('duration_seconds', 0):.2f}s")
-        print(f"🔌 Intentos de conexión: {summary.get('connection_attempts', 0)}")
-        
-        # Guardar archivos
-        json_file = collector.save_responses_json()
-        py_file = collector.save_mock_responses_py()
-        
-        print(f"\n📄 Archivos generados:")
-        print(f"   📋 JSON Report: {json_file}")
-        print(f"   🐍 Python Mock: {py_file}")
-        
-        print(f"\n🎉 Captura completada!")
-        print(f"🔄 Para usar en tester: import {py_file.replace('.py', '')}")
-        
-        return report
-        
-    except Exception as e:
-        print(f"\n💥 Error durante ejecución: {str(e)}")
+        collectors = asyncio.run(collect_fleet(
+            hosts, args.capture, port=args.port, timeout=args.timeout,
+            max_concurrent_devices=args.concurrency, restart=args.restart
+        ))
+    except KeyboardInterrupt:
+        print(f"\n⚠️ Captura interrumpida: vuelve a ejecutar con --capture {args.capture} para continuar")
         return None
+    finally:
+        shutdown_logging()
+    end_time = time.time()
+    
+    # Mostrar resumen
+    print("\n" + "=" * 60)
+    print("📊 RESUMEN DE CAPTURA:")
+    reports = {}
+    for host, collector in collectors.items():
+        report = collector._create_collection_report(start_time, end_time)
+        summary = report["collection_summary"]
+        reports[host] = report
+        print(f"  {host}: ✅ {summary['successful_commands']} ❌ {summary['failed_commands']} "
+              f"({summary['success_rate']:.1f}%), conexiones: {summary['connection_attempts']}")
+    print(f"⏱️  Duración: {end_time - start_time:.2f}s")
+    
+    # Guardar archivos
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_file = f"drs_responses_collected_{timestamp}.json"
+    with open(json_file, "w") as f:
+        json.dump(reports, f, indent=2)
+    print(f"\n📄 Archivos generados:")
+    print(f"   📋 JSON Report: {json_file}")
+    for host, collector in collectors.items():
+        if collector.successful_commands:
+            py_file = collector.save_mock_responses_py(f"real_drs_responses_{host.replace('.', '_')}_{timestamp}.py")
+            print(f"   🐍 Python Mock: {py_file}")
+    
+    print(f"\n🎉 Captura completada!")
+    return reports
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+DRS Simulator - Servidor asyncio que emula dispositivos DRS Santone
+
+Responde a las tramas Santone con las respuestas capturadas de dispositivos
+reales (``real_drs_responses_20250926_194004.py`` para Master y
+``real_drs_remote_responses.py`` para Remote), de modo que el camino live
+(SantoneSession, AsyncBatchEngine) se puede probar de punta a punta sin
+hardware.
+
+Características:
+- Un solo proceso sirve muchos dispositivos virtuales: varias IPs
+  (p.ej. 127.0.0.1..127.0.15.254, todo 127/8 enruta a loopback) y/o varios puertos
+- Latencia y jitter configurables por respuesta (sin bloquear el event loop)
+- Pérdida de respuestas (el cliente ve un timeout) y tramas truncadas
+  seguidas de cierre de conexión
+- Los comandos SET y los comandos sin respuesta capturada reciben un ACK
+  con cuerpo vacío
+
+Uso::
+
+    cd src
+    python -m validation.drs_simulator --host 127.0.0.1 --port 65050
+    python -m validation.drs_simulator --port 40000 --port-count 1000 --latency-ms 20 --jitter-ms 5
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .crc16 import crc16_xmodem, escape_crc
+from .frame_reader import SantoneFrameReader
+from .santone_codec import FrameError, HEADER, parse_frame
+from .santone_session import DRS_PORT, COMMAND_OFFSET
+from .real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES as MASTER_RESPONSES
+from .real_drs_remote_responses import REAL_DRS_RESPONSES as REMOTE_RESPONSES
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_SETS: Dict[str, Dict[str, str]] = {
+    "master": MASTER_RESPONSES,
+    "remote": REMOTE_RESPONSES,
+}
+
+
+@dataclass
+class SimulatorProfile:
+    """Comportamiento de red de los dispositivos simulados"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    drop_rate: float = 0.0       # Probabilidad de no responder a una petición
+    truncate_rate: float = 0.0   # Probabilidad de enviar media trama y cerrar
+    seed: Optional[int] = None
+
+
+@dataclass
+class SimulatorStats:
+    """Contadores acumulados del simulador"""
+    connections: int = 0
+    active_connections: int = 0
+    requests: int = 0
+    responses: int = 0
+    acks: int = 0
+    dropped: int = 0
+    truncated: int = 0
+    per_listener: Dict[str, int] = field(default_factory=dict)
+
+
+def build_ack_frame(command: int) -> bytes:
+    """Trama de respuesta con cuerpo vacío para un COMMAND_NUMBER."""
+    frame_data = bytes([0x07, 0x00, 0x00, command, 0x00, 0x00])
+    return b"\x7e" + frame_data + escape_crc(crc16_xmodem(frame_data)) + b"\x7e"
+
+
+def load_response_table(responses: Dict[str, str]) -> Dict[int, bytes]:
+    """
+    Convierte respuestas capturadas (hex con espacios) en una tabla
+    COMMAND_NUMBER -> trama lista para enviar.
+
+    Las respuestas con el cuerpo editado a mano (las de Remote se derivaron
+    de Master) no traen un CRC válido; se vuelven a firmar para que el
+    cliente las acepte.
+    """
+    table: Dict[int, bytes] = {}
+    for command_name, response_hex in responses.items():
+        raw = bytes.fromhex(response_hex.replace(" ", ""))
+        try:
+            frame = parse_frame(raw, escaped=True)
+        except FrameError as e:
+            logger.warning("Skipping captured response for %s: %s", command_name, e)
+            continue
+
+        if not frame.crc_valid:
+            frame_data = HEADER.pack(
+                frame.module_function, frame.module_address, frame.data_type,
+                frame.command, frame.flag, frame.length
+            ) + frame.body
+            raw = b"\x7e" + frame_data + escape_crc(crc16_xmodem(frame_data)) + b"\x7e"
+            logger.debug("Re-signed captured response for %s", command_name)
+
+        table[frame.command] = raw
+    return table
+
+
+class DRSSimulator:
+    """
+    Servidor TCP asyncio con uno o varios listeners Santone.
+
+    Uso::
+
+        async with DRSSimulator(ports=[0]) as simulator:
+            host, port = simulator.addresses[0]
+            ...
+    """
+
+    def __init__(
+        self,
+        hosts: List[str] = None,
+        ports: List[int] = None,
+        profile: SimulatorProfile = None,
+        responses: Dict[str, str] = None
+    ):
+        """
+        Args:
+            hosts: IPs en las que escuchar (por defecto 127.0.0.1)
+            ports: Puertos por IP (por defecto 65050; 0 = puerto libre)
+            profile: Latencia, jitter, pérdidas y truncado
+            responses: Respuestas capturadas (por defecto las de Master)
+        """
+        self.hosts = hosts or ["127.0.0.1"]
+        self.ports = ports or [DRS_PORT]
+        self.profile = profile or SimulatorProfile()
+        self.table = load_response_table(responses if responses is not None else MASTER_RESPONSES)
+        self.stats = SimulatorStats()
+        self._random = random.Random(self.profile.seed)
+        self._servers: List[asyncio.AbstractServer] = []
+        self.addresses: List[Tuple[str, int]] = []
+
+    # ==================== CICLO DE VIDA ====================
+
+    async def start(self) -> None:
+        """Abre todos los listeners."""
+        for host in self.hosts:
+            for port in self.ports:
+                server = await asyncio.start_server(self._handle_connection, host, port, reuse_address=True)
+                self._servers.append(server)
+                self.addresses.append(server.sockets[0].getsockname()[:2])
+        logger.info("DRS simulator listening on %d address(es)", len(self.addresses))
+
+    async def stop(self) -> None:
+        """Cierra todos los listeners."""
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+    async def serve_forever(self) -> None:
+        """Arranca (si hace falta) y sirve hasta que se cancele la tarea."""
+        if not self._servers:
+            await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> "DRSSimulator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    # ==================== CONEXIONES ====================
+
+    def response_for(self, command: int) -> bytes:
+        """Respuesta capturada para un comando, o un ACK vacío si no hay captura."""
+        response = self.table.get(command)
+        if response is None:
+            self.stats.acks += 1
+            return build_ack_frame(command)
+        return response
+
+    def _response_delay(self) -> float:
+        profile = self.profile
+        delay_ms = profile.latency_ms
+        if profile.jitter_ms:
+            delay_ms += self._random.uniform(-profile.jitter_ms, profile.jitter_ms)
+        return max(0.0, delay_ms) / 1000
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        local = "%s:%d" % writer.get_extra_info("sockname")[:2]
+        self.stats.connections += 1
+        self.stats.active_connections += 1
+        self.stats.per_listener[local] = self.stats.per_listener.get(local, 0) + 1
+        frame_reader = SantoneFrameReader()
+
+        try:
+            while True:
+                data = await reader.read(frame_reader.capacity)
+                if not data:
+                    break
+                for frame in frame_reader.feed(data):
+                    if len(frame) <= COMMAND_OFFSET:
+                        continue
+                    self.stats.requests += 1
+                    if not await self._answer(frame[COMMAND_OFFSET], writer):
+                        return
+        except ConnectionError:
+            pass
+        finally:
+            self.stats.active_connections -= 1
+            writer.close()
+
+    async def _answer(self, command: int, writer: asyncio.StreamWriter) -> bool:
+        """
+        Envía la respuesta a un comando aplicando el perfil.
+
+        Returns:
+            False si la conexión debe cerrarse (trama truncada)
+        """
+        profile = self.profile
+        delay = self._response_delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+        if profile.drop_rate and self._random.random() < profile.drop_rate:
+            self.stats.dropped += 1
+            return True
+
+        response = self.response_for(command)
+        if profile.truncate_rate and self._random.random() < profile.truncate_rate:
+            self.stats.truncated += 1
+            writer.write(response[:max(1, len(response) // 2)])
+            await writer.drain()
+            return False
+
+        writer.write(response)
+        await writer.drain()
+        self.stats.responses += 1
+        return True
+
+
+# ==================== CLI ====================
+
+def _expand_hosts(host_args: List[str], host_count: int) -> List[str]:
+    """``--host 127.0.1.1 --host-count 100`` -> 127.0.1.1 .. 127.0.1.100"""
+    hosts: List[str] = []
+    for host in host_args:
+        start = ipaddress.ip_address(host)
+        hosts.extend(str(start + offset) for offset in range(host_count))
+    return hosts
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulador de dispositivos DRS (protocolo Santone)")
+    parser.add_argument("--host", action="append", help="IP de escucha (repetible, por defecto 127.0.0.1)")
+    parser.add_argument("--host-count", type=int, default=1, help="IPs consecutivas a partir de cada --host")
+    parser.add_argument("--port", type=int, default=DRS_PORT, help="Primer puerto de escucha")
+    parser.add_argument("--port-count", type=int, default=1, help="Puertos consecutivos por IP")
+    parser.add_argument("--responses", choices=sorted(RESPONSE_SETS), default="master", help="Respuestas capturadas a servir")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latencia por respuesta")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Jitter uniforme +/- sobre la latencia")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probabilidad de no responder (0-1)")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="Probabilidad de truncar la respuesta y cerrar (0-1)")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla para latencias y fallos reproducibles")
+    parser.add_argument("--verbose", action="store_true", help="Logging en nivel DEBUG")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    simulator = DRSSimulator(
+        hosts=_expand_hosts(args.host or ["127.0.0.1"], args.host_count),
+        ports=[args.port + offset for offset in range(args.port_count)],
+        profile=SimulatorProfile(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            drop_rate=args.drop_rate,
+            truncate_rate=args.truncate_rate,
+            seed=args.seed
+        ),
+        responses=RESPONSE_SETS[args.responses]
+    )
+
+    print(f"🛰️  DRS simulator: {len(simulator.hosts)} host(s) x {len(simulator.ports)} port(s), "
+          f"{args.responses} responses, latency {args.latency_ms}±{args.jitter_ms}ms")
+    try:
+        asyncio.run(simulator.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = simulator.stats
+        print(f"📊 connections={stats.connections} requests={stats.requests} responses={stats.responses} "
+              f"acks={stats.acks} dropped={stats.dropped} truncated={stats.truncated}")
+
+
+if __name__ == "__main__":
+    main()
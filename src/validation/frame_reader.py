@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Santone Frame Reader - Reensamblado incremental de tramas 7E...7E
+
+TCP no respeta los límites de trama: una respuesta larga (por ejemplo los
+64 bytes de ``channel_frequency_configuration``) puede llegar partida en
+varios segmentos, y dos respuestas seguidas pueden llegar en el mismo
+``recv``. Este lector acumula los bytes recibidos y entrega tramas
+completas, deshaciendo los escapes Santone por el camino:
+
+- 5E 7D -> 7E
+- 5E 5D -> 5E
+
+Las tramas entregadas incluyen los flags 7E de inicio y fin, por lo que
+mantienen el mismo layout que una respuesta "cruda" sin escapes.
+
+El lector reutiliza un único buffer preasignado para la trama en curso y
+otro para ``recv_into``; la única asignación por trama es el ``bytes``
+final que se entrega al llamador.
+"""
+
+import socket
+from collections import deque
+from typing import Deque, List, Optional, Union
+
+from .spans import PHASE_FIRST_BYTE
+
+FRAME_FLAG = 0x7E
+ESCAPE_BYTE = 0x5E
+
+# Segundo byte de cada secuencia de escape -> byte original
+UNESCAPE_MAP = {
+    0x7D: 0x7E,
+    0x5D: 0x5E,
+}
+
+_FLAG = bytes([FRAME_FLAG])
+_ESCAPE = bytes([ESCAPE_BYTE])
+
+# Tamaño por defecto: muy por encima de la trama más larga del protocolo
+DEFAULT_CAPACITY = 4096
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class SantoneFrameReader:
+    """
+    Lector incremental de tramas Santone.
+
+    Uso sobre un socket::
+
+        reader = SantoneFrameReader()
+        frame = reader.read_frame(sock)
+
+    Uso con datos ya recibidos::
+
+        for frame in reader.feed(chunk):
+            ...
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Tamaño máximo de trama (ya sin escapes) y de cada recv
+        """
+        self.capacity = capacity
+        self._frame_buffer = bytearray(capacity)
+        self._frame_view = memoryview(self._frame_buffer)
+        self._recv_buffer = bytearray(capacity)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._frames: Deque[bytes] = deque()
+
+        self._length = 0
+        self._in_frame = False
+        self._escape_pending = False
+
+        # Contadores de diagnóstico
+        self.frames_completed = 0
+        self.bytes_discarded = 0
+        self.overflows = 0
+
+    def reset(self) -> None:
+        """Descarta la trama en curso y las tramas pendientes (p.ej. al reconectar)."""
+        self._frames.clear()
+        self._length = 0
+        self._in_frame = False
+        self._escape_pending = False
+
+    @property
+    def pending(self) -> int:
+        """Número de tramas completas aún no entregadas."""
+        return len(self._frames)
+
+    # ==================== API ====================
+
+    def feed(self, data: BytesLike) -> List[bytes]:
+        """
+        Procesa bytes recibidos y devuelve las tramas completadas.
+
+        Args:
+            data: Bytes recibidos (puede ser un fragmento de trama o varias tramas)
+
+        Returns:
+            Lista de tramas completas (7E ... 7E, sin escapes)
+        """
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        self._consume(view, 0, len(view))
+        frames = list(self._frames)
+        self._frames.clear()
+        return frames
+
+    def next_frame(self) -> Optional[bytes]:
+        """Devuelve la siguiente trama pendiente o None."""
+        return self._frames.popleft() if self._frames else None
+
+    def read_frame(self, sock: socket.socket, timeline=None) -> bytes:
+        """
+        Lee del socket hasta completar una trama.
+
+        Respeta el timeout configurado en el socket para cada ``recv_into``.
+        Si se pasa un ``CommandTimeline`` se marca la llegada del primer byte.
+
+        Raises:
+            socket.timeout: Si el dispositivo deja de enviar antes de completar la trama
+            ConnectionResetError: Si el dispositivo cierra la conexión
+        """
+        while not self._frames:
+            received = sock.recv_into(self._recv_view)
+            if received == 0:
+                raise ConnectionResetError("Connection closed by device")
+            if timeline is not None:
+                timeline.mark_once(PHASE_FIRST_BYTE)
+            self._consume(self._recv_view, 0, received)
+        return self._frames.popleft()
+
+    # ==================== PARSER ====================
+
+    def _consume(self, view: memoryview, pos: int, end: int) -> None:
+        """Procesa ``view[pos:end]`` avanzando por bloques entre flags y escapes."""
+        # bytes.find/bytearray.find aceptan rangos y no copian; sólo se copia
+        # si nos pasan un memoryview recortado sobre otro objeto
+        raw = view.obj
+        if not isinstance(raw, (bytes, bytearray)) or len(raw) != len(view):
+            raw = view.tobytes()
+
+        while pos < end:
+            if not self._in_frame:
+                start = raw.find(_FLAG, pos, end)
+                if start < 0:
+                    self.bytes_discarded += end - pos
+                    return
+                self.bytes_discarded += start - pos
+                self._start_frame()
+                pos = start + 1
+                continue
+
+            if self._escape_pending:
+                self._escape_pending = False
+                value = view[pos]
+                original = UNESCAPE_MAP.get(value)
+                if original is not None:
+                    self._append_byte(original)
+                    pos += 1
+                else:
+                    # Escape huérfano: se conserva tal cual y se reprocesa el byte
+                    self._append_byte(ESCAPE_BYTE)
+                continue
+
+            flag = raw.find(_FLAG, pos, end)
+            stop = flag if flag >= 0 else end
+            escape = raw.find(_ESCAPE, pos, stop)
+
+            if escape >= 0:
+                self._append_slice(view, pos, escape)
+                self._escape_pending = True
+                pos = escape + 1
+                continue
+
+            self._append_slice(view, pos, stop)
+            pos = stop
+            if flag >= 0:
+                pos = flag + 1
+                if self._length <= 1:
+                    # 7E 7E: fin de una trama anterior perdida o flags consecutivos
+                    self._start_frame()
+                    continue
+                self._append_byte(FRAME_FLAG)
+                self._finish_frame()
+
+    def _start_frame(self) -> None:
+        self._frame_buffer[0] = FRAME_FLAG
+        self._length = 1
+        self._in_frame = True
+        self._escape_pending = False
+
+    def _append_slice(self, view: memoryview, start: int, stop: int) -> None:
+        size = stop - start
+        if size <= 0 or not self._in_frame:
+            return
+        if self._length + size >= self.capacity:
+            self._overflow()
+            return
+        self._frame_view[self._length:self._length + size] = view[start:stop]
+        self._length += size
+
+    def _append_byte(self, value: int) -> None:
+        if not self._in_frame:
+            return
+        if self._length >= self.capacity:
+            self._overflow()
+            return
+        self._frame_buffer[self._length] = value
+        self._length += 1
+
+    def _overflow(self) -> None:
+        """Trama más larga que el buffer: se descarta y se espera el siguiente 7E."""
+        self.overflows += 1
+        self.bytes_discarded += self._length
+        self._length = 0
+        self._in_frame = False
+        self._escape_pending = False
+
+    def _finish_frame(self) -> None:
+        self._frames.append(bytes(self._frame_view[:self._length]))
+        self.frames_completed += 1
+        self._length = 0
+        self._in_frame = False
@@ -1,27 +1,15 @@
 # -*- coding: utf-8 -*-
 """
-Tramas hexadecimales pre-generadas para comandos DRS Santone Protocol.
+Tramas pre-generadas para comandos DRS Santone Protocol.
 
-Este archivo contiene todas las tramas hexadecimales necesarias para validar
-comandos DRS usando el protocolo Santone. Las trif __name__ == "__main__":
-    print("=== DRS Hex Frames Information ===")
-    print(f"DRS Master Commands: {TOTAL_MASTER_COMMANDS}")
-    print(f"DRS Remote Commands: {TOTAL_REMOTE_COMMANDS}")
-    print(f"DRS Set Commands: {TOTAL_SET_COMMANDS}")
-    print(f"Total Unique Commands: {TOTAL_UNIQUE_COMMANDS}")
-    print()
-    print("Sample Master Commands:")
-    for i, (cmd, frame) in enumerate(list(DRS_MASTER_FRAMES.items())[:3]):
-        print(f"  {cmd}: {frame}")
-    print()
-    print("Sample Remote Commands:")
-    for i, (cmd, frame) in enumerate(list(DRS_REMOTE_FRAMES.items())[:3]):
-        print(f"  {cmd}: {frame}")
-    print()
-    print("Sample Set Commands:")
-    for i, (cmd, frame) in enumerate(list(DRS_SET_FRAMES.items())[:3]):
-        print(f"  {cmd}: {frame}")eneradas usando
-DigitalBoardProtocol con MODULE_FUNCTION=0x07.
+Este archivo contiene todas las tramas necesarias para validar comandos DRS
+usando el protocolo Santone. Las tramas se generan con DigitalBoardProtocol
+(MODULE_FUNCTION=0x07) y se guardan como ``bytes`` ya codificados: se
+validan una sola vez al importar el módulo, de modo que enviar un comando
+es una búsqueda en diccionario más ``sendall``.
+
+Los diccionarios ``DRS_*_FRAMES`` son vistas hexadecimales de solo lectura
+sobre ese registro binario (el hex se genera bajo demanda para la API).
 
 Formato de trama: 7E + [ModFunc][ModAddr][DataType][CmdNum][Flag][Length][Data][CRC] + 7E
 - 7E = START_FLAG
@@ -37,7 +25,11 @@ Formato de trama: 7E + [ModFunc][ModAddr][DataType][CmdNum][Flag][Length][Data][
 Generado automáticamente el: 26/09/2025
 """
 
-from typing import Dict, List
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional
+
+from .crc16 import crc16_xmodem, escape_crc
 
 # Importar módulo de comandos de seteo
 try:
@@ -46,8 +38,19 @@ try:
 except ImportError:
     SET_COMMANDS_AVAILABLE = False
 
+# Inicio fijo de toda trama DigitalBoard: 7E 07 00 00
+FRAME_PREFIX = bytes([0x7E, 0x07, 0x00, 0x00])
+
+# 7E + ModFunc, ModAddr, DataType, CmdNum, Flag, Length
+FRAME_HEADER_SIZE = 7
+
+# Cabecera + CRC (2 bytes) + 7E final, sin cuerpo
+MIN_FRAME_SIZE = FRAME_HEADER_SIZE + 3
+
+# ==================== TRAMAS FUENTE ====================
+
 # Tramas para comandos DRS Master (15 comandos)
-DRS_MASTER_FRAMES: Dict[str, str] = {
+_MASTER_HEX_FRAMES: Dict[str, str] = {
     # Comandos de puertos ópticos
     'optical_port_devices_connected_1': '7E070000F80000B2827E',
     'optical_port_devices_connected_2': '7E070000F9000082B57E', 
@@ -72,10 +75,34 @@ DRS_MASTER_FRAMES: Dict[str, str] = {
     'datt': '7E070000090000D0567E',
 }
 
+# Tramas para comandos DRS Remote (13 comandos)
+_REMOTE_HEX_FRAMES: Dict[str, str] = {
+    # Comandos básicos
+    'temperature': '7E07000002000021A67E',
+    'device_id': '7E070000970000E8357E', 
+    'datt': '7E070000090000D0567E',
+    
+    # Comandos de potencia y canal
+    'input_and_output_power': '7E070000F3000043727E',
+    'channel_switch': '7E0700004200008CBB7E',
+    'channel_frequency_configuration': '7E07000036000044BF7E',
+    'central_frequency_point': '7E070000EB000081987E',
+    'subband_bandwidth': '7E070000ED0000212A7E',
+    
+    # Comandos de configuración
+    'broadband_switching': '7E0700008100002BC47E',
+    'optical_port_switch': '7E07000091000048877E',
+    'optical_port_status': '7E0700009A0000B9777E',
+    
+    # Comandos de puertos ópticos específicos
+    'optical_port_devices_connected_1': '7E070000F80000B2827E',
+    'optical_port_devices_connected_2': '7E070000F9000082B57E',
+}
+
 # Tramas para comandos SET (configuración) - Generadas dinámicamente
-def get_set_command_frames() -> Dict[str, str]:
+def build_set_command_frames() -> Dict[str, bytes]:
     """
-    Genera tramas para comandos de configuración usando SetCommands
+    Genera las tramas binarias de los comandos de configuración usando SetCommands
     """
     if not SET_COMMANDS_AVAILABLE:
         return {}
@@ -84,41 +111,41 @@ def get_set_command_frames() -> Dict[str, str]:
 
     try:
         # Comando: Cambiar a modo WideBand
-        frames['set_working_mode_wideband'] = SetCommands.set_working_mode(True).hex().upper()
+        frames['set_working_mode_wideband'] = SetCommands.set_working_mode(True)
 
         # Comando: Cambiar a modo Channel
-        frames['set_working_mode_channel'] = SetCommands.set_working_mode(False).hex().upper()
+        frames['set_working_mode_channel'] = SetCommands.set_working_mode(False)
 
         # Comando: Configurar atenuación (ejemplo: 10dB uplink, 15dB downlink para DMU)
-        frames['set_attenuation_10_15_dmu'] = SetCommands.set_attenuation(10, 15, "dmu").hex().upper()
+        frames['set_attenuation_10_15_dmu'] = SetCommands.set_attenuation(10, 15, "dmu")
 
         # Comando: Configurar atenuación (ejemplo: 5dB uplink, 20dB downlink para DRU)
-        frames['set_attenuation_5_20_dru'] = SetCommands.set_attenuation(5, 20, "dru").hex().upper()
+        frames['set_attenuation_5_20_dru'] = SetCommands.set_attenuation(5, 20, "dru")
 
         # Comando: Activar todos los canales
-        frames['set_channels_all_on'] = SetCommands.set_channel_activation([True] * 16).hex().upper()
+        frames['set_channels_all_on'] = SetCommands.set_channel_activation([True] * 16)
 
         # Comando: Desactivar todos los canales
-        frames['set_channels_all_off'] = SetCommands.set_channel_activation([False] * 16).hex().upper()
+        frames['set_channels_all_off'] = SetCommands.set_channel_activation([False] * 16)
 
         # Comando: Activar canales 1-8, desactivar 9-16
-        frames['set_channels_first_8_on'] = SetCommands.set_channel_activation([True] * 8 + [False] * 8).hex().upper()
+        frames['set_channels_first_8_on'] = SetCommands.set_channel_activation([True] * 8 + [False] * 8)
 
         # Comando: Configurar frecuencia de canal único (ejemplo: canal 0 con frecuencia 0x12345678)
-        frames['set_single_channel_freq_0'] = SetCommands.set_single_channel_frequency(0, "12345678").hex().upper()
+        frames['set_single_channel_freq_0'] = SetCommands.set_single_channel_frequency(0, "12345678")
 
         # Comando: Configurar todas las frecuencias de canal (ejemplo: frecuencias por defecto)
         default_frequencies = ["12345678"] * 16  # Misma frecuencia para todos los canales
-        frames['set_channel_frequency_configuration'] = SetCommands.set_channel_frequencies(default_frequencies).hex().upper()
+        frames['set_channel_frequency_configuration'] = SetCommands.set_channel_frequencies(default_frequencies)
 
         # Comando: Configurar frecuencias VHF (145-160 MHz)
-        frames['set_vhf_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_vhf_frequencies()).hex().upper()
+        frames['set_vhf_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_vhf_frequencies())
 
         # Comando: Configurar frecuencias P25 (851-869 MHz)
-        frames['set_p25_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_p25_frequencies()).hex().upper()
+        frames['set_p25_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_p25_frequencies())
 
         # Comando: Configurar frecuencias TETRA 400 (427-430 MHz)
-        frames['set_tetra400_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_tetra400_frequencies()).hex().upper()
+        frames['set_tetra400_frequencies'] = SetCommands.set_channel_frequencies(SetCommands.generate_tetra400_frequencies())
 
     except Exception as e:
         print(f"Warning: Error generating set command frames: {e}")
@@ -126,32 +153,121 @@ def get_set_command_frames() -> Dict[str, str]:
 
     return frames
 
-# Obtener tramas de seteo dinámicamente
-DRS_SET_FRAMES: Dict[str, str] = get_set_command_frames()
 
-# Tramas para comandos DRS Remote (13 comandos)
-DRS_REMOTE_FRAMES: Dict[str, str] = {
-    # Comandos básicos
-    'temperature': '7E07000002000021A67E',
-    'device_id': '7E070000970000E8357E', 
-    'datt': '7E070000090000D0567E',
-    
-    # Comandos de potencia y canal
-    'input_and_output_power': '7E070000F3000043727E',
-    'channel_switch': '7E0700004200008CBB7E',
-    'channel_frequency_configuration': '7E07000036000044BF7E',
-    'central_frequency_point': '7E070000EB000081987E',
-    'subband_bandwidth': '7E070000ED0000212A7E',
-    
-    # Comandos de configuración
-    'broadband_switching': '7E0700008100002BC47E',
-    'optical_port_switch': '7E07000091000048877E',
-    'optical_port_status': '7E0700009A0000B9777E',
-    
-    # Comandos de puertos ópticos específicos
-    'optical_port_devices_connected_1': '7E070000F80000B2827E',
-    'optical_port_devices_connected_2': '7E070000F9000082B57E',
-}
+# ==================== REGISTRO BINARIO ====================
+
+def validate_frame_bytes(frame: bytes) -> bool:
+    """
+    Valida una trama Santone tal como se envía por el socket.
+
+    Comprueba flags, cabecera DigitalBoard, que COMMAND_BODY_LENGTH cuadre
+    con el tamaño de la trama y que el CRC (escapado) sea correcto.
+
+    Args:
+        frame: Trama completa 7E ... 7E
+
+    Returns:
+        True si la trama es válida, False en caso contrario
+    """
+    if len(frame) < MIN_FRAME_SIZE or not frame.startswith(FRAME_PREFIX) or frame[-1] != 0x7E:
+        return False
+
+    body_end = FRAME_HEADER_SIZE + frame[6]
+    if body_end + 3 > len(frame):
+        return False
+
+    return escape_crc(crc16_xmodem(frame[1:body_end])) == frame[body_end:-1]
+
+
+def _register_frames(group: str, frames: Dict[str, bytes]) -> Mapping:
+    """
+    Valida un grupo de tramas y lo congela como mapping de solo lectura.
+
+    Raises:
+        ValueError: Si alguna trama no es válida
+    """
+    for command, frame in frames.items():
+        if not validate_frame_bytes(frame):
+            raise ValueError(f"Invalid {group} frame for command '{command}': {frame.hex().upper()}")
+    return MappingProxyType(dict(frames))
+
+
+class HexFrameView(Mapping):
+    """
+    Vista hexadecimal (mayúsculas) de solo lectura sobre un registro binario.
+
+    El hex de cada trama se calcula la primera vez que se pide y se cachea,
+    así el camino de envío nunca toca strings.
+    """
+
+    def __init__(self, frames: Mapping):
+        self._frames = frames
+        self._hex_cache: Dict[str, str] = {}
+
+    def __getitem__(self, command: str) -> str:
+        hex_frame = self._hex_cache.get(command)
+        if hex_frame is None:
+            hex_frame = self._frames[command].hex().upper()
+            self._hex_cache[command] = hex_frame
+        return hex_frame
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __repr__(self) -> str:
+        return f"HexFrameView({dict(self)!r})"
+
+
+def get_set_command_frames() -> Dict[str, str]:
+    """
+    Genera tramas hexadecimales para comandos de configuración.
+
+    Se mantiene por compatibilidad; el registro usa build_set_command_frames().
+    """
+    return {command: frame.hex().upper() for command, frame in build_set_command_frames().items()}
+
+
+# Registro binario: comando -> trama lista para enviar
+MASTER_FRAME_BYTES: Mapping = _register_frames("master", {
+    command: bytes.fromhex(frame) for command, frame in _MASTER_HEX_FRAMES.items()
+})
+REMOTE_FRAME_BYTES: Mapping = _register_frames("remote", {
+    command: bytes.fromhex(frame) for command, frame in _REMOTE_HEX_FRAMES.items()
+})
+SET_FRAME_BYTES: Mapping = _register_frames("set", build_set_command_frames())
+
+# Registro por tipo de comando (mismos valores que CommandType)
+FRAME_REGISTRY: Mapping = MappingProxyType({
+    "master": MASTER_FRAME_BYTES,
+    "remote": REMOTE_FRAME_BYTES,
+    "set": SET_FRAME_BYTES,
+})
+
+# Vistas hexadecimales para la API y los reportes
+DRS_MASTER_FRAMES: Mapping = HexFrameView(MASTER_FRAME_BYTES)
+DRS_REMOTE_FRAMES: Mapping = HexFrameView(REMOTE_FRAME_BYTES)
+DRS_SET_FRAMES: Mapping = HexFrameView(SET_FRAME_BYTES)
+
+
+def get_frame_bytes(command: str, command_type: str) -> Optional[bytes]:
+    """
+    Obtiene la trama binaria lista para enviar.
+
+    Args:
+        command: Nombre del comando (ej: 'device_id')
+        command_type: "master", "remote" o "set"
+
+    Returns:
+        Trama completa en bytes o None si no existe
+    """
+    frames = FRAME_REGISTRY.get(command_type)
+    if frames is None:
+        return None
+    return frames.get(command)
+
 
 # Mapeo de comando a número hexadecimal para referencia
 COMMAND_HEX_MAP: Dict[str, int] = {
@@ -249,27 +365,10 @@ def validate_frame_format(frame: str) -> bool:
     Returns:
         True si la trama es válida, False en caso contrario
     """
-    # Accept frames of various lengths: 20 (master/remote), 22/24 (set working/attenuation), 52 (set channels), 148/159 (set frequencies)
-    if not frame or len(frame) not in [20, 22, 24, 52, 148, 159]:
-        return False
-    
-    # Verificar START y END flags
-    if not (frame.startswith('7E') and frame.endswith('7E')):
-        return False
-        
-    # Verificar MODULE_FUNCTION (posición 2-3)
-    if frame[2:4] != '07':
-        return False
-        
-    # Verificar MODULE_ADDRESS (posición 4-5)
-    if frame[4:6] != '00':
-        return False
-        
-    # Verificar DATA_INITIATION (posición 6-7)  
-    if frame[6:8] != '00':
+    try:
+        return validate_frame_bytes(bytes.fromhex(frame))
+    except (TypeError, ValueError):
         return False
-        
-    return True
 
 # Estadísticas de tramas generadas
 TOTAL_MASTER_COMMANDS = len(DRS_MASTER_FRAMES)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Job Queue - Cola de validaciones en segundo plano
+
+Las validaciones (batch de comandos, escenarios) pueden tardar segundos por
+dispositivo. En lugar de mantener abierta la petición HTTP hasta que
+terminan, la API encola un trabajo y devuelve su ``job_id`` al instante; el
+cliente consulta el estado con ese id.
+
+Características:
+- Pool acotado de workers asyncio (N validaciones en curso como máximo)
+- Cola acotada: con la cola llena ``submit`` falla en vez de acumular memoria
+- Deduplicación: un trabajo idéntico (misma clave, p.ej. dispositivo + tipo
+  de comandos + modo) que ya está en cola o en curso se reutiliza
+- Retención acotada de trabajos terminados para poder consultarlos después
+
+Encolar cientos de dispositivos es barato: cada trabajo pendiente es sólo
+un objeto ``Job`` y una corrutina sin arrancar.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Valores por defecto del pool
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_MAX_FINISHED = 500
+
+JobRunner = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class JobStatus(Enum):
+    """Estados de un trabajo"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    """La cola de trabajos pendientes está llena"""
+
+
+@dataclass
+class Job:
+    """Trabajo de validación encolado"""
+    job_id: str
+    kind: str
+    key: Hashable
+    runner: JobRunner = field(repr=False)
+    params: Dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Representación JSON del trabajo."""
+        data = {
+            "run_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "params": self.params,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobQueue:
+    """
+    Cola asyncio con un pool fijo de workers.
+
+    Uso::
+
+        queue = JobQueue(max_workers=8)
+        job, created = queue.submit("batch", ("10.0.0.1", "remote", "live"), runner)
+        ...
+        await queue.wait(job.job_id)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_finished: int = DEFAULT_MAX_FINISHED
+    ):
+        """
+        Args:
+            max_workers: Trabajos ejecutándose a la vez
+            max_pending: Trabajos en cola como máximo (0 = sin límite)
+            max_finished: Trabajos terminados que se conservan para consulta
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._jobs: Dict[str, Job] = {}
+        self._inflight: Dict[Hashable, str] = {}
+        self._finished: Deque[str] = deque()
+
+        # Estadísticas acumuladas
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    # ==================== CICLO DE VIDA ====================
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Arranca los workers en el event loop actual (idempotente)."""
+        if self._workers:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._workers = [
+            asyncio.create_task(self._worker(index), name=f"job-worker-{index}")
+            for index in range(self.max_workers)
+        ]
+        logger.info("Job queue started with %d workers", self.max_workers)
+
+    async def stop(self) -> None:
+        """Cancela los workers; los trabajos en curso quedan como fallidos."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    # ==================== TRABAJOS ====================
+
+    def submit(
+        self,
+        kind: str,
+        key: Hashable,
+        runner: JobRunner,
+        params: Dict[str, Any] = None
+    ) -> Tuple[Job, bool]:
+        """
+        Encola un trabajo, o devuelve el idéntico que ya está en vuelo.
+
+        Args:
+            kind: Tipo de trabajo ("batch_commands", "validation", ...)
+            key: Clave de deduplicación (hashable)
+            runner: Función sin argumentos que devuelve la corrutina del trabajo
+            params: Parámetros a mostrar en el estado del trabajo
+
+        Returns:
+            (job, created): created es False si se reutilizó un trabajo existente
+
+        Raises:
+            QueueFullError: Si la cola de pendientes está llena
+        """
+        self.start()
+
+        existing_id = self._inflight.get((kind, key))
+        if existing_id is not None:
+            self.deduplicated += 1
+            return self._jobs[existing_id], False
+
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, key=key, runner=runner, params=params or {})
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(f"Job queue full ({self.max_pending} pending)")
+
+        self._jobs[job.job_id] = job
+        self._inflight[(kind, key)] = job.job_id
+        self.submitted += 1
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Trabajo por id, o None si no existe (o ya se descartó)."""
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """
+        Espera a que un trabajo termine.
+
+        Raises:
+            KeyError: Si el trabajo no existe
+            asyncio.TimeoutError: Si no termina dentro del timeout
+        """
+        job = self._jobs[job_id]
+        await asyncio.wait_for(job.done.wait(), timeout=timeout)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidad de la cola y contadores."""
+        active = sum(1 for job in self._jobs.values() if job.status is JobStatus.RUNNING)
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "active": active,
+            "retained": len(self._jobs),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+    # ==================== WORKERS ====================
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now()
+        start = time.perf_counter()
+
+        try:
+            job.result = await job.runner()
+            job.status = JobStatus.COMPLETED
+            self.completed += 1
+        except asyncio.CancelledError:
+            job.status = JobStatus.FAILED
+            job.error = "Job cancelled"
+            self.failed += 1
+            raise
+        except Exception as e:
+            # HTTPException y similares traen el mensaje útil en ``detail``
+            job.error = str(getattr(e, "detail", None) or e)
+            job.status = JobStatus.FAILED
+            self.failed += 1
+            logger.warning("Job %s (%s) failed: %s", job.job_id, job.kind, job.error)
+        finally:
+            job.finished_at = datetime.now()
+            job.duration_ms = int((time.perf_counter() - start) * 1000)
+            job.runner = None
+            self._inflight.pop((job.kind, job.key), None)
+            self._retire(job)
+            job.done.set()
+
+    def _retire(self, job: Job) -> None:
+        """Registra un trabajo terminado y descarta los más antiguos."""
+        self._finished.append(job.job_id)
+        while len(self._finished) > self.max_finished:
+            self._jobs.pop(self._finished.popleft(), None)
@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+Load Harness - Prueba de carga de punta a punta contra la API HTTP
+
+Mide cuántos técnicos y batches simultáneos aguanta un contenedor:
+
+- Arranca el simulador de dispositivos (``validation.drs_simulator``) con N
+  IPs de loopback escuchando en el puerto Santone, y la app FastAPI con
+  uvicorn en un directorio de resultados temporal (o usa ``--url``)
+- Lanza una mezcla configurable de ``/api/validation/run``,
+  ``/api/validation/batch-commands``, ``/api/validation/ping/{ip}`` y
+  ``/api/results/history`` a un ritmo fijo (carga en lazo abierto: las
+  peticiones salen a su hora aunque las anteriores no hayan terminado)
+- La latencia se mide desde la hora programada de cada petición, así que
+  la espera por ``--concurrency`` también cuenta (sin *coordinated omission*)
+- Escribe un reporte JSON: p50/p95/p99, throughput, tasa de errores por
+  endpoint y pico de RSS del proceso de la app
+
+Uso::
+
+    cd src
+    python -m validation.load_harness --rate 20 --duration 60 --devices 50 \\
+        --mix batch=4,run=2,ping=2,history=2 --report load-report.json
+
+Requiere ``httpx`` (ya en requirements.txt) y uvicorn para arrancar la app.
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from .santone_session import DRS_PORT
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+ENDPOINTS = ("run", "batch", "ping", "history")
+DEFAULT_MIX = "batch=4,run=2,ping=2,history=2"
+
+# Primera IP de la granja de dispositivos simulados (127/8 enruta a loopback)
+DEFAULT_FARM_START = "127.0.10.1"
+
+
+# ==================== MEZCLA Y ESTADÍSTICAS ====================
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    ``"batch=4,run=2"`` -> pesos por endpoint.
+
+    Raises:
+        ValueError: Si un endpoint no existe o un peso no es positivo
+    """
+    mix: Dict[str, float] = {}
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint in mix: {name!r} (expected one of {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+        if mix[name] <= 0:
+            raise ValueError(f"Weight for {name} must be positive")
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class Sample:
+    """Resultado de una petición"""
+    endpoint: str
+    latency_ms: float
+    status: int       # 0 si no hubo respuesta HTTP
+    error: str = ""
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.error) or self.status >= 400
+
+
+def summarize(samples: List[Sample], elapsed_s: float) -> Dict[str, Any]:
+    """Latencias, throughput y errores de un conjunto de muestras."""
+    latencies = sorted(sample.latency_ms for sample in samples)
+    errors = sum(1 for sample in samples if sample.failed)
+    statuses: Dict[str, int] = {}
+    for sample in samples:
+        key = str(sample.status) if sample.status else "no_response"
+        statuses[key] = statuses.get(key, 0) + 1
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        },
+        "status_codes": statuses,
+    }
+
+
+# ==================== PROCESOS ====================
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _peak_rss_mb(pid: int) -> Optional[float]:
+    """Pico de memoria residente (VmHWM) del proceso, en MB (Linux)."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+class RssSampler:
+    """Muestrea el RSS de un proceso cuando no hay VmHWM (psutil)"""
+
+    def __init__(self, pid: int, interval: float = 0.5):
+        self.pid = pid
+        self.interval = interval
+        self.peak_mb: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if PSUTIL_AVAILABLE:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> Optional[float]:
+        if self._task is not None:
+            self._task.cancel()
+        peak = _peak_rss_mb(self.pid)
+        return peak if peak is not None else self.peak_mb
+
+    async def _run(self) -> None:
+        process = psutil.Process(self.pid)
+        while True:
+            try:
+                rss = process.memory_info().rss / (1024 * 1024)
+            except psutil.Error:
+                return
+            self.peak_mb = round(max(self.peak_mb or 0.0, rss), 1)
+            await asyncio.sleep(self.interval)
+
+
+def start_simulator(farm_start: str, devices: int, latency_ms: float, jitter_ms: float, drop_rate: float) -> subprocess.Popen:
+    """Arranca ``validation.drs_simulator`` en otro proceso (no compite por el event loop)."""
+    command = [
+        sys.executable, "-m", "validation.drs_simulator",
+        "--host", farm_start, "--host-count", str(devices),
+        "--latency-ms", str(latency_ms), "--jitter-ms", str(jitter_ms), "--drop-rate", str(drop_rate),
+    ]
+    return subprocess.Popen(command, cwd=SRC_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def start_app(port: int, results_dir: Path) -> subprocess.Popen:
+    """
+    Arranca la app con uvicorn y un directorio de resultados propio.
+
+    La salida de la app va a ``results_dir/app.log``.
+    """
+    env = dict(os.environ, RESULTS_DIR=str(results_dir), LOG_LEVEL=os.environ.get("LOG_LEVEL", "WARNING"))
+    command = [
+        sys.executable, "-m", "uvicorn", "validation_app:app",
+        "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+    ]
+    with open(results_dir / "app.log", "wb") as log:
+        return subprocess.Popen(command, cwd=SRC_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+async def wait_until_healthy(client: "httpx.AsyncClient", timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"App did not become healthy within {timeout:.0f}s")
+        await asyncio.sleep(0.2)
+
+
+async def wait_for_port(host: str, port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Simulator not listening on {host}:{port}")
+            await asyncio.sleep(0.1)
+
+
+def _stop(process: Optional[subprocess.Popen]) -> None:
+    if process is not None and process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ==================== CARGA ====================
+
+@dataclass
+class LoadConfig:
+    """Parámetros de una ejecución de carga"""
+    rate: float = 10.0
+    duration: float = 30.0
+    concurrency: int = 200
+    mix: Dict[str, float] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    mode: str = "live"
+    command_type: str = "master"
+    devices: List[str] = field(default_factory=lambda: [DEFAULT_FARM_START])
+    request_timeout: float = 60.0
+    seed: Optional[int] = None
+
+
+def build_request(endpoint: str, device: str, config: LoadConfig) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    """(método, ruta, cuerpo JSON) de una petición del endpoint."""
+    if endpoint == "run":
+        return "POST", "/api/validation/run?wait=true", {
+            "scenario_id": "dmu_basic_check", "ip_address": device, "hostname": f"load-{device}", "mode": config.mode
+        }
+    if endpoint == "batch":
+        return "POST", "/api/validation/batch-commands?wait=true", {
+            "ip_address": device, "command_type": config.command_type, "mode": config.mode
+        }
+    if endpoint == "ping":
+        return "POST", f"/api/validation/ping/{device}", None
+    return "GET", f"/api/results/history?limit=20&ip_address={device}&fields=timestamp,status", None
+
+
+async def run_load(client: "httpx.AsyncClient", config: LoadConfig) -> Tuple[List[Sample], float]:
+    """
+    Lanza ``rate * duration`` peticiones a intervalos fijos.
+
+    Returns:
+        (muestras, segundos desde la primera petición hasta la última respuesta)
+    """
+    rng = random.Random(config.seed)
+    endpoints = list(config.mix)
+    weights = [config.mix[name] for name in endpoints]
+    slots = asyncio.Semaphore(config.concurrency)
+    samples: List[Sample] = []
+    total = max(1, int(config.rate * config.duration))
+    interval = 1.0 / config.rate
+
+    async def fire(endpoint: str, device: str, scheduled: float) -> None:
+        method, path, body = build_request(endpoint, device, config)
+        async with slots:
+            try:
+                response = await client.request(method, path, json=body, timeout=config.request_timeout)
+                status, error = response.status_code, ""
+            except httpx.HTTPError as e:
+                status, error = 0, f"{type(e).__name__}: {e}"
+        samples.append(Sample(endpoint, (time.perf_counter() - scheduled) * 1000, status, error))
+
+    start = time.perf_counter()
+    tasks = []
+    for index in range(total):
+        scheduled = start + index * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        endpoint = rng.choices(endpoints, weights)[0]
+        tasks.append(asyncio.create_task(fire(endpoint, rng.choice(config.devices), scheduled)))
+    await asyncio.gather(*tasks)
+    return samples, time.perf_counter() - start
+
+
+def build_report(
+    samples: List[Sample],
+    elapsed_s: float,
+    config: LoadConfig,
+    peak_rss_mb: Optional[float],
+    server: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Reporte JSON de la ejecución."""
+    by_endpoint: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+    errors = [sample.error for sample in samples if sample.error]
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "config": {
+            "rate_rps": config.rate,
+            "duration_s": config.duration,
+            "concurrency": config.concurrency,
+            "mix": config.mix,
+            "mode": config.mode,
+            "command_type": config.command_type,
+            "devices": len(config.devices),
+        },
+        "elapsed_s": round(elapsed_s, 2),
+        "overall": summarize(samples, elapsed_s),
+        "endpoints": {name: summarize(group, elapsed_s) for name, group in sorted(by_endpoint.items())},
+        "app": {"peak_rss_mb": peak_rss_mb},
+        "server": server,
+        "sample_errors": sorted(set(errors))[:10],
+    }
+
+
+# ==================== CLI ====================
+
+async def _main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    first = args.farm_start
+    devices = [str(ipaddress.ip_address(first) + offset) for offset in range(args.devices)]
+    config = LoadConfig(
+        rate=args.rate, duration=args.duration, concurrency=args.concurrency, mix=parse_mix(args.mix),
+        mode=args.mode, command_type=args.command_type, devices=devices,
+        request_timeout=args.request_timeout, seed=args.seed
+    )
+
+    simulator = app = None
+    tmp = tempfile.TemporaryDirectory(prefix="drs-load-")
+    try:
+        if not args.no_simulator:
+            simulator = start_simulator(first, args.devices, args.latency_ms, args.jitter_ms, args.drop_rate)
+            await wait_for_port(devices[-1], DRS_PORT)
+
+        url, pid = args.url, args.pid
+        if url is None:
+            port = _free_port()
+            app = start_app(port, Path(tmp.name))
+            url, pid = f"http://127.0.0.1:{port}", app.pid
+
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+            try:
+                await wait_until_healthy(client)
+            except RuntimeError as e:
+                log = Path(tmp.name) / "app.log"
+                tail = log.read_text(errors="replace")[-2000:] if log.exists() else ""
+                raise RuntimeError(f"{e}\n{tail}") from None
+            sampler = RssSampler(pid) if pid else None
+            if sampler:
+                sampler.start()
+            samples, elapsed = await run_load(client, config)
+            peak_rss = await sampler.stop() if sampler else None
+            try:
+                server = (await client.get("/api/system/executors")).json()
+            except (httpx.HTTPError, ValueError):
+                server = None
+        return build_report(samples, elapsed, config, peak_rss, server)
+    finally:
+        _stop(app)
+        _stop(simulator)
+        tmp.cleanup()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Prueba de carga de la API de validación DRS")
+    parser.add_argument("--rate", type=float, default=10.0, help="Peticiones por segundo")
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos de carga")
+    parser.add_argument("--concurrency", type=int, default=200, help="Máximo de peticiones en vuelo")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Pesos por endpoint ({', '.join(ENDPOINTS)})")
+    parser.add_argument("--mode", choices=("live", "mock"), default="live", help="Modo de run y batch-commands")
+    parser.add_argument("--command-type", choices=("master", "remote"), default="master")
+    parser.add_argument("--devices", type=int, default=20, help="Dispositivos simulados")
+    parser.add_argument("--farm-start", default=DEFAULT_FARM_START, help="Primera IP de la granja simulada")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Latencia de respuesta simulada")
+    parser.add_argument("--jitter-ms", type=float, default=2.0, help="Jitter de la latencia simulada")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Respuestas perdidas por el simulador (0-1)")
+    parser.add_argument("--no-simulator", action="store_true", help="No arrancar el simulador (dispositivos ya en marcha)")
+    parser.add_argument("--url", help="App ya en marcha (no se arranca uvicorn)")
+    parser.add_argument("--pid", type=int, help="PID de la app de --url para medir su RSS")
+    parser.add_argument("--request-timeout", type=float, default=60.0, help="Timeout HTTP por petición")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la mezcla de peticiones")
+    parser.add_argument("--report", default="load-report.json", help="Fichero del reporte JSON ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    if not HTTPX_AVAILABLE:
+        parser.error("httpx is required: pip install httpx")
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = asyncio.run(_main_async(args))
+    output = json.dumps(report, indent=2)
+    if args.report == "-":
+        print(output)
+    else:
+        Path(args.report).write_text(output + "\n", encoding="utf-8")
+        overall = report["overall"]
+        print(f"📊 {overall['requests']} requests, {overall['throughput_rps']} req/s, "
+              f"p50={overall['latency_ms']['p50']}ms p95={overall['latency_ms']['p95']}ms "
+              f"p99={overall['latency_ms']['p99']}ms, errors={overall['error_rate']:.1%}, "
+              f"peak RSS={report['app']['peak_rss_mb']}MB -> {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Metrics - Métricas Prometheus sin dependencias externas
+
+Contadores, gauges e histogramas con etiquetas y su exposición en el formato
+de texto de Prometheus (``text/plain; version=0.0.4``) para ``/metrics``.
+La API sigue la de ``prometheus_client`` (``metric.labels(...).inc()``) pero
+no hace falta instalar nada en los equipos de campo.
+
+Las métricas de la validación se definen aquí, en un único registro:
+
+- Latencia por comando y tipo de comando (master = DMU, remote = DRU) a
+  partir de ``CommandTestResult.duration_ms``
+- Resultados PASS/FAIL/TIMEOUT/ERROR
+- Latencia de conexión frente a latencia de respuesta (modo live)
+- Batches en curso y latencia de escritura del historial
+
+Las observaciones pueden venir de cualquier hilo (executors, escritor de
+resultados): cada métrica protege sus valores con un lock.
+"""
+
+import math
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .hex_frames import FRAME_REGISTRY
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Segundos: de respuestas de pocos ms en LAN a timeouts de varios segundos
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+# ==================== MÉTRICAS ====================
+
+class _Metric:
+    """Base común: nombre, ayuda, etiquetas y valores por combinación de etiquetas"""
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def labels(self, *values: Any, **kwargs: Any) -> "_Child":
+        """Serie de una combinación de etiquetas (por posición o por nombre)."""
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return _Child(self, tuple(str(getattr(value, "value", value)) for value in values))
+
+    def _key(self) -> Tuple[str, ...]:
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use labels()")
+        return ()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted((key, self._snapshot(value)) for key, value in self._values.items())
+        for key, value in items:
+            lines.extend(self._render_series(key, value))
+        return lines
+
+    def _snapshot(self, value: Any) -> Any:
+        return value
+
+    def _render_series(self, key: Tuple[str, ...], value: Any) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _Child:
+    """Una serie concreta (métrica + valores de etiquetas)"""
+
+    def __init__(self, metric: _Metric, key: Tuple[str, ...]):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+
+class Counter(_Metric):
+    """Valor que sólo crece"""
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._inc(self._key(), amount)
+
+    def _inc(self, key: Tuple[str, ...], amount: float) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Valor que sube y baja"""
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._inc(self._key(), amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._inc(self._key(), -amount)
+
+    def set(self, value: float) -> None:
+        self._set(self._key(), value)
+
+    @contextmanager
+    def track_inprogress(self):
+        """Suma 1 mientras dura el bloque ``with``."""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def _inc(self, key: Tuple[str, ...], amount: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _set(self, key: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Distribución por buckets acumulativos, con suma y cuenta"""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float) -> None:
+        self._observe(self._key(), value)
+
+    def _observe(self, key: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def _snapshot(self, value: Any) -> Any:
+        return [list(value[0]), value[1], value[2]]
+
+    def _render_series(self, key: Tuple[str, ...], value: Any) -> List[str]:
+        counts, total, count = value
+        labels = _format_labels(self.labelnames, key)
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            le = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+# ==================== REGISTRO ====================
+
+class MetricsRegistry:
+    """Conjunto de métricas que se exponen juntas"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Todas las métricas en formato de texto Prometheus."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+COMMAND_DURATION = REGISTRY.histogram(
+    "drs_command_duration_seconds",
+    "Duration of each validated command (command_type master = DMU, remote = DRU)",
+    ("command", "command_type", "mode")
+)
+COMMAND_RESULTS = REGISTRY.counter(
+    "drs_command_results_total",
+    "Validated commands by outcome (PASS, FAIL, TIMEOUT, ERROR)",
+    ("command_type", "mode", "status")
+)
+CONNECT_DURATION = REGISTRY.histogram(
+    "drs_connect_duration_seconds",
+    "TCP connect time to the device spent inside a command (live mode)",
+    ("command_type",)
+)
+RESPONSE_DURATION = REGISTRY.histogram(
+    "drs_response_duration_seconds",
+    "Time from sending a frame to receiving the device response (live mode)",
+    ("command_type",)
+)
+BATCHES_IN_FLIGHT = REGISTRY.gauge(
+    "drs_batches_in_flight",
+    "Batch validations currently running"
+)
+JOB_QUEUE_JOBS = REGISTRY.gauge(
+    "drs_job_queue_jobs",
+    "Background validation jobs by state",
+    ("state",)
+)
+EXECUTOR_QUEUED = REGISTRY.gauge(
+    "drs_executor_queued_calls",
+    "Blocking calls waiting for a thread",
+    ("executor",)
+)
+EXECUTOR_ACTIVE = REGISTRY.gauge(
+    "drs_executor_active_calls",
+    "Blocking calls running on the pool",
+    ("executor",)
+)
+EXECUTOR_REJECTED = REGISTRY.counter(
+    "drs_executor_rejected_calls_total",
+    "Blocking calls rejected because the pool queue was full",
+    ("executor",)
+)
+RESULT_WRITER_PENDING = REGISTRY.gauge(
+    "drs_result_writer_pending",
+    "Results queued for the history database and not yet committed"
+)
+RESULT_STORE_FLUSH_DURATION = REGISTRY.histogram(
+    "drs_result_store_flush_seconds",
+    "Time to commit one batch of results to the history database"
+)
+RESULT_STORE_FLUSH_SIZE = REGISTRY.histogram(
+    "drs_result_store_flush_size",
+    "Results committed per history database transaction",
+    buckets=(1, 2, 5, 10, 25, 50, 100)
+)
+
+
+def observe_command_result(result: Any, mode: str) -> None:
+    """Registra un ``CommandTestResult`` en las métricas de comandos."""
+    command_type = getattr(result.command_type, "value", result.command_type)
+    # Sólo nombres del registro como etiqueta: los comandos pedidos por el usuario no acotan la cardinalidad
+    command = result.command if result.command in FRAME_REGISTRY.get(command_type, {}) else "unknown"
+    COMMAND_DURATION.labels(command, command_type, mode).observe(result.duration_ms / 1000)
+    COMMAND_RESULTS.labels(command_type, mode, result.status).inc()
+    if getattr(result, "connect_ms", 0):
+        CONNECT_DURATION.labels(command_type).observe(result.connect_ms / 1000)
+    if getattr(result, "request_ms", 0):
+        RESPONSE_DURATION.labels(command_type).observe(result.request_ms / 1000)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Mock Profiles - Duraciones simuladas sin esperas reales
+
+El modo mock no toca ningún socket, así que esperar con ``time.sleep`` sólo
+bloquea el hilo (y el handler de la API) sin medir nada. Los perfiles
+calculan una duración *virtual* por comando y la devuelven al instante:
+
+- ``fast``: duraciones sintéticas deterministas (mismo comando, misma
+  duración), derivadas de los bytes en el cable: trama enviada más la
+  respuesta capturada del comando (de 3 ms para las respuestas de 11 bytes
+  a 11 ms para ``channel_frequency_configuration``). Ideal para CI.
+- ``realistic``: latencias muestreadas de una distribución registrada. Se
+  carga al arrancar desde ``MOCK_LATENCY_SAMPLES`` (un reporte live
+  guardado, una lista JSON de ms o la captura JSONL del
+  drs_response_collector); sin ella se usa una rejilla sintética que
+  aproxima el rango 50-200 ms del mock anterior. Tampoco duerme: el tiempo
+  es virtual.
+
+Con cualquiera de los dos, el throughput del modo mock lo limita la CPU,
+no el reloj.
+"""
+
+import json
+import logging
+import os
+import random
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .hex_frames import FRAME_REGISTRY
+from .real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES
+
+logger = logging.getLogger(__name__)
+
+
+class MockProfile(Enum):
+    """Perfiles de ejecución del modo mock"""
+    FAST = "fast"
+    REALISTIC = "realistic"
+
+
+DEFAULT_MOCK_PROFILE = MockProfile.FAST
+
+# Duración sintética del perfil fast: base + coste por byte en el cable
+# (petición + respuesta). Las tramas de petición Master/Remote miden todas
+# 10 bytes, así que lo que distingue a los comandos es su respuesta
+FAST_BASE_MS = 1
+FAST_BYTES_PER_MS = 8
+
+# Longitud de la respuesta capturada de cada comando (Master y Remote comparten formato)
+RESPONSE_BYTES: Dict[str, int] = {
+    command: len(bytes.fromhex(response.replace(" ", ""))) for command, response in REAL_DRS_RESPONSES.items()
+}
+
+# Distribución por defecto del perfil realistic (ms) si no hay una registrada;
+# aproxima el rango uniforme 50-200 ms que usaba el mock con time.sleep
+DEFAULT_LATENCY_SAMPLES_MS: Sequence[float] = tuple(float(ms) for ms in range(50, 201, 5))
+
+# Distribución registrada cargada con configure_latency_samples()
+_recorded_samples: Optional[Tuple[float, ...]] = None
+_recorded_source: Optional[str] = None
+
+
+def load_latency_samples(path: Union[str, Path]) -> List[float]:
+    """
+    Carga una distribución de latencias registrada.
+
+    Acepta una lista JSON de números (ms), un reporte de batch live
+    guardado, del que se toman ``request_ms`` (o ``duration_ms``) de cada
+    resultado, o la captura JSONL del drs_response_collector (``request_ms``
+    de cada comando respondido). Un reporte de flota aporta las muestras de
+    todos sus dispositivos.
+
+    Raises:
+        ValueError: Si el archivo no contiene ninguna muestra
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        # Captura JSONL: una línea por comando (se ignoran líneas cortadas)
+        data = []
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("success") and record.get("request_ms"):
+                data.append(record["request_ms"])
+
+    if isinstance(data, list):
+        samples = [float(value) for value in data if isinstance(value, (int, float))]
+    else:
+        reports = data.get("devices", [data])
+        samples = []
+        for report in reports:
+            for result in report.get("results", []):
+                value = result.get("request_ms") or result.get("duration_ms")
+                if value:
+                    samples.append(float(value))
+
+    if not samples:
+        raise ValueError(f"No latency samples found in {path}")
+    return samples
+
+
+def configure_latency_samples(path: Union[str, Path]) -> int:
+    """
+    Usa la distribución registrada en ``path`` como defecto del perfil realistic.
+
+    Returns:
+        Número de muestras cargadas
+
+    Raises:
+        ValueError: Si el archivo no contiene ninguna muestra
+    """
+    global _recorded_samples, _recorded_source
+    _recorded_samples = tuple(load_latency_samples(path))
+    _recorded_source = str(path)
+    return len(_recorded_samples)
+
+
+def configure_latency_samples_from_env() -> Optional[int]:
+    """
+    Carga la distribución de ``MOCK_LATENCY_SAMPLES`` si está definida.
+
+    Un archivo ilegible se registra como aviso y se sigue con la rejilla
+    por defecto: el modo mock no debe impedir el arranque.
+    """
+    path = os.environ.get("MOCK_LATENCY_SAMPLES")
+    if not path:
+        return None
+    try:
+        count = configure_latency_samples(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ MOCK_LATENCY_SAMPLES no se pudo cargar ({path}): {e}")
+        return None
+    logger.info(f"✅ Perfil mock realistic: {count} latencias registradas de {path}")
+    return count
+
+
+def reset_latency_samples() -> None:
+    """Vuelve a la rejilla sintética por defecto."""
+    global _recorded_samples, _recorded_source
+    _recorded_samples = None
+    _recorded_source = None
+
+
+class MockLatencyModel:
+    """Genera la duración virtual de cada comando mock según el perfil."""
+
+    def __init__(
+        self,
+        profile: Union[str, MockProfile] = DEFAULT_MOCK_PROFILE,
+        samples: Optional[Sequence[float]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            profile: "fast" o "realistic"
+            samples: Latencias registradas (ms) para el perfil realistic
+                (por defecto las de ``configure_latency_samples`` o la rejilla sintética)
+            seed: Semilla para muestreo reproducible
+
+        Raises:
+            ValueError: Si el perfil no existe
+        """
+        self.profile = profile if isinstance(profile, MockProfile) else MockProfile(str(profile).lower())
+        if samples:
+            self.samples, self.source = tuple(samples), "custom"
+        elif _recorded_samples:
+            self.samples, self.source = _recorded_samples, _recorded_source
+        else:
+            self.samples, self.source = tuple(DEFAULT_LATENCY_SAMPLES_MS), "default"
+        self._random = random.Random(seed)
+
+    def duration_ms(self, command: str, command_type: str) -> int:
+        """Duración virtual (ms, siempre > 0) de un comando."""
+        if self.profile is MockProfile.FAST:
+            frame = FRAME_REGISTRY.get(command_type, {}).get(command, b"")
+            return FAST_BASE_MS + (len(frame) + RESPONSE_BYTES.get(command, 0)) // FAST_BYTES_PER_MS
+        return max(1, int(round(self._random.choice(self.samples))))
+
+    def describe(self) -> Dict[str, Any]:
+        """Metadatos del perfil para el reporte del batch."""
+        info: Dict[str, Any] = {"profile": self.profile.value, "virtual_time": True}
+        if self.profile is MockProfile.REALISTIC:
+            info["source"] = self.source
+            info["samples"] = len(self.samples)
+            info["min_ms"] = min(self.samples)
+            info["max_ms"] = max(self.samples)
+        return info
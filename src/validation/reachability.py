@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Reachability - Sondeo de alcanzabilidad asyncio sin procesos ``ping``
+
+Sustituye las llamadas a ``subprocess.run(["ping", ...])``: lanzar un
+proceso por sonda cuesta milisegundos y un slot de proceso, y no escala a
+barrer un sitio entero. Aquí todo ocurre dentro del proceso:
+
+- ICMP echo con sockets datagrama no privilegiados (``SOCK_DGRAM`` +
+  ``IPPROTO_ICMP``) cuando el sistema lo permite (Linux:
+  ``net.ipv4.ping_group_range``; macOS siempre)
+- Connect TCP al puerto Santone (65050) como alternativa; un RST también
+  prueba que el equipo está vivo
+- Si ICMP está disponible se lanzan ambas sondas a la vez y gana la primera
+  respuesta: un equipo que filtra ICMP no paga un timeout extra
+- Muchos hosts en paralelo con RTT por host, acotados por un semáforo
+
+Los resultados se presentan con la forma de test "Network Ping" que ya usan
+los validadores.
+"""
+
+import asyncio
+import itertools
+import os
+import socket
+import struct
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .santone_session import DRS_PORT
+
+DEFAULT_PROBE_TIMEOUT = 3.0
+DEFAULT_MAX_CONCURRENT_PROBES = 256
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_HEADER = struct.Struct("!BBHHH")
+ICMP_PAYLOAD = b"drs-validator"
+
+_sequence = itertools.count(1)
+_icmp_available: Optional[bool] = None
+
+
+@dataclass
+class ProbeResult:
+    """Resultado de sondear un host"""
+    ip_address: str
+    reachable: bool
+    method: str                      # "icmp", "tcp" o "none"
+    rtt_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_test_dict(self) -> Dict[str, Any]:
+        """Resultado con la forma del test "Network Ping" de los validadores."""
+        duration = int(round(self.rtt_ms)) if self.rtt_ms is not None else 0
+        if self.reachable:
+            return {
+                "name": "Network Ping",
+                "status": "PASS",
+                "message": f"✅ Device {self.ip_address} is reachable",
+                "details": f"{self.method.upper()} reply in {self.rtt_ms:.1f}ms",
+                "duration_ms": duration
+            }
+        return {
+            "name": "Network Ping",
+            "status": "FAIL",
+            "message": f"❌ Device {self.ip_address} is not reachable",
+            "details": f"{self.error or 'No reply'} - check network cable, device power, and IP configuration",
+            "duration_ms": duration
+        }
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def build_echo_request(identifier: int, sequence: int, payload: bytes = ICMP_PAYLOAD) -> bytes:
+    """Paquete ICMP echo request (con checksum; el kernel puede reescribir el id)."""
+    header = ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = _checksum(header + payload)
+    return ICMP_HEADER.pack(ICMP_ECHO_REQUEST, 0, checksum, identifier, sequence) + payload
+
+
+def _open_icmp_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    sock.setblocking(False)
+    return sock
+
+
+def icmp_available() -> bool:
+    """True si este proceso puede abrir sockets ICMP no privilegiados (se cachea)."""
+    global _icmp_available
+    if _icmp_available is None:
+        try:
+            _open_icmp_socket().close()
+            _icmp_available = True
+        except OSError:
+            _icmp_available = False
+    return _icmp_available
+
+
+class ReachabilityProber:
+    """
+    Sondeo asyncio de alcanzabilidad por ICMP y/o TCP.
+
+    Uso::
+
+        prober = ReachabilityProber(timeout=2.0)
+        result = await prober.probe("192.168.11.22")
+        results = await prober.probe_many(["10.0.0.1", "10.0.0.2"])
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        tcp_port: int = DRS_PORT,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_PROBES,
+        use_icmp: Optional[bool] = None
+    ):
+        """
+        Args:
+            timeout: Segundos de espera por host
+            tcp_port: Puerto del connect TCP
+            max_concurrent: Sondas en vuelo como máximo en ``probe_many``
+            use_icmp: Forzar (True) o desactivar (False) ICMP; None = si está permitido
+        """
+        self.timeout = timeout
+        self.tcp_port = tcp_port
+        self.max_concurrent = max(1, max_concurrent)
+        self.use_icmp = icmp_available() if use_icmp is None else use_icmp
+
+    async def probe(self, ip_address: str) -> ProbeResult:
+        """Sondea un host; nunca lanza excepción."""
+        probes = [asyncio.create_task(self._guarded("tcp", ip_address, self._probe_tcp(ip_address)))]
+        if self.use_icmp:
+            probes.append(asyncio.create_task(self._guarded("icmp", ip_address, self._probe_icmp(ip_address))))
+
+        failures: List[ProbeResult] = []
+        try:
+            for next_done in asyncio.as_completed(probes):
+                result = await next_done
+                if result.reachable:
+                    return result
+                failures.append(result)
+        finally:
+            for task in probes:
+                task.cancel()
+
+        errors = "; ".join(f"{failure.method}: {failure.error}" for failure in failures)
+        return ProbeResult(ip_address, False, "none", max(f.rtt_ms or 0 for f in failures), errors)
+
+    async def probe_many(self, ip_addresses: Iterable[str]) -> List[ProbeResult]:
+        """Sondea muchos hosts en paralelo (como mucho ``max_concurrent`` a la vez)."""
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def bounded(ip_address: str) -> ProbeResult:
+            async with semaphore:
+                return await self.probe(ip_address)
+
+        return list(await asyncio.gather(*(bounded(ip) for ip in ip_addresses)))
+
+    # ==================== SONDAS ====================
+
+    @staticmethod
+    async def _guarded(method: str, ip_address: str, probe) -> ProbeResult:
+        """Un fallo inesperado de una sonda cuenta como sonda fallida, no como excepción."""
+        start = time.perf_counter()
+        try:
+            return await probe
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return ProbeResult(ip_address, False, method, _elapsed_ms(start), f"{type(e).__name__}: {e}")
+
+    async def _probe_tcp(self, ip_address: str) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip_address, self.tcp_port), timeout=self.timeout
+            )
+        except ConnectionRefusedError:
+            # El equipo respondió con RST: está vivo aunque el puerto esté cerrado
+            return ProbeResult(ip_address, True, "tcp", _elapsed_ms(start), f"port {self.tcp_port} closed")
+        except asyncio.TimeoutError:
+            return ProbeResult(ip_address, False, "tcp", _elapsed_ms(start), "timeout")
+        except OSError as e:
+            return ProbeResult(ip_address, False, "tcp", _elapsed_ms(start), e.strerror or str(e))
+
+        rtt_ms = _elapsed_ms(start)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return ProbeResult(ip_address, True, "tcp", rtt_ms)
+
+    async def _probe_icmp(self, ip_address: str) -> ProbeResult:
+        loop = asyncio.get_running_loop()
+        sequence = next(_sequence) & 0xFFFF
+        start = time.perf_counter()
+        try:
+            sock = _open_icmp_socket()
+        except OSError as e:
+            return ProbeResult(ip_address, False, "icmp", 0.0, e.strerror or str(e))
+
+        try:
+            # sendto directo sobre el socket no bloqueante (loop.sock_sendto es de Python 3.11):
+            # un datagrama ICMP cabe siempre en el buffer de envío
+            sock.sendto(build_echo_request(os.getpid() & 0xFFFF, sequence), (ip_address, 0))
+            deadline = start + self.timeout
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                reply = await asyncio.wait_for(loop.sock_recv(sock, 1024), timeout=remaining)
+                # Los sockets datagrama ICMP entregan la respuesta sin cabecera IP
+                if len(reply) >= ICMP_HEADER.size:
+                    reply_type, _, _, _, reply_sequence = ICMP_HEADER.unpack_from(reply)
+                    if reply_type == ICMP_ECHO_REPLY and reply_sequence == sequence:
+                        return ProbeResult(ip_address, True, "icmp", _elapsed_ms(start))
+        except asyncio.TimeoutError:
+            return ProbeResult(ip_address, False, "icmp", _elapsed_ms(start), "timeout")
+        except OSError as e:
+            return ProbeResult(ip_address, False, "icmp", _elapsed_ms(start), e.strerror or str(e))
+        finally:
+            sock.close()
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def probe_host(ip_address: str, timeout: float = DEFAULT_PROBE_TIMEOUT, tcp_port: int = DRS_PORT) -> ProbeResult:
+    """
+    Versión síncrona para validadores síncronos.
+
+    Crea su propio event loop, así que debe llamarse desde un hilo sin loop
+    en marcha (p.ej. dentro de un BlockingExecutor), nunca desde un handler async.
+    """
+    return asyncio.run(ReachabilityProber(timeout=timeout, tcp_port=tcp_port).probe(ip_address))
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+"""
+Result Archive - Archivo comprimido JSON Lines con rotación y retención
+
+La base SQLite (``result_store``) guarda el historial "caliente"; los
+resultados antiguos se mueven a segmentos de solo-añadir para que el disco
+no crezca sin límite y el backup copie unos pocos archivos grandes en lugar
+de miles de JSON pequeños.
+
+- Segmentos ``results-<fecha>.jsonl.gz`` (o ``.jsonl.zst`` si está
+  instalado ``zstandard``): un resultado por línea, comprimidos por bloques;
+  cada bloque es un miembro gzip/frame zstd independiente, así que
+  ``zcat``/``zstdcat`` del segmento entero da el JSONL completo
+- Rotación por tamaño (``max_segment_bytes``) y por antigüedad
+  (``max_segment_age``): un segmento cerrado no se vuelve a tocar
+- Índice por segmento (``<segmento>.idx``, JSONL sin comprimir) con los
+  metadatos de cada resultado y el desplazamiento de su bloque: el historial
+  filtra sobre el índice y la lectura de un resultado descomprime un solo
+  bloque de un solo segmento
+- Retención: se borran los segmentos cuyo resultado más reciente es más
+  antiguo que ``retention_days``
+
+Uso::
+
+    archive = ResultArchive(RESULTS_DIR / "archive")
+    archive.archive_store(store, before="2025-09-01T00:00:00")
+    archive.apply_retention(365)
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .result_store import HISTORY_FIELDS, HISTORY_FILTERS, ResultStore, decode_cursor, encode_cursor
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_SEGMENT_AGE = timedelta(days=1)
+DEFAULT_BLOCK_BYTES = 256 * 1024  # Datos sin comprimir por bloque
+DEFAULT_ARCHIVE_BATCH = 500
+
+SEGMENT_PREFIX = "results-"
+SEGMENT_TIME_FORMAT = "%Y%m%dT%H%M%S"
+INDEX_SUFFIX = ".idx"
+EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _index_entry(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadatos planos de un resultado (la forma de ``ResultStore.history``)."""
+    request = record.get("request", {})
+    return {
+        "id": record.get("id"),
+        "run_id": record.get("run_id"),
+        "timestamp": record.get("timestamp"),
+        "ip_address": request.get("ip_address"),
+        "device_type": request.get("device_type"),
+        "hostname": request.get("hostname"),
+        "scenario_id": request.get("scenario_id"),
+        "mode": request.get("mode"),
+        "status": record.get("overall_status"),
+        "duration_ms": record.get("duration_ms"),
+        "total_commands": record.get("total_commands"),
+        "passed_commands": record.get("passed_commands"),
+        "filename": record.get("filename"),
+    }
+
+
+class Segment:
+    """Un segmento del archivo y su índice en memoria"""
+
+    def __init__(self, path: Path, compression: str, created: datetime):
+        self.path = path
+        self.compression = compression
+        self.created = created
+        self.entries: List[Dict[str, Any]] = []
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + INDEX_SUFFIX)
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def add_entries(self, entries: List[Dict[str, Any]]) -> None:
+        self.entries.extend(entries)
+        timestamps = [entry["timestamp"] for entry in entries if entry.get("timestamp")]
+        if timestamps:
+            self.first_timestamp = min([self.first_timestamp or timestamps[0]] + timestamps)
+            self.last_timestamp = max([self.last_timestamp or timestamps[0]] + timestamps)
+
+    def overlaps(self, since: Optional[str], until: Optional[str]) -> bool:
+        if not self.entries:
+            return False
+        if since and self.last_timestamp < since:
+            return False
+        if until and self.first_timestamp >= until:
+            return False
+        return True
+
+    def read_block(self, offset: int, size: int) -> List[str]:
+        """Líneas JSON de un bloque (sólo se lee y descomprime ese bloque)."""
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        return _decompress(data, self.compression).decode("utf-8").splitlines()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.path.name,
+            "compression": self.compression,
+            "records": len(self.entries),
+            "bytes": self.size,
+            "created": self.created.isoformat(),
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+        }
+
+
+class ResultArchive:
+    """
+    Archivo de resultados en segmentos JSONL comprimidos.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_age: timedelta = DEFAULT_MAX_SEGMENT_AGE,
+        compression: str = "gzip",
+        block_bytes: int = DEFAULT_BLOCK_BYTES
+    ):
+        """
+        Args:
+            directory: Directorio de los segmentos (se crea si no existe)
+            max_segment_bytes: Tamaño comprimido a partir del cual se abre un segmento nuevo
+            max_segment_age: Antigüedad a partir de la cual se abre un segmento nuevo
+            compression: "gzip" o "zstd" (si no está instalado se usa gzip)
+            block_bytes: Datos sin comprimir por bloque (granularidad de lectura)
+        """
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard is not installed, archiving with gzip")
+            compression = "gzip"
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.compression = compression
+        self.block_bytes = max(1, block_bytes)
+        self._lock = threading.RLock()
+        self._segments: Optional[List[Segment]] = None
+
+    # ==================== SEGMENTOS ====================
+
+    def segments(self) -> List[Segment]:
+        """Segmentos existentes, del más antiguo al más reciente (índices cargados una vez)."""
+        with self._lock:
+            if self._segments is None:
+                self._segments = [self._load_segment(path) for path in self._segment_paths()]
+            return list(self._segments)
+
+    def _segment_paths(self) -> List[Path]:
+        paths = []
+        for compression, extension in EXTENSIONS.items():
+            if compression == "zstd" and not ZSTD_AVAILABLE:
+                continue
+            paths.extend(self.directory.glob(f"{SEGMENT_PREFIX}*{extension}"))
+        return sorted(paths, key=lambda path: path.name)
+
+    def _load_segment(self, path: Path) -> Segment:
+        compression = "zstd" if path.name.endswith(EXTENSIONS["zstd"]) else "gzip"
+        stamp = path.name[len(SEGMENT_PREFIX):].split(".", 1)[0].split("-", 1)[0]
+        try:
+            created = datetime.strptime(stamp, SEGMENT_TIME_FORMAT)
+        except ValueError:
+            created = datetime.fromtimestamp(path.stat().st_mtime)
+
+        segment = Segment(path, compression, created)
+        if segment.index_path.exists():
+            with open(segment.index_path, "r", encoding="utf-8") as f:
+                segment.add_entries([json.loads(line) for line in f if line.strip()])
+        return segment
+
+    def _writable_segment(self, now: datetime) -> Segment:
+        """Segmento abierto, o uno nuevo si el último ha superado tamaño o antigüedad."""
+        segments = self.segments()
+        if segments:
+            current = segments[-1]
+            if (current.compression == self.compression
+                    and current.size < self.max_segment_bytes
+                    and now - current.created < self.max_segment_age):
+                return current
+
+        name = f"{SEGMENT_PREFIX}{now.strftime(SEGMENT_TIME_FORMAT)}"
+        path = self.directory / f"{name}{EXTENSIONS[self.compression]}"
+        sequence = 1
+        while path.exists():
+            path = self.directory / f"{name}-{sequence}{EXTENSIONS[self.compression]}"
+            sequence += 1
+        segment = Segment(path, self.compression, now)
+        self._segments.append(segment)
+        logger.info("Opened archive segment %s", path.name)
+        return segment
+
+    # ==================== ESCRITURA ====================
+
+    def append(self, records: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> int:
+        """
+        Añade resultados (con la forma de ``ResultStore.get``) al segmento abierto.
+
+        Returns:
+            Resultados escritos
+        """
+        records = list(records)
+        if not records:
+            return 0
+
+        with self._lock:
+            segment = self._writable_segment(now or datetime.now())
+            entries = []
+            with open(segment.path, "ab") as data_file:
+                for block in self._blocks(records):
+                    data = "".join(line + "\n" for _, line in block).encode("utf-8")
+                    compressed = _compress(data, segment.compression)
+                    offset = data_file.tell()
+                    data_file.write(compressed)
+                    for line_number, (record, _) in enumerate(block):
+                        entries.append({
+                            **_index_entry(record), "offset": offset, "size": len(compressed), "line": line_number
+                        })
+                data_file.flush()
+                os.fsync(data_file.fileno())
+
+            # El índice se escribe después de los datos: tras un corte, un bloque
+            # sin índice sólo ocupa espacio, nunca apunta a datos incompletos
+            with open(segment.index_path, "a", encoding="utf-8") as index_file:
+                for entry in entries:
+                    index_file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                index_file.flush()
+                os.fsync(index_file.fileno())
+            segment.add_entries(entries)
+        return len(records)
+
+    def _blocks(self, records: List[Dict[str, Any]]) -> Iterable[List[Tuple[Dict[str, Any], str]]]:
+        """Agrupa (resultado, línea JSON) en bloques de ~``block_bytes``."""
+        block, block_size = [], 0
+        for record in records:
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+            block.append((record, line))
+            block_size += len(line)
+            if block_size >= self.block_bytes:
+                yield block
+                block, block_size = [], 0
+        if block:
+            yield block
+
+    def archive_store(self, store: ResultStore, before: str, batch_size: int = DEFAULT_ARCHIVE_BATCH) -> int:
+        """
+        Mueve al archivo los resultados de ``store`` anteriores a ``before``.
+
+        Cada lote se borra de la base (en una sola transacción) sólo después de
+        quedar escrito en disco. Si un corte anterior dejó resultados en el archivo
+        sin borrarlos de la base, al reanudar no se vuelven a escribir: sólo se borran.
+
+        Returns:
+            Resultados archivados
+        """
+        archived = self.archived_ids()
+        total = 0
+        while True:
+            records = store.oldest(before, limit=batch_size)
+            if not records:
+                break
+            pending = [record for record in records if record["id"] not in archived]
+            self.append(pending)
+            archived.update(record["id"] for record in pending)
+            store.delete([record["id"] for record in records if record["id"] in archived])
+            total += len(pending)
+        if total:
+            logger.info("Archived %d results older than %s", total, before)
+        return total
+
+    def archived_ids(self) -> Set[int]:
+        """Ids internos de todos los resultados indexados en el archivo."""
+        return {entry["id"] for segment in self.segments() for entry in segment.entries}
+
+    # ==================== RETENCIÓN ====================
+
+    def apply_retention(self, retention_days: int, now: Optional[datetime] = None) -> List[str]:
+        """
+        Borra los segmentos cuyo resultado más reciente supera la retención.
+
+        Returns:
+            Nombres de los segmentos borrados
+        """
+        cutoff = ((now or datetime.now()) - timedelta(days=retention_days)).isoformat()
+        removed = []
+        with self._lock:
+            for segment in self.segments():
+                if segment.entries and segment.last_timestamp < cutoff:
+                    segment.path.unlink(missing_ok=True)
+                    segment.index_path.unlink(missing_ok=True)
+                    self._segments.remove(segment)
+                    removed.append(segment.path.name)
+        if removed:
+            logger.info("Removed %d archive segments older than %s", len(removed), cutoff)
+        return removed
+
+    # ==================== LECTURA ====================
+
+    def get(self, run_pk: int) -> Optional[Dict[str, Any]]:
+        """Resultado archivado por id interno (descomprime un solo bloque)."""
+        for segment in reversed(self.segments()):
+            for entry in segment.entries:
+                if entry["id"] == run_pk:
+                    return json.loads(segment.read_block(entry["offset"], entry["size"])[entry["line"]])
+        return None
+
+    def history(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters: Any
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Página del historial archivado con la misma interfaz que ``ResultStore.history``.
+
+        El filtrado se hace sobre los índices; sólo se descomprimen los bloques
+        de los resultados devueltos (ninguno si ``fields`` no incluye ``result``).
+
+        Raises:
+            ValueError: Si un campo o el cursor no son válidos
+        """
+        if fields:
+            fields = list(dict.fromkeys(fields))
+            unknown = [name for name in fields if name not in HISTORY_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        position = decode_cursor(cursor) if cursor else None
+        wanted = {name: value for name, value in filters.items() if name in HISTORY_FILTERS and value}
+
+        matches = []
+        for segment in self.segments():
+            if not segment.overlaps(since, until):
+                continue
+            for entry in segment.entries:
+                timestamp = entry["timestamp"]
+                if since and timestamp < since or until and timestamp >= until:
+                    continue
+                if position and (timestamp, entry["id"]) >= position:
+                    continue
+                if any(entry.get(name) != value for name, value in wanted.items()):
+                    continue
+                matches.append((segment, entry))
+
+        matches.sort(key=lambda match: (match[1]["timestamp"], match[1]["id"]), reverse=True)
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            last = matches[-1][1]
+            next_cursor = encode_cursor(last["timestamp"], last["id"])
+
+        if fields and "result" not in fields:
+            return [{name: entry.get(name) for name in fields} for _, entry in matches], next_cursor
+
+        blocks: Dict[Tuple[str, int], List[str]] = {}
+        records = []
+        for segment, entry in matches:
+            key = (segment.path.name, entry["offset"])
+            if key not in blocks:
+                blocks[key] = segment.read_block(entry["offset"], entry["size"])
+            record = json.loads(blocks[key][entry["line"]])
+            record.pop("commands", None)
+            if fields:
+                record = {name: record["result"] if name == "result" else entry.get(name) for name in fields}
+            records.append(record)
+        return records, next_cursor
+
+    def stats(self) -> Dict[str, Any]:
+        """Tamaño y contenido del archivo."""
+        segments = self.segments()
+        return {
+            "directory": str(self.directory),
+            "compression": self.compression,
+            "segments": len(segments),
+            "records": sum(len(segment.entries) for segment in segments),
+            "bytes": sum(segment.size for segment in segments),
+            "first_timestamp": segments[0].first_timestamp if segments else None,
+            "last_timestamp": segments[-1].last_timestamp if segments else None,
+        }
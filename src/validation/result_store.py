@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+"""
+Result Store - Historial de validaciones en SQLite
+
+Sustituye el "un JSON indentado por ejecución" de ``RESULTS_DIR``: con
+decenas de miles de archivos, cada consulta del historial hacía un glob, un
+``stat()`` por archivo, una ordenación completa y parseaba todos los
+seleccionados. Aquí el historial es una consulta indexada.
+
+- SQLite en modo WAL: lectores concurrentes mientras se escribe
+- Tabla ``runs`` con índices por fecha, IP, tipo de dispositivo, escenario y
+  estado (todos combinados con la fecha para ordenar sin sort)
+- Tabla ``command_results`` con una fila por comando/test de cada ejecución
+- Paginación por cursor (keyset sobre ``timestamp, id``): cada página cuesta
+  lo mismo sea la primera o la milésima
+- Proyección de campos: sin ``result`` no se lee el JSON completo
+- Resumen de conteos por estado sin devolver documentos
+- Importador idempotente de los JSON existentes
+
+Cada hilo usa su propia conexión, así que el store se puede llamar desde
+los pools de ``BlockingExecutor``.
+
+Uso::
+
+    cd src
+    python -m validation.result_store import ../results --db ../results/results.db
+"""
+
+import argparse
+import base64
+import binascii
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT UNIQUE,
+    timestamp TEXT NOT NULL,
+    ip_address TEXT,
+    device_type TEXT,
+    hostname TEXT,
+    scenario_id TEXT,
+    mode TEXT,
+    overall_status TEXT,
+    duration_ms INTEGER,
+    total_commands INTEGER,
+    passed_commands INTEGER,
+    source TEXT,
+    result_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_ip_timestamp ON runs(ip_address, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_device_type_timestamp ON runs(device_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_scenario_timestamp ON runs(scenario_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_status_timestamp ON runs(overall_status, timestamp);
+
+CREATE TABLE IF NOT EXISTS command_results (
+    run_pk INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    command TEXT NOT NULL,
+    command_type TEXT,
+    status TEXT,
+    duration_ms INTEGER,
+    message TEXT,
+    error TEXT,
+    response_data TEXT,
+    decoded_json TEXT,
+    PRIMARY KEY (run_pk, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_command_results_command ON command_results(command, status);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Filtros del historial -> columna indexada
+HISTORY_FILTERS = {
+    "ip_address": "ip_address",
+    "device_type": "device_type",
+    "scenario_id": "scenario_id",
+    "status": "overall_status",
+    "mode": "mode",
+}
+
+# Campos proyectables del historial -> columna
+HISTORY_FIELDS = {
+    "id": "id",
+    "run_id": "run_id",
+    "timestamp": "timestamp",
+    "ip_address": "ip_address",
+    "device_type": "device_type",
+    "hostname": "hostname",
+    "scenario_id": "scenario_id",
+    "mode": "mode",
+    "status": "overall_status",
+    "duration_ms": "duration_ms",
+    "total_commands": "total_commands",
+    "passed_commands": "passed_commands",
+    "filename": "source",
+    "result": "result_json",
+}
+
+LEGACY_IMPORT_KEY = "legacy_json_import"
+
+
+def encode_cursor(timestamp: str, run_pk: int) -> str:
+    """Cursor opaco que apunta justo detrás de una fila (timestamp, id)."""
+    return base64.urlsafe_b64encode(f"{timestamp}|{run_pk}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        timestamp, run_pk = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return timestamp, int(run_pk)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+
+def _json_default(value: Any) -> Any:
+    """Enums por valor, el resto como texto (fechas, bytes...)."""
+    return getattr(value, "value", str(value))
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def _status_value(value: Any) -> Optional[str]:
+    value = getattr(value, "value", value)
+    return str(value) if value is not None else None
+
+
+def _command_rows(result: Dict[str, Any]) -> List[Tuple]:
+    """
+    Filas por comando de un resultado: ``results`` de un batch o ``tests``
+    de una validación de escenario.
+    """
+    rows = []
+    if isinstance(result.get("results"), list):
+        for seq, item in enumerate(result["results"]):
+            if not isinstance(item, dict):
+                continue
+            decoded = item.get("decoded_values")
+            rows.append((
+                seq, str(item.get("command", "")), _status_value(item.get("command_type")),
+                _status_value(item.get("status")), item.get("duration_ms"), item.get("message"),
+                item.get("error") or None, item.get("response_data") or None,
+                _dumps(decoded) if decoded else None
+            ))
+    elif isinstance(result.get("tests"), list):
+        for seq, test in enumerate(result["tests"]):
+            if not isinstance(test, dict):
+                continue
+            rows.append((
+                seq, str(test.get("name", "")), None, _status_value(test.get("status")),
+                test.get("duration_ms"), test.get("message"), test.get("error"), None, None
+            ))
+    return rows
+
+
+def _overall_status(result: Dict[str, Any]) -> Optional[str]:
+    return _status_value(result.get("overall_status") or result.get("status"))
+
+
+class ResultStore:
+    """
+    Almacén SQLite de resultados de validación.
+
+    Uso::
+
+        store = ResultStore(RESULTS_DIR / "results.db")
+        store.save(result, ip_address="192.168.11.22", device_type="dmu_ethernet", mode="live")
+        page, next_cursor = store.history(limit=50, status="FAIL")
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Archivo de la base de datos (se crea con su esquema si no existe)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._init_schema()
+
+    # ==================== CONEXIONES ====================
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (se abre la primera vez)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _init_schema(self) -> None:
+        connection = self._connection()
+        with connection:
+            connection.executescript(SCHEMA)
+            connection.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+
+    def close(self) -> None:
+        """Cierra las conexiones de todos los hilos."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    # ==================== ESCRITURA ====================
+
+    def save(
+        self,
+        result: Dict[str, Any],
+        ip_address: Optional[str] = None,
+        device_type: Optional[str] = None,
+        hostname: Optional[str] = None,
+        scenario_id: Optional[str] = None,
+        mode: Optional[str] = None,
+        run_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Guarda un resultado y sus filas por comando.
+
+        Los metadatos que falten se toman del propio resultado cuando existen
+        (``ip_address``, ``command_type``, ``mode``, ``scenario_id``).
+
+        Returns:
+            Id interno de la ejecución, o None si ``run_id`` ya estaba guardado
+        """
+        connection = self._connection()
+        with connection:
+            return self._insert(
+                connection, result, ip_address=ip_address, device_type=device_type, hostname=hostname,
+                scenario_id=scenario_id, mode=mode, run_id=run_id, timestamp=timestamp, source=source
+            )
+
+    def save_many(self, items: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Optional[int]]:
+        """
+        Guarda varios resultados en una sola transacción (un único commit).
+
+        Args:
+            items: Pares (resultado, metadatos de ``save``)
+
+        Returns:
+            Id interno de cada resultado, en orden (None si estaba repetido)
+        """
+        connection = self._connection()
+        with connection:
+            return [self._insert(connection, result, **metadata) for result, metadata in items]
+
+    @staticmethod
+    def _insert(
+        connection: sqlite3.Connection,
+        result: Dict[str, Any],
+        ip_address: Optional[str] = None,
+        device_type: Optional[str] = None,
+        hostname: Optional[str] = None,
+        scenario_id: Optional[str] = None,
+        mode: Optional[str] = None,
+        run_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> Optional[int]:
+        rows = _command_rows(result)
+        passed = sum(1 for row in rows if row[3] == "PASS")
+        cursor = connection.execute(
+            """INSERT OR IGNORE INTO runs (
+                run_id, timestamp, ip_address, device_type, hostname, scenario_id, mode,
+                overall_status, duration_ms, total_commands, passed_commands, source, result_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                run_id,
+                timestamp or datetime.now().isoformat(),
+                ip_address or result.get("ip_address"),
+                device_type or _status_value(result.get("command_type")),
+                hostname,
+                scenario_id or result.get("scenario_id"),
+                mode or result.get("mode"),
+                _overall_status(result),
+                result.get("duration_ms"),
+                len(rows),
+                passed,
+                source,
+                _dumps(result),
+            )
+        )
+        if cursor.rowcount == 0:
+            return None
+        run_pk = cursor.lastrowid
+        if rows:
+            connection.executemany(
+                """INSERT INTO command_results (
+                    run_pk, seq, command, command_type, status, duration_ms, message, error,
+                    response_data, decoded_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(run_pk,) + row for row in rows]
+            )
+        return run_pk
+
+    def delete(self, run_pks: Iterable[int]) -> int:
+        """Borra ejecuciones (y sus filas por comando) por id interno."""
+        run_pks = list(run_pks)
+        if not run_pks:
+            return 0
+        connection = self._connection()
+        with connection:
+            placeholders = ", ".join("?" for _ in run_pks)
+            return connection.execute(f"DELETE FROM runs WHERE id IN ({placeholders})", run_pks).rowcount
+
+    # ==================== LECTURA ====================
+
+    def _where(self, filters: Dict[str, Any], since: Optional[str], until: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for name, column in HISTORY_FILTERS.items():
+            value = filters.get(name)
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def history(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters: Any
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Página de resultados, los más recientes primero.
+
+        Sin ``fields`` cada resultado tiene la forma de los antiguos JSON
+        (``timestamp``, ``request``, ``result``) más ``id``; con ``fields``
+        es un diccionario plano con sólo esos campos (ver ``HISTORY_FIELDS``).
+
+        Args:
+            limit: Resultados por página
+            cursor: ``next_cursor`` de la página anterior (None = primera página)
+            fields: Campos a devolver
+            since / until: Rango ISO de fechas [since, until)
+            **filters: ip_address, device_type, scenario_id, status, mode
+
+        Returns:
+            (resultados, next_cursor); next_cursor es None en la última página
+
+        Raises:
+            ValueError: Si un campo o el cursor no son válidos
+        """
+        if fields:
+            fields = list(dict.fromkeys(fields))
+            unknown = [name for name in fields if name not in HISTORY_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            columns = {HISTORY_FIELDS[name] for name in fields} | {"id", "timestamp"}
+            select = ", ".join(sorted(columns))
+        else:
+            select = "*"
+
+        where, params = self._where(filters, since, until)
+        if cursor:
+            cursor_timestamp, cursor_pk = decode_cursor(cursor)
+            where += (" AND " if where else " WHERE ") + "(timestamp < ? OR (timestamp = ? AND id < ?))"
+            params += [cursor_timestamp, cursor_timestamp, cursor_pk]
+
+        # Se pide una fila de más para saber si hay página siguiente
+        rows = self._connection().execute(
+            f"SELECT {select} FROM runs{where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            params + [limit + 1]
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["timestamp"], rows[-1]["id"])
+
+        if fields:
+            records = [self._project(row, fields) for row in rows]
+        else:
+            records = [self._row_to_record(row) for row in rows]
+        return records, next_cursor
+
+    def summary(self, since: Optional[str] = None, until: Optional[str] = None, **filters: Any) -> Dict[str, Any]:
+        """Conteos por estado (sin documentos) de los resultados que cumplen los filtros."""
+        where, params = self._where(filters, since, until)
+        rows = self._connection().execute(
+            f"SELECT overall_status, COUNT(*), MIN(timestamp), MAX(timestamp) FROM runs{where} GROUP BY overall_status",
+            params
+        ).fetchall()
+        by_status = {row[0] or "UNKNOWN": row[1] for row in rows}
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "first_timestamp": min((row[2] for row in rows), default=None),
+            "last_timestamp": max((row[3] for row in rows), default=None),
+        }
+
+    def count(self, since: Optional[str] = None, until: Optional[str] = None, **filters: Any) -> int:
+        """Número de resultados que cumplen los filtros."""
+        where, params = self._where(filters, since, until)
+        return self._connection().execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def get(self, run_pk: int) -> Optional[Dict[str, Any]]:
+        """Resultado por id interno, incluidas sus filas por comando."""
+        connection = self._connection()
+        row = connection.execute("SELECT * FROM runs WHERE id = ?", (run_pk,)).fetchone()
+        if row is None:
+            return None
+        record = self._row_to_record(row)
+        record["commands"] = self.commands(run_pk)
+        return record
+
+    def commands(self, run_pk: int) -> List[Dict[str, Any]]:
+        """Filas por comando de una ejecución, en orden."""
+        rows = self._connection().execute(
+            "SELECT * FROM command_results WHERE run_pk = ? ORDER BY seq", (run_pk,)
+        ).fetchall()
+        commands = []
+        for row in rows:
+            command = {key: row[key] for key in row.keys() if key not in ("run_pk", "decoded_json")}
+            command["decoded_values"] = json.loads(row["decoded_json"]) if row["decoded_json"] else None
+            commands.append(command)
+        return commands
+
+    def oldest(self, before: str, limit: int = 500) -> List[Dict[str, Any]]:
+        """Resultados anteriores a ``before``, los más antiguos primero, con sus filas por comando."""
+        rows = self._connection().execute(
+            "SELECT * FROM runs WHERE timestamp < ? ORDER BY timestamp, id LIMIT ?", (before, limit)
+        ).fetchall()
+        records = []
+        for row in rows:
+            record = self._row_to_record(row)
+            record["commands"] = self.commands(row["id"])
+            records.append(record)
+        return records
+
+    @staticmethod
+    def _project(row: sqlite3.Row, fields: List[str]) -> Dict[str, Any]:
+        record = {}
+        for name in fields:
+            value = row[HISTORY_FIELDS[name]]
+            record[name] = json.loads(value) if name == "result" else value
+        return record
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "run_id": row["run_id"],
+            "timestamp": row["timestamp"],
+            "request": {
+                "ip_address": row["ip_address"],
+                "device_type": row["device_type"],
+                "hostname": row["hostname"],
+                "scenario_id": row["scenario_id"],
+                "mode": row["mode"],
+                "live_mode": row["mode"] == "live",
+            },
+            "overall_status": row["overall_status"],
+            "duration_ms": row["duration_ms"],
+            "total_commands": row["total_commands"],
+            "passed_commands": row["passed_commands"],
+            "filename": row["source"],
+            "result": json.loads(row["result_json"]),
+        }
+
+    # ==================== METADATOS ====================
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        connection = self._connection()
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ==================== IMPORTACIÓN ====================
+
+    def import_json_files(self, files: Iterable[Union[str, Path]]) -> Dict[str, int]:
+        """
+        Importa resultados guardados como JSON por ``save_validation_result``.
+
+        Es idempotente: cada archivo se registra con ``run_id`` ``file:<nombre>``
+        y una segunda importación lo salta.
+
+        Returns:
+            Contadores imported / skipped / failed
+        """
+        counts = {"imported": 0, "skipped": 0, "failed": 0}
+        for path in files:
+            path = Path(path)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                request = data.get("request", {})
+                result = data.get("result", data)
+                run_pk = self.save(
+                    result if isinstance(result, dict) else {"result": result},
+                    ip_address=request.get("ip_address"),
+                    device_type=request.get("device_type"),
+                    hostname=request.get("hostname"),
+                    scenario_id=request.get("scenario_id"),
+                    mode="live" if request.get("live_mode") else "mock" if "live_mode" in request else None,
+                    run_id=f"file:{path.name}",
+                    timestamp=data.get("timestamp") or datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
+                    source=path.name
+                )
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning("Could not import %s: %s", path, e)
+                counts["failed"] += 1
+                continue
+            counts["imported" if run_pk is not None else "skipped"] += 1
+        return counts
+
+    def import_legacy_directory(self, directory: Union[str, Path]) -> Optional[Dict[str, int]]:
+        """
+        Importa una sola vez los ``*.json`` de un directorio.
+
+        Returns:
+            Contadores de la importación, o None si ya se había hecho
+        """
+        if self.get_meta(LEGACY_IMPORT_KEY):
+            return None
+        counts = self.import_json_files(sorted(Path(directory).glob("*.json")))
+        self.set_meta(LEGACY_IMPORT_KEY, datetime.now().isoformat())
+        logger.info("Imported legacy JSON results from %s: %s", directory, counts)
+        return counts
+
+
+# ==================== CLI ====================
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Almacén SQLite de resultados de validación")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Importar los JSON de un directorio de resultados")
+    import_parser.add_argument("directory", help="Directorio con los *.json")
+    import_parser.add_argument("--db", help="Base de datos (por defecto <directory>/results.db)")
+
+    args = parser.parse_args(argv)
+    directory = Path(args.directory)
+    store = ResultStore(args.db or directory / "results.db")
+    counts = store.import_json_files(sorted(directory.glob("*.json")))
+    store.set_meta(LEGACY_IMPORT_KEY, datetime.now().isoformat())
+    print(f"📥 imported={counts['imported']} skipped={counts['skipped']} failed={counts['failed']} -> {store.path}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
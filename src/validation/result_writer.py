@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Result Writer - Persistencia write-behind de resultados de validación
+
+Guardar un resultado dentro de la petición añade la latencia del disco a
+cada respuesta, y en las tarjetas SD de los equipos de campo un commit
+puede tardar decenas de milisegundos. ``ResultWriter`` desacopla ambas
+cosas:
+
+- ``submit()`` sólo encola el resultado en memoria y vuelve al instante
+- Un único hilo escritor vacía la cola por lotes: todo lo que se haya
+  acumulado mientras escribía el lote anterior va en una sola transacción,
+  así que una ráfaga de N resultados cuesta unos pocos commits/fsync en
+  lugar de N
+- La cola está acotada (``max_backlog``): con el disco atascado ``submit()``
+  devuelve False en lugar de crecer sin límite y el llamador decide
+- ``stop()`` escribe todo lo pendiente antes de terminar
+- Métricas de profundidad de cola, tamaño de lote y latencia de escritura
+
+Uso::
+
+    writer = ResultWriter(store)
+    writer.submit(result, ip_address="192.168.11.22", mode="live")
+    ...
+    writer.stop()  # al apagar: vacía la cola
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import RESULT_STORE_FLUSH_DURATION, RESULT_STORE_FLUSH_SIZE
+from .result_store import ResultStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BACKLOG = 1000
+DEFAULT_BATCH_SIZE = 100
+
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    Cola write-behind delante de un ``ResultStore``.
+    """
+
+    def __init__(
+        self,
+        store: ResultStore,
+        max_backlog: int = DEFAULT_MAX_BACKLOG,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        Args:
+            store: Almacén donde se escriben los resultados
+            max_backlog: Resultados pendientes de escribir como máximo
+            batch_size: Resultados por transacción como máximo
+        """
+        self.store = store
+        self.max_backlog = max(1, max_backlog)
+        self.batch_size = max(1, batch_size)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.max_backlog)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._stopping = False
+
+        # Métricas
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.peak_queued = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # ==================== CICLO DE VIDA ====================
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Arranca el hilo escritor (idempotente)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 30.0) -> bool:
+        """
+        Escribe todo lo pendiente y para el hilo escritor.
+
+        Returns:
+            True si la cola quedó vacía dentro del ``timeout``
+        """
+        with self._lock:
+            if not self.running:
+                return self._pending == 0
+            self._stopping = True
+        # El centinela va detrás de lo ya encolado: se escribe todo antes de salir
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        stopped = not self._thread.is_alive()
+        if not stopped:
+            logger.warning("Result writer did not finish in %ss (%d pending)", timeout, self._pending)
+        return stopped and self._pending == 0
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que se haya escrito todo lo encolado hasta ahora.
+
+        Returns:
+            True si no queda nada pendiente
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    # ==================== ENCOLADO ====================
+
+    def submit(self, result: Dict[str, Any], **metadata: Any) -> bool:
+        """
+        Encola un resultado (mismos metadatos que ``ResultStore.save``).
+
+        La marca de tiempo se fija aquí, no al escribir, para que el
+        historial conserve el orden real de las ejecuciones.
+
+        Returns:
+            False si la cola está llena o el escritor se está parando
+        """
+        if self._stopping:
+            self.rejected += 1
+            return False
+        if not self.running:
+            self.start()
+
+        metadata.setdefault("timestamp", datetime.now().isoformat())
+        with self._lock:
+            try:
+                self._queue.put_nowait((result, metadata))
+            except queue.Full:
+                self.rejected += 1
+                return False
+            self._pending += 1
+            self.submitted += 1
+            self.peak_queued = max(self.peak_queued, self._queue.qsize())
+        return True
+
+    # ==================== ESCRITURA ====================
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop_after = False
+            # Se agrupa lo que ya esté esperando, sin añadir demoras
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop_after = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            if stop_after:
+                return
+
+    def _write(self, batch: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+        start = time.perf_counter()
+        written = failed = 0
+        try:
+            self.store.save_many(batch)
+            written = len(batch)
+        except Exception as e:
+            # Un resultado defectuoso no debe tirar el lote entero: se reintenta uno a uno
+            logger.warning("Batch of %d results failed (%s), retrying one by one", len(batch), e)
+            for result, metadata in batch:
+                try:
+                    self.store.save(result, **metadata)
+                    written += 1
+                except Exception as item_error:
+                    logger.error("Could not store result: %s", item_error)
+                    failed += 1
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        RESULT_STORE_FLUSH_DURATION.observe(elapsed_ms / 1000)
+        RESULT_STORE_FLUSH_SIZE.observe(len(batch))
+        with self._idle:
+            self.written += written
+            self.failed += failed
+            self.batches += 1
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self.total_flush_ms += elapsed_ms
+            self._pending -= len(batch)
+            self._idle.notify_all()
+
+    # ==================== MÉTRICAS ====================
+
+    def stats(self) -> Dict[str, Any]:
+        """Profundidad de cola, lotes y latencia de escritura."""
+        return {
+            "running": self.running,
+            "max_backlog": self.max_backlog,
+            "queued": self._queue.qsize(),
+            "pending": self._pending,
+            "peak_queued": self.peak_queued,
+            "submitted": self.submitted,
+            "written": self.written,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "average_batch_size": round((self.written + self.failed) / self.batches, 2) if self.batches else 0,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "average_flush_ms": round(self.total_flush_ms / self.batches, 2) if self.batches else 0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
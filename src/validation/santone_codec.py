@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+Santone Codec - Parseo y decodificación únicos de tramas Santone
+
+Punto único donde se interpreta una respuesta DRS. Lo usan el validador
+batch, el motor asíncrono, la integración de decoders y el tester, de modo
+que el coste de decodificar se mide y optimiza en un solo sitio.
+
+Layout de trama (sin escapes):
+
+    7E [ModFunc][ModAddr][DataType][CmdNum][Flag][Length] [Body...] [CRC_L][CRC_H] 7E
+
+- La cabecera se lee con un ``struct.Struct`` precompilado
+- El cuerpo se recorta según COMMAND_BODY_LENGTH, no con offsets fijos desde el final
+- El CRC16/XMODEM se verifica sobre ModFunc..Body
+- Los escapes (5E 7D -> 7E, 5E 5D -> 5E) se deshacen si la trama llega cruda
+- El decoder se elige por COMMAND_NUMBER en una única tabla; cada decoder
+  se registra con ``@register_decoder`` y usa formatos ``struct`` precompilados
+- Los cuerpos multicanal (16 canales) de muchos dispositivos se pueden
+  decodificar de una vez como matriz 2-D con ``decode_stacked`` (NumPy si
+  está instalado)
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .crc16 import crc16_xmodem
+from .hex_frames import COMMAND_HEX_MAP
+
+# NumPy es opcional: sólo acelera la decodificación apilada de muchos dispositivos
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+FRAME_FLAG = 0x7E
+ESCAPE_BYTE = 0x5E
+
+# ModFunc, ModAddr, DataType, CmdNum, Flag, Length
+HEADER = struct.Struct("BBBBBB")
+HEADER_OFFSET = 1
+BODY_OFFSET = HEADER_OFFSET + HEADER.size
+
+# Cabecera + CRC + flags, sin cuerpo
+MIN_FRAME_SIZE = BODY_OFFSET + 3
+
+_ESCAPED_FLAG = bytes([ESCAPE_BYTE, 0x7D])
+_ESCAPED_ESCAPE = bytes([ESCAPE_BYTE, 0x5D])
+_ESCAPE = bytes([ESCAPE_BYTE])
+
+# COMMAND_NUMBER -> nombre del comando
+COMMAND_NAMES: Dict[int, str] = {value: name for name, value in COMMAND_HEX_MAP.items()}
+
+
+class FrameError(ValueError):
+    """Trama Santone mal formada (flags, longitud o cabecera)"""
+
+
+@dataclass(frozen=True)
+class SantoneFrame:
+    """Trama Santone ya parseada"""
+    module_function: int
+    module_address: int
+    data_type: int
+    command: int
+    flag: int
+    length: int
+    body: bytes
+    crc: int
+    crc_valid: bool
+
+    @property
+    def command_hex(self) -> str:
+        return f"0x{self.command:02x}"
+
+    @property
+    def command_name(self) -> Optional[str]:
+        return COMMAND_NAMES.get(self.command)
+
+
+# ==================== PARSEO ====================
+
+def unescape(data: bytes) -> bytes:
+    """
+    Deshace los escapes Santone de una trama cruda.
+
+    Args:
+        data: Bytes entre los flags 7E (o la trama completa sin los flags)
+
+    Returns:
+        Bytes sin escapes (el mismo objeto si no había ninguno)
+    """
+    if _ESCAPE not in data:
+        return data
+    # 5E7D se resuelve antes que 5E5D: el 7E resultante no puede formar un nuevo par
+    return data.replace(_ESCAPED_FLAG, b"\x7e").replace(_ESCAPED_ESCAPE, _ESCAPE)
+
+
+def parse_frame(data: bytes, escaped: bool = False) -> SantoneFrame:
+    """
+    Parsea una trama Santone completa (7E ... 7E).
+
+    Args:
+        data: Trama completa incluyendo los flags
+        escaped: True si la trama viene tal cual del cable (con escapes).
+            Las tramas entregadas por SantoneFrameReader ya vienen sin escapes.
+
+    Returns:
+        SantoneFrame con cabecera, cuerpo y resultado de la verificación de CRC
+
+    Raises:
+        FrameError: Si la trama no tiene flags, es demasiado corta o
+            COMMAND_BODY_LENGTH no cabe en la trama
+    """
+    if len(data) < MIN_FRAME_SIZE or data[0] != FRAME_FLAG or data[-1] != FRAME_FLAG:
+        raise FrameError(f"Not a Santone frame ({len(data)} bytes)")
+
+    if escaped:
+        data = b"\x7e" + unescape(bytes(data[1:-1])) + b"\x7e"
+
+    module_function, module_address, data_type, command, flag, length = HEADER.unpack_from(data, HEADER_OFFSET)
+
+    body_end = BODY_OFFSET + length
+    if body_end + 3 > len(data):
+        raise FrameError(f"Body length {length} exceeds frame size {len(data)}")
+
+    crc = data[body_end] | (data[body_end + 1] << 8)
+    return SantoneFrame(
+        module_function=module_function,
+        module_address=module_address,
+        data_type=data_type,
+        command=command,
+        flag=flag,
+        length=length,
+        body=bytes(data[BODY_OFFSET:body_end]),
+        crc=crc,
+        crc_valid=crc16_xmodem(data[HEADER_OFFSET:body_end]) == crc
+    )
+
+
+# ==================== DECODERS ====================
+
+Decoder = Callable[[str, bytes], Optional[Dict[str, Any]]]
+
+# COMMAND_NUMBER -> decoder del cuerpo (se rellena con @register_decoder)
+DECODERS: Dict[int, Decoder] = {}
+
+# Formatos precompilados de los cuerpos (little-endian)
+UINT8 = struct.Struct("<B")
+UINT16 = struct.Struct("<H")
+INT16 = struct.Struct("<h")
+UINT32 = struct.Struct("<I")
+
+# Cuerpos multicanal
+CHANNEL_COUNT = 16
+FREQUENCY_SCALE = 10000  # unidades DRS por MHz
+CHANNEL_FREQUENCIES = struct.Struct(f"<{CHANNEL_COUNT}I")
+SUBBAND_BANDWIDTHS = struct.Struct(f"<{CHANNEL_COUNT}H")
+CHANNEL_FLAGS = struct.Struct(f"{CHANNEL_COUNT}B")
+CHANNEL_ON = 0x00  # 00=ON, 01=OFF (igual que SetCommands.set_channel_activation)
+
+
+def register_decoder(*commands: int, replace: bool = False) -> Callable[[Decoder], Decoder]:
+    """
+    Decorador que registra un decoder para uno o varios COMMAND_NUMBER.
+
+    Uso::
+
+        @register_decoder(0x97)
+        def _decode_device_id(command_name, body):
+            ...
+
+    Args:
+        commands: Números de comando que atiende el decoder
+        replace: Permite sustituir un decoder ya registrado
+
+    Raises:
+        ValueError: Si el comando ya tiene decoder y ``replace`` es False
+    """
+    def decorator(decoder: Decoder) -> Decoder:
+        for command in commands:
+            if command in DECODERS and not replace:
+                raise ValueError(f"Decoder already registered for command 0x{command:02x}")
+            DECODERS[command] = decoder
+        return decoder
+    return decorator
+
+
+def get_decoder(command: int) -> Optional[Decoder]:
+    """Devuelve el decoder registrado para un COMMAND_NUMBER (o None)."""
+    return DECODERS.get(command)
+
+
+@register_decoder(0x97)
+def _decode_device_id(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < UINT16.size:
+        return None
+    return {"device_id": UINT16.unpack_from(body)[0]}
+
+
+@register_decoder(0x02)
+def _decode_temperature(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < UINT16.size:
+        return None
+    # Signo-magnitud, escala 0.1
+    value = UINT16.unpack_from(body)[0]
+    if value & 0x8000:
+        value = -(value & 0x7fff)
+    return {"temperature": round(value * 0.1, 2)}
+
+
+@register_decoder(0xF8, 0xF9, 0xFA, 0xFB)
+def _decode_optical_port_devices(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < UINT8.size:
+        return None
+    return {command_name: UINT8.unpack_from(body)[0]}
+
+
+@register_decoder(0xEB)
+def _decode_central_frequency_point(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < UINT32.size:
+        return None
+    return {"central_frequency_point": str(UINT32.unpack_from(body)[0] / 10000)}
+
+
+@register_decoder(0xF3)
+def _decode_power(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < INT16.size:
+        return None
+    # Potencia en 1/256 dBm, signed 16-bit
+    return {command_name: round(INT16.unpack_from(body)[0] / 256, 2)}
+
+
+@register_decoder(0x36)
+def _decode_channel_frequency_configuration(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < CHANNEL_FREQUENCIES.size:
+        return None
+    return {"channel_frequencies_mhz": [value / FREQUENCY_SCALE for value in CHANNEL_FREQUENCIES.unpack_from(body)]}
+
+
+@register_decoder(0xED)
+def _decode_subband_bandwidth(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < SUBBAND_BANDWIDTHS.size:
+        return None
+    # Un uint16 por canal, en unidades del dispositivo
+    return {"subband_bandwidth": list(SUBBAND_BANDWIDTHS.unpack_from(body))}
+
+
+@register_decoder(0x42)
+def _decode_channel_switch(command_name: str, body: bytes) -> Optional[Dict[str, Any]]:
+    if len(body) < CHANNEL_FLAGS.size:
+        return None
+    enabled = [flag == CHANNEL_ON for flag in CHANNEL_FLAGS.unpack_from(body)]
+    return {"channels_enabled": enabled, "active_channels": sum(enabled)}
+
+
+def decode_body(command: int, body: bytes, command_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Decodifica el cuerpo de una respuesta según su COMMAND_NUMBER.
+
+    Args:
+        command: COMMAND_NUMBER de la respuesta
+        body: Cuerpo de la trama (COMMAND_BODY_LENGTH bytes)
+        command_name: Nombre del comando (por defecto se deduce del número)
+
+    Returns:
+        Valores decodificados, o ``{nombre: "raw_hex_..."}`` si no hay decoder
+    """
+    if command_name is None:
+        command_name = COMMAND_NAMES.get(command, f"0x{command:02x}")
+
+    decoder = DECODERS.get(command)
+    if decoder is not None:
+        decoded = decoder(command_name, body)
+        if decoded is not None:
+            return decoded
+
+    return {command_name: f"raw_hex_{body.hex() if body else '00'}"}
+
+
+def decode_frame(data: bytes, command_name: Optional[str] = None, escaped: bool = False) -> Dict[str, Any]:
+    """
+    Parsea y decodifica una trama completa.
+
+    Returns:
+        Valores decodificados más ``_frame`` con los metadatos de la trama
+
+    Raises:
+        FrameError: Si la trama está mal formada
+    """
+    frame = parse_frame(data, escaped)
+    decoded = decode_body(frame.command, frame.body, command_name)
+    decoded["_frame"] = {
+        "command_hex": frame.command_hex,
+        "body_length": frame.length,
+        "crc_valid": frame.crc_valid
+    }
+    return decoded
+
+
+# ==================== DECODIFICACIÓN APILADA ====================
+
+# COMMAND_NUMBER -> (dtype NumPy, formato struct equivalente)
+STACKED_FORMATS: Dict[int, Tuple[str, struct.Struct]] = {
+    0x36: ("<u4", CHANNEL_FREQUENCIES),
+    0xED: ("<u2", SUBBAND_BANDWIDTHS),
+    0x42: ("u1", CHANNEL_FLAGS),
+}
+
+
+def decode_stacked(command: int, bodies: Sequence[bytes]) -> Union["np.ndarray", List[List[Any]]]:
+    """
+    Decodifica los cuerpos multicanal de muchos dispositivos en una sola pasada.
+
+    Con NumPy los cuerpos se concatenan y se ven como una matriz
+    (dispositivos x 16) con ``np.frombuffer``; el escalado se aplica a toda
+    la matriz de una vez. Sin NumPy se usa el mismo formato ``struct`` fila
+    a fila y se devuelve una lista de listas con los mismos valores.
+
+    Args:
+        command: 0x36 (frecuencias, en MHz), 0xED (ancho de subbanda) o
+            0x42 (canales activos, True/False)
+        bodies: Cuerpos de respuesta (``parse_frame(...).body``), uno por dispositivo
+
+    Returns:
+        Matriz de len(bodies) filas y 16 columnas
+
+    Raises:
+        ValueError: Si el comando no es multicanal o algún cuerpo no tiene la longitud esperada
+    """
+    if command not in STACKED_FORMATS:
+        raise ValueError(f"Command 0x{command:02x} has no multi-channel layout")
+    dtype, row_format = STACKED_FORMATS[command]
+
+    for body in bodies:
+        if len(body) != row_format.size:
+            raise ValueError(f"Expected {row_format.size}-byte bodies for command 0x{command:02x}, got {len(body)}")
+
+    if NUMPY_AVAILABLE:
+        matrix = np.frombuffer(b"".join(bodies), dtype=dtype).reshape(len(bodies), CHANNEL_COUNT)
+        if command == 0x36:
+            return matrix / FREQUENCY_SCALE
+        if command == 0x42:
+            return matrix == CHANNEL_ON
+        return matrix
+
+    rows = [row_format.unpack_from(body) for body in bodies]
+    if command == 0x36:
+        return [[value / FREQUENCY_SCALE for value in row] for row in rows]
+    if command == 0x42:
+        return [[flag == CHANNEL_ON for flag in row] for row in rows]
+    return [list(row) for row in rows]
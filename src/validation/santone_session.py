@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Santone Session - Conexión TCP persistente por dispositivo DRS
+
+Mantiene un único socket abierto contra el puerto Santone (65050) de un
+dispositivo y lo reutiliza para todo el batch de comandos, en lugar de
+abrir y cerrar una conexión por cada trama.
+
+Características:
+- Conexión perezosa (se abre en la primera petición)
+- Reconexión automática cuando el dispositivo cierra o resetea el socket
+- Latencia de handshake (connect) y de petición (send/recv) medidas por separado
+- Marcas por fase (connect, send, primer byte, trama completa) en un ``CommandTimeline``
+- Estadísticas acumuladas de la sesión para el reporte del batch
+- Lectura por tramas completas (SantoneFrameReader), no por ``recv`` sueltos
+"""
+
+import socket
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from .frame_reader import SantoneFrameReader
+from .spans import CommandTimeline, PHASE_CONNECT, PHASE_FRAME_COMPLETE, PHASE_SEND
+from .tracing import get_tracer
+
+# Puerto TCP del protocolo Santone en los dispositivos DRS
+DRS_PORT = 65050
+
+# Posición del COMMAND_NUMBER dentro de la trama (7E 07 00 00 [CMD] ...)
+COMMAND_OFFSET = 4
+
+# Tramas de respuesta de otros comandos que se descartan antes de rendirse
+MAX_STALE_FRAMES = 8
+
+tracer = get_tracer(__name__)
+
+
+class ResponseMismatchError(Exception):
+    """El dispositivo sólo envió tramas de otros comandos (``MAX_STALE_FRAMES`` seguidas)"""
+
+    def __init__(self, command: int):
+        super().__init__(f"no reply to command 0x{command:02X} after {MAX_STALE_FRAMES} frames for other commands")
+        self.command = command
+
+
+@dataclass
+class SessionResponse:
+    """Resultado de una petición enviada por la sesión"""
+    data: Optional[bytes]
+    connect_ms: float = 0.0
+    request_ms: float = 0.0
+    reconnected: bool = False
+    timed_out: bool = False
+    error: str = ""
+
+
+class SantoneSession:
+    """
+    Sesión TCP de larga duración con un dispositivo DRS.
+
+    Uso típico::
+
+        with SantoneSession("192.168.11.22") as session:
+            for frame in frames:
+                response = session.request(frame)
+    """
+
+    def __init__(self, ip_address: str, port: int = DRS_PORT, timeout: float = 3.0, max_retries: int = 1):
+        """
+        Inicializar la sesión.
+
+        Args:
+            ip_address: IP del dispositivo DRS
+            port: Puerto Santone del dispositivo
+            timeout: Timeout en segundos para connect y para cada respuesta
+            max_retries: Reintentos (con reconexión) si el socket se cae a mitad de petición
+        """
+        self.ip_address = ip_address
+        self.port = port
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._sock: Optional[socket.socket] = None
+        self._reader = SantoneFrameReader()
+
+        # Estadísticas de la sesión
+        self.connections = 0
+        self.reconnects = 0
+        self.requests = 0
+        self.total_connect_ms = 0.0
+        self.total_request_ms = 0.0
+        self.stale_frames = 0
+
+    # ==================== CICLO DE VIDA ====================
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def connect(self) -> float:
+        """
+        Abre la conexión TCP si no está abierta.
+
+        Returns:
+            Latencia del handshake en ms (0.0 si ya estaba conectada)
+
+        Raises:
+            socket.timeout / OSError si el dispositivo no acepta la conexión
+        """
+        if self._sock is not None:
+            return 0.0
+
+        start = time.perf_counter()
+        sock = socket.create_connection((self.ip_address, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connect_ms = (time.perf_counter() - start) * 1000
+
+        if self.connections > 0:
+            self.reconnects += 1
+        self.connections += 1
+        self.total_connect_ms += connect_ms
+        self._sock = sock
+        self._reader.reset()
+
+        tracer.event("connected", device=self.ip_address, port=self.port, connect_ms=round(connect_ms, 2))
+        return connect_ms
+
+    def close(self) -> None:
+        """Cierra la conexión (la siguiente petición reconecta)."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def __enter__(self) -> "SantoneSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ==================== PETICIONES ====================
+
+    def request(self, frame: bytes, timeline: Optional[CommandTimeline] = None) -> SessionResponse:
+        """
+        Envía una trama y espera la respuesta del dispositivo.
+
+        Si el socket se cae durante el envío/recepción (reset, broken pipe,
+        cierre remoto) se reconecta y se reintenta hasta ``max_retries`` veces.
+        Un timeout esperando respuesta no se reintenta, pero sí cierra el
+        socket para que una respuesta tardía no se mezcle con el siguiente comando.
+
+        Args:
+            frame: Trama Santone completa (7E ... 7E)
+            timeline: Marcas de fase del comando (se crea una si no se pasa)
+
+        Returns:
+            SessionResponse con los bytes recibidos (o None) y las latencias medidas
+        """
+        timeline = timeline or CommandTimeline()
+        connect_ms = 0.0
+        reconnected = False
+        attempts = 0
+
+        while True:
+            try:
+                connect_ms += self.connect()
+            except socket.timeout:
+                timeline.mark(PHASE_CONNECT)
+                return SessionResponse(None, connect_ms, 0.0, reconnected, True, "Connect timeout")
+            except OSError as e:
+                timeline.mark(PHASE_CONNECT)
+                return SessionResponse(None, connect_ms, 0.0, reconnected, False, f"Connect error: {e}")
+            timeline.mark(PHASE_CONNECT)
+
+            start = time.perf_counter()
+            try:
+                self._sock.sendall(frame)
+                timeline.mark(PHASE_SEND)
+                tracer.event("frame_tx", device=self.ip_address, frame=frame)
+                response = self._read_response(frame, timeline)
+            except socket.timeout:
+                timeline.mark_wait()
+                request_ms = (time.perf_counter() - start) * 1000
+                self._record_request(request_ms)
+                tracer.event("response_timeout", device=self.ip_address, request_ms=round(request_ms, 2))
+                self.close()
+                return SessionResponse(None, connect_ms, request_ms, reconnected, True, "Response timeout")
+            except ResponseMismatchError as e:
+                timeline.mark_wait()
+                request_ms = (time.perf_counter() - start) * 1000
+                self._record_request(request_ms)
+                tracer.event("response_mismatch", device=self.ip_address, error=str(e))
+                # El flujo está desincronizado: la siguiente petición empieza con un socket nuevo
+                self.close()
+                return SessionResponse(None, connect_ms, request_ms, reconnected, False, f"Response mismatch: {e}")
+            except OSError as e:
+                self.close()
+                if attempts < self.max_retries:
+                    attempts += 1
+                    reconnected = True
+                    tracer.event("session_dropped", device=self.ip_address, error=str(e), attempt=attempts)
+                    continue
+                request_ms = (time.perf_counter() - start) * 1000
+                self._record_request(request_ms)
+                return SessionResponse(None, connect_ms, request_ms, reconnected, False, f"Socket error: {e}")
+
+            timeline.mark(PHASE_FRAME_COMPLETE)
+            request_ms = (time.perf_counter() - start) * 1000
+            self._record_request(request_ms)
+            tracer.event("frame_rx", device=self.ip_address, frame=response, request_ms=round(request_ms, 2))
+            return SessionResponse(response, connect_ms, request_ms, reconnected)
+
+    def _read_response(self, frame: bytes, timeline: Optional[CommandTimeline] = None) -> bytes:
+        """
+        Lee tramas completas hasta encontrar la respuesta al comando enviado.
+
+        Las tramas con otro COMMAND_NUMBER (respuestas tardías o no solicitadas)
+        se descartan para que no se atribuyan al comando actual.
+
+        Raises:
+            ResponseMismatchError: Si tras ``MAX_STALE_FRAMES`` descartes sigue sin llegar
+        """
+        expected = frame[COMMAND_OFFSET] if len(frame) > COMMAND_OFFSET else None
+        for _ in range(MAX_STALE_FRAMES):
+            response = self._reader.read_frame(self._sock, timeline)
+            if expected is None or len(response) <= COMMAND_OFFSET or response[COMMAND_OFFSET] == expected:
+                return response
+            self.stale_frames += 1
+            tracer.event("stale_frame_discarded", device=self.ip_address, frame=response)
+        raise ResponseMismatchError(expected)
+
+    def _record_request(self, request_ms: float) -> None:
+        self.requests += 1
+        self.total_request_ms += request_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estadísticas acumuladas de la sesión para el reporte del batch."""
+        return {
+            "ip_address": self.ip_address,
+            "port": self.port,
+            "connections": self.connections,
+            "reconnects": self.reconnects,
+            "requests": self.requests,
+            "stale_frames": self.stale_frames,
+            "total_connect_ms": round(self.total_connect_ms, 2),
+            "total_request_ms": round(self.total_request_ms, 2),
+            "average_request_ms": round(self.total_request_ms / self.requests, 2) if self.requests else 0,
+        }
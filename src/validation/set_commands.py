@@ -5,24 +5,38 @@ Implementación de comandos de configuración para dispositivos DRS
 Basado en la lógica extraída de set_eth.py
 """
 
-import struct
-from typing import List, Optional
-from crccheck.crc import Crc16Xmodem
+from binascii import crc_hqx
+from typing import List, Optional, Union
+
+try:
+    from .crc16 import crc16_xmodem, escape_crc, ESCAPED_BYTES
+except ImportError:
+    # Ejecutado como script (python set_commands.py)
+    from crc16 import crc16_xmodem, escape_crc, ESCAPED_BYTES
+
+# Cabecera: MODULE_FUNCTION, MODULE_ADDRESS, DATA_INITIATION, CMD, RESPONSE_FLAG, LEN
+MODULE_FUNCTION_DIGITAL_BOARD = 0x07
+MODULE_ADDRESS = 0x00
+DATA_INITIATION = 0x00
+RESPONSE_FLAG_SUCCESS = 0x00
+FRAME_FLAG = b"\x7e"
+
+# Cabecera sin LEN precalculada por comando, y LEN por longitud de cuerpo:
+# construir una trama es concatenar, sin empaquetar campo a campo
+HEADER_PREFIXES = tuple(
+    bytes((MODULE_FUNCTION_DIGITAL_BOARD, MODULE_ADDRESS, DATA_INITIATION, cmd, RESPONSE_FLAG_SUCCESS))
+    for cmd in range(256)
+)
+LENGTH_BYTES = tuple(bytes((length,)) for length in range(256))
 
 
 def calculate_crc16_ccitt(data: bytes) -> str:
     """
     Calcula CRC-16-CCITT usando el algoritmo correcto (XMODEM)
-    Implementación que coincide exactamente con el código oficial de Santone
+    Implementación que coincide exactamente con el código oficial de Santone:
+    bytes invertidos (little-endian) y escape de 5E/7E, devuelto en hex.
     """
-    crc = Crc16Xmodem.calc(data)
-    crc_hex = f"{crc:04X}"
-    # Swap bytes como hace el código oficial
-    checksum = crc_hex[2:4] + crc_hex[0:2]
-    checksum = checksum.upper()
-    # Escape de caracteres especiales
-    checksum = checksum.replace("5E", "5E5D").replace("7E", "5E7D")
-    return checksum
+    return escape_crc(crc16_xmodem(data)).hex().upper()
 
 
 def frequency_to_hex(frequency_mhz: float) -> str:
@@ -45,38 +59,23 @@ def frequency_to_hex(frequency_mhz: float) -> str:
     return inverted.upper()
 
 
-def build_santone_frame(cmd_name: int, cmd_data: str) -> bytes:
+def build_santone_frame(cmd_name: int, cmd_data: Union[str, bytes] = b"") -> bytes:
     """
     Construye trama Santone completa con CRC
     cmd_name: comando en decimal (ej: 0x80 = 128)
-    cmd_data: datos en formato hex string (ej: "02")
+    cmd_data: datos en formato hex string (ej: "02") o bytes
 
     Formato: 7E [HEADER] [DATA] [CRC] 7E
     HEADER: 07 00 00 [CMD] 00 [LEN] [DATA]
     """
-    # Header fijo según protocolo Santone
-    module_function = "07"  # Siempre 07 para Digital Board
-    module_address = "00"   # Dirección del módulo
-    data_initiation = "00"  # DataType.DATA_INITIATION
-    response_flag = "00"    # ResponseFlag.SUCCESS
-    
-    # Comando en hex de 2 dígitos
-    cmd_hex = f"{cmd_name:02X}"
-
-    # Longitud de datos (en bytes, no en hex chars)
-    data_length = len(cmd_data) // 2  # Cada 2 chars = 1 byte
-    len_hex = f"{data_length:02X}"
-
-    # Construir trama sin CRC (exactamente como el código oficial)
-    frame_data = f"{module_function}{module_address}{data_initiation}{cmd_hex}{response_flag}{len_hex}{cmd_data}"
-
-    # Calcular CRC
-    crc = calculate_crc16_ccitt(bytes.fromhex(frame_data))
+    body = bytes.fromhex(cmd_data) if isinstance(cmd_data, str) else cmd_data
 
-    # Trama completa
-    full_frame = f"7E{frame_data}{crc}7E"
+    # Cabecera + datos sin CRC (exactamente como el código oficial)
+    frame_data = HEADER_PREFIXES[cmd_name] + LENGTH_BYTES[len(body)] + body
 
-    return bytes.fromhex(full_frame)
+    # CRC calculado sobre los bytes (little-endian y escapado), sin strings hex
+    crc = crc_hqx(frame_data, 0)
+    return FRAME_FLAG + frame_data + ESCAPED_BYTES[crc & 0xFF] + ESCAPED_BYTES[crc >> 8] + FRAME_FLAG
 
 
 class SetCommands:
@@ -304,7 +303,7 @@ def test_crc_calculation():
     """Test del cálculo de CRC"""
     test_data = bytes.fromhex("07000080000102")
     crc = calculate_crc16_ccitt(test_data)
-    print(f"CRC para {test_data.hex().upper()}: {crc:04X}")
+    print(f"CRC para {test_data.hex().upper()}: {crc}")
     return crc
 
 
@@ -327,4 +326,4 @@ def test_frame_building():
 if __name__ == "__main__":
     print("DRS Set Commands Module - Testing")
     test_crc_calculation()
-    test_frame_building()
\ No newline at end of file
+    test_frame_building()
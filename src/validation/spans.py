@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+Spans - Desglose por fases de cada comando live y exportación OpenTelemetry
+
+``CommandTestResult.duration_ms`` dice cuánto tardó un comando, pero no
+dónde se fue el tiempo. ``CommandTimeline`` marca con ``perf_counter_ns``
+el final de cada fase de un comando:
+
+- ``connect``: handshake TCP (0 si la sesión ya estaba abierta)
+- ``send``: escritura de la trama
+- ``first_byte``: espera hasta el primer ``recv`` (red + dispositivo)
+- ``frame_complete``: resto de la trama reensamblada
+- ``crc_check``: parseo de la trama y verificación del CRC
+- ``decode``: decodificación del cuerpo
+
+Las fases son contiguas: cada una dura desde la marca anterior hasta la
+suya, así que la suma es la duración del comando. El desglose se guarda en
+el resultado (``phases_ms``) y puede exportarse como spans OTLP/JSON
+(batch -> comando -> fase) a un fichero JSONL o a un collector OTLP/HTTP.
+La exportación la hace un hilo aparte; si no hay exportador configurado
+``export_batch_spans`` no hace nada.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+PHASE_CONNECT = "connect"
+PHASE_SEND = "send"
+PHASE_FIRST_BYTE = "first_byte"
+PHASE_FRAME_COMPLETE = "frame_complete"
+PHASE_CRC_CHECK = "crc_check"
+PHASE_DECODE = "decode"
+
+PHASES = (PHASE_CONNECT, PHASE_SEND, PHASE_FIRST_BYTE, PHASE_FRAME_COMPLETE, PHASE_CRC_CHECK, PHASE_DECODE)
+
+SERVICE_NAME = "drs-validator"
+
+# Valores OTLP
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+logger = logging.getLogger(__name__)
+
+
+# ==================== FASES ====================
+
+class CommandTimeline:
+    """Marcas ``perf_counter_ns`` de las fases de un comando"""
+
+    __slots__ = ("start_unix_ns", "start_ns", "marks")
+
+    def __init__(self):
+        self.start_unix_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        self.marks: List[tuple] = []
+
+    def mark(self, phase: str) -> None:
+        """Cierra la fase ``phase`` en este instante."""
+        self.marks.append((phase, time.perf_counter_ns()))
+
+    def mark_once(self, phase: str) -> None:
+        """Como ``mark`` pero sólo si la fase no se ha marcado ya (primer byte)."""
+        if not self.marked(phase):
+            self.mark(phase)
+
+    def marked(self, phase: str) -> bool:
+        return any(name == phase for name, _ in self.marks)
+
+    def mark_wait(self) -> None:
+        """Cierra la espera de respuesta interrumpida (timeout): primer byte o resto de la trama."""
+        self.mark(PHASE_FRAME_COMPLETE if self.marked(PHASE_FIRST_BYTE) else PHASE_FIRST_BYTE)
+
+    def elapsed_ms(self) -> float:
+        """Tiempo desde el inicio del comando hasta ahora."""
+        return (time.perf_counter_ns() - self.start_ns) / 1_000_000
+
+    def intervals(self) -> List[tuple]:
+        """``(fase, inicio_ns, fin_ns)`` relativos al inicio, en orden de marca."""
+        intervals = []
+        previous = self.start_ns
+        for phase, at in self.marks:
+            intervals.append((phase, previous - self.start_ns, at - self.start_ns))
+            previous = at
+        return intervals
+
+    def phases_ms(self) -> Dict[str, float]:
+        """
+        Duración de cada fase en ms, en el orden de ``PHASES``.
+
+        Si un reintento repite fases (reconexión), sus duraciones se suman.
+        """
+        totals: Dict[str, int] = {}
+        for phase, start, end in self.intervals():
+            totals[phase] = totals.get(phase, 0) + end - start
+        return {phase: round(totals[phase] / 1_000_000, 3) for phase in PHASES if phase in totals}
+
+
+# ==================== SPANS OTLP ====================
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _span(
+    trace_id: str,
+    name: str,
+    start_ns: int,
+    end_ns: int,
+    attributes: Dict[str, Any],
+    parent_id: str = "",
+    kind: int = SPAN_KIND_INTERNAL,
+    error: str = ""
+) -> Dict[str, Any]:
+    span = {
+        "traceId": trace_id,
+        "spanId": os.urandom(8).hex(),
+        "name": name,
+        "kind": kind,
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(end_ns),
+        "attributes": [_attribute(key, value) for key, value in attributes.items() if value not in (None, "")],
+        "status": {"code": STATUS_ERROR, "message": error} if error else {"code": STATUS_OK},
+    }
+    if parent_id:
+        span["parentSpanId"] = parent_id
+    return span
+
+
+def build_batch_spans(ip_address: str, command_type: str, mode: str, results: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Spans de un batch: uno raíz, uno por comando y uno por fase.
+
+    Sólo entran los resultados con desglose (``phases_ms``), es decir los
+    comandos live que llegaron a enviarse.
+    """
+    timed = [result for result in results if getattr(result, "phases_ms", None)]
+    if not timed:
+        return []
+
+    trace_id = os.urandom(16).hex()
+    batch_start = min(result.started_unix_ns for result in timed)
+    batch_end = max(result.started_unix_ns + int(result.duration_ms * 1_000_000) for result in timed)
+    root = _span(
+        trace_id, "drs.batch", batch_start, batch_end,
+        {"net.peer.name": ip_address, "drs.command_type": command_type, "drs.mode": mode, "drs.commands": len(timed)}
+    )
+    spans = [root]
+
+    for result in timed:
+        status = getattr(result.status, "value", result.status)
+        start = result.started_unix_ns
+        command_span = _span(
+            trace_id, f"drs.command {result.command}", start, start + int(result.duration_ms * 1_000_000),
+            {"drs.command": result.command, "drs.status": status, "net.peer.name": ip_address},
+            parent_id=root["spanId"], kind=SPAN_KIND_CLIENT,
+            error=result.error if status != "PASS" else ""
+        )
+        spans.append(command_span)
+        offset = start
+        for phase in PHASES:
+            if phase not in result.phases_ms:
+                continue
+            duration = int(result.phases_ms[phase] * 1_000_000)
+            spans.append(_span(trace_id, phase, offset, offset + duration, {}, parent_id=command_span["spanId"]))
+            offset += duration
+    return spans
+
+
+def otlp_payload(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Envuelve los spans en el documento ``ExportTraceServiceRequest`` de OTLP/JSON."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+# ==================== EXPORTADORES ====================
+
+class FileSpanExporter:
+    """Añade cada batch como una línea OTLP/JSON (formato del receptor ``otlpjsonfile``)"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(otlp_payload(spans), separators=(",", ":")) + "\n")
+
+
+class OTLPHttpSpanExporter:
+    """Envía los spans a un collector OpenTelemetry por OTLP/HTTP con JSON"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else endpoint + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(otlp_payload(spans)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SpanExportProcessor:
+    """
+    Cola acotada + hilo exportador: el camino del comando sólo encola.
+
+    Si el exportador no da abasto los batches se descartan (``dropped``)
+    en lugar de retener memoria o bloquear la validación.
+    """
+
+    def __init__(self, exporter: Any, max_queue: int = 256):
+        self.exporter = exporter
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, spans: List[Dict[str, Any]]) -> bool:
+        try:
+            self._queue.put_nowait(spans)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Exporta lo pendiente y para el hilo."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "exporter": type(self.exporter).__name__,
+            "queued": self._queue.qsize(),
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                self.exporter.export(spans)
+                self.exported += 1
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"⚠️ Error exportando spans: {e}")
+
+
+_processor: Optional[SpanExportProcessor] = None
+
+
+def configure_span_export(exporter: Any, max_queue: int = 256) -> SpanExportProcessor:
+    """Activa la exportación de spans (sustituye a la configuración anterior)."""
+    global _processor
+    shutdown_span_export()
+    _processor = SpanExportProcessor(exporter, max_queue)
+    return _processor
+
+
+def configure_span_export_from_env() -> Optional[SpanExportProcessor]:
+    """
+    Configura la exportación desde el entorno.
+
+    ``OTEL_EXPORTER_OTLP_ENDPOINT`` (collector OTLP/HTTP) tiene prioridad
+    sobre ``DRS_SPANS_FILE`` (fichero JSONL local). Sin ninguna, nada.
+    """
+    endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if endpoint:
+        return configure_span_export(OTLPHttpSpanExporter(endpoint))
+    path = os.environ.get("DRS_SPANS_FILE")
+    if path:
+        return configure_span_export(FileSpanExporter(path))
+    return None
+
+
+def shutdown_span_export() -> None:
+    global _processor
+    if _processor is not None:
+        _processor.shutdown()
+        _processor = None
+
+
+def span_export_stats() -> Optional[Dict[str, Any]]:
+    return _processor.stats() if _processor is not None else None
+
+
+def export_batch_spans(ip_address: str, command_type: str, mode: str, results: List[Any]) -> None:
+    """Encola los spans de un batch si hay exportador configurado."""
+    processor = _processor
+    if processor is None:
+        return
+    spans = build_batch_spans(ip_address, command_type, mode, results)
+    if spans:
+        processor.submit(spans)
@@ -4,12 +4,12 @@ Standalone TCP Validator - Sin dependencias de tests existentes
 """
 
 import socket
-import subprocess
 import time
-import platform
 from datetime import datetime
 from typing import Dict, Any, List
 
+from .reachability import probe_host
+
 def validate_device_standalone(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validación independiente de dispositivos
@@ -113,43 +113,9 @@ def _live_validation(config: Dict[str, Any]) -> Dict[str, Any]:
     return results
 
 def _ping_test(ip_address: str) -> Dict[str, Any]:
-    """Test de ping"""
+    """Test de alcanzabilidad (ICMP/TCP dentro del proceso, sin lanzar ``ping``)"""
     try:
-        # Determinar comando según el sistema
-        if platform.system().lower() == "windows":
-            cmd = ["ping", "-n", "1", "-w", "3000", ip_address]
-        else:
-            cmd = ["ping", "-c", "1", "-W", "3", ip_address]
-        
-        start = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        duration = int((time.time() - start) * 1000)
-        
-        if result.returncode == 0:
-            return {
-                "name": "Network Ping",
-                "status": "PASS",
-                "message": f"✅ Device {ip_address} is reachable",
-                "details": f"Ping successful in {duration}ms",
-                "duration_ms": duration
-            }
-        else:
-            return {
-                "name": "Network Ping",
-                "status": "FAIL", 
-                "message": f"❌ Device {ip_address} is not reachable",
-                "details": f"Ping failed after {duration}ms - check network connectivity",
-                "duration_ms": duration
-            }
-            
-    except subprocess.TimeoutExpired:
-        return {
-            "name": "Network Ping",
-            "status": "FAIL",
-            "message": f"❌ Ping to {ip_address} timed out",
-            "details": "Network timeout - device may be offline",
-            "duration_ms": 10000
-        }
+        return probe_host(ip_address).to_test_dict()
     except Exception as e:
         return {
             "name": "Network Ping", 
@@ -10,8 +10,11 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 import subprocess
 import socket
+import time
 from typing import Dict, Any, Optional
 
+from .reachability import probe_host
+
 # Path setup is simplified as this module is part of the 'src' package
 project_root = Path(__file__).parent.parent.parent
 
@@ -20,6 +23,11 @@ project_root = Path(__file__).parent.parent.parent
 IMPORTS_AVAILABLE = False
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milisegundos transcurridos desde una marca ``perf_counter_ns``."""
+    return round((time.perf_counter_ns() - start_ns) / 1_000_000, 2)
+
+
 class TechnicianTCPValidator:
     """
     Validador TCP para técnicos de campo.
@@ -61,6 +69,9 @@ class TechnicianTCPValidator:
             threshold_test = self._mock_threshold_validation(config, mock_responses)
             results["tests"].append(threshold_test)
             
+            # Tiempo simulado: la suma de las duraciones de los tests mock
+            results["duration_ms"] = sum(test["duration_ms"] for test in results["tests"])
+            
             # Determinar estado general
             failed_tests = [t for t in results["tests"] if t["status"] == "FAIL"]
             warning_tests = [t for t in results["tests"] if t["status"] == "WARNING"]
@@ -86,6 +97,7 @@ class TechnicianTCPValidator:
         """
         Validación en modo en vivo usando patrones de test_check_eth_integration.py
         """
+        start_ns = time.perf_counter_ns()
         try:
             device_type = config.get("device_type")
             ip_address = config.get("ip_address")
@@ -105,6 +117,7 @@ class TechnicianTCPValidator:
             # Si ping falla, no continuar con otros tests
             if ping_test["status"] == "FAIL":
                 results["overall_status"] = "FAIL"
+                results["duration_ms"] = _elapsed_ms(start_ns)
                 return results
             
             # Test 2: Conexión TCP al puerto del dispositivo
@@ -119,6 +132,7 @@ class TechnicianTCPValidator:
                 # Fallback si no están disponibles los imports
                 subprocess_test = self._live_subprocess_test(config)
                 results["tests"].append(subprocess_test)
+            results["duration_ms"] = _elapsed_ms(start_ns)
             
             # Determinar estado general
             failed_tests = [t for t in results["tests"] if t["status"] == "FAIL"]
@@ -137,7 +151,7 @@ class TechnicianTCPValidator:
                 "error": f"Live validation failed: {str(e)}",
                 "action": "Check device connection and network configuration",
                 "tests": [],
-                "duration_ms": 0,
+                "duration_ms": _elapsed_ms(start_ns),
                 "timestamp": self._get_timestamp()
             }
     
@@ -212,46 +226,28 @@ class TechnicianTCPValidator:
             }
     
     def _live_ping_test(self, ip_address: str) -> Dict[str, Any]:
-        """Test de ping real"""
+        """Test de alcanzabilidad real (ICMP/TCP dentro del proceso, sin lanzar ``ping``)"""
+        start_ns = time.perf_counter_ns()
         try:
-            import platform
-            ping_cmd = ["ping", "-n", "1"] if platform.system() == "Windows" else ["ping", "-c", "1"]
-            ping_cmd.append(ip_address)
-            
-            result = subprocess.run(ping_cmd, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                return {
-                    "name": "Network Ping",
-                    "status": "PASS",
-                    "message": f"✅ Device {ip_address} is reachable",
-                    "details": "Network connectivity confirmed",
-                    "duration_ms": 500
-                }
-            else:
-                return {
-                    "name": "Network Ping", 
-                    "status": "FAIL",
-                    "message": f"❌ Device {ip_address} is not reachable",
-                    "details": "Check network cable, device power, and IP configuration",
-                    "duration_ms": 1000
-                }
+            return probe_host(ip_address).to_test_dict()
         except Exception as e:
             return {
                 "name": "Network Ping",
                 "status": "FAIL", 
                 "message": f"❌ Ping test failed: {str(e)}",
                 "details": "Network test error - check system configuration",
-                "duration_ms": 100
+                "duration_ms": _elapsed_ms(start_ns)
             }
     
     def _live_tcp_connection_test(self, ip_address: str, port: int = 65050) -> Dict[str, Any]:
         """Test de conexión TCP real"""
+        start_ns = time.perf_counter_ns()
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(5)
             result = sock.connect_ex((ip_address, port))
             sock.close()
+            duration_ms = _elapsed_ms(start_ns)
             
             if result == 0:
                 return {
@@ -259,7 +255,7 @@ class TechnicianTCPValidator:
                     "status": "PASS",
                     "message": f"✅ TCP connection to {ip_address}:{port} successful",
                     "details": "Device TCP port is accessible",
-                    "duration_ms": 200
+                    "duration_ms": duration_ms
                 }
             else:
                 return {
@@ -267,7 +263,7 @@ class TechnicianTCPValidator:
                     "status": "FAIL",
                     "message": f"❌ TCP connection to {ip_address}:{port} failed",
                     "details": "Device may be offline or port blocked",
-                    "duration_ms": 5000
+                    "duration_ms": duration_ms
                 }
         except Exception as e:
             return {
@@ -275,11 +271,12 @@ class TechnicianTCPValidator:
                 "status": "FAIL",
                 "message": f"❌ TCP connection error: {str(e)}",
                 "details": "Network connection issue",
-                "duration_ms": 1000
+                "duration_ms": _elapsed_ms(start_ns)
             }
     
     def _live_check_eth_test(self, config: Dict) -> Dict[str, Any]:
         """Test usando check_eth real (cuando imports están disponibles)"""
+        start_ns = time.perf_counter_ns()
         try:
             # Aquí iría la lógica real de check_eth cuando los imports estén disponibles
             return {
@@ -287,7 +284,7 @@ class TechnicianTCPValidator:
                 "status": "PASS",
                 "message": "✅ check_eth command executed successfully",
                 "details": "Device communication and data parsing successful",
-                "duration_ms": 2000
+                "duration_ms": _elapsed_ms(start_ns)
             }
         except Exception as e:
             return {
@@ -295,11 +292,12 @@ class TechnicianTCPValidator:
                 "status": "FAIL",
                 "message": f"❌ check_eth execution failed: {str(e)}",
                 "details": "Device command execution error",
-                "duration_ms": 1000
+                "duration_ms": _elapsed_ms(start_ns)
             }
     
     def _live_subprocess_test(self, config: Dict) -> Dict[str, Any]:
         """Test usando subprocess como fallback"""
+        start_ns = time.perf_counter_ns()
         try:
             device_type = config.get("device_type")
             ip_address = config.get("ip_address")
@@ -331,7 +329,7 @@ class TechnicianTCPValidator:
                     "status": "PASS", 
                     "message": f"✅ {device_type} command successful",
                     "details": f"Device at {ip_address} responded correctly",
-                    "duration_ms": 3000
+                    "duration_ms": _elapsed_ms(start_ns)
                 }
             else:
                 return {
@@ -339,7 +337,7 @@ class TechnicianTCPValidator:
                     "status": "FAIL",
                     "message": f"❌ {device_type} command failed",
                     "details": f"Error: {result.stderr or 'Unknown error'}",
-                    "duration_ms": 5000
+                    "duration_ms": _elapsed_ms(start_ns)
                 }
                 
         except subprocess.TimeoutExpired:
@@ -348,7 +346,7 @@ class TechnicianTCPValidator:
                 "status": "FAIL",
                 "message": "❌ Device command timeout",
                 "details": "Command took too long - device may be unresponsive",
-                "duration_ms": 30000
+                "duration_ms": _elapsed_ms(start_ns)
             }
         except Exception as e:
             return {
@@ -356,7 +354,7 @@ class TechnicianTCPValidator:
                 "status": "FAIL",
                 "message": f"❌ Command execution error: {str(e)}",
                 "details": "System error during command execution",
-                "duration_ms": 1000
+                "duration_ms": _elapsed_ms(start_ns)
             }
     
     def _get_timestamp(self) -> str:
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Tracing - Eventos estructurados con coste casi nulo cuando están desactivados
+
+Sustituye los ``print`` de depuración del camino TCP (tramas enviadas y
+recibidas, reintentos, errores por comando):
+
+- ``Tracer.event("frame_tx", device=ip, frame=data)``: un evento con nombre y
+  campos, no un texto ya formateado. Si el nivel no está activo la llamada
+  vuelve tras una comprobación de nivel, sin formatear nada
+- Los ``bytes`` se pasan tal cual y se convierten a hex al escribir el
+  registro, en el hilo del ``QueueListener``, nunca en el camino del comando
+- ``configure_logging()`` instala un ``QueueHandler``: emitir un evento es
+  encolar un registro; la E/S a stdout la hace un hilo aparte
+- Traza por dispositivo activable en caliente (``trace_device``): los
+  eventos DEBUG de ese equipo se emiten aunque el nivel global sea INFO
+- Salida con ``structlog`` si está instalado (JSON o consola), o con un
+  formateador propio ``clave=valor``/JSON si no
+
+Uso::
+
+    tracer = get_tracer(__name__)
+    if tracer.enabled(device=ip):               # opcional, para campos caros
+        tracer.event("frame_rx", device=ip, frame=response, rtt_ms=1.2)
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+try:
+    import structlog
+    STRUCTLOG_AVAILABLE = True
+except ImportError:
+    STRUCTLOG_AVAILABLE = False
+
+TRACE_ATTRIBUTE = "trace"
+
+_traced_devices: FrozenSet[str] = frozenset()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+# ==================== TRAZA POR DISPOSITIVO ====================
+
+def trace_device(ip_address: str, enabled: bool = True) -> None:
+    """Activa o desactiva en caliente la traza DEBUG de un dispositivo."""
+    global _traced_devices
+    if enabled:
+        _traced_devices = _traced_devices | {ip_address}
+    else:
+        _traced_devices = _traced_devices - {ip_address}
+
+
+def traced_devices() -> FrozenSet[str]:
+    return _traced_devices
+
+
+# ==================== TRACER ====================
+
+class Tracer:
+    """Emisor de eventos estructurados de un módulo"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.logger = logging.getLogger(name)
+
+    def enabled(self, level: int = logging.DEBUG, device: Optional[str] = None) -> bool:
+        """True si un evento de ese nivel (y dispositivo) se emitiría."""
+        return self.logger.isEnabledFor(level) or (device is not None and device in _traced_devices)
+
+    def event(self, event: str, level: int = logging.DEBUG, device: Optional[str] = None, **fields: Any) -> None:
+        """
+        Emite un evento si su nivel está activo o el dispositivo está trazado.
+
+        Los campos se guardan en el registro sin formatear; ``bytes`` se
+        muestran en hexadecimal al escribirse.
+        """
+        if not self.enabled(level, device):
+            return
+        if device is not None:
+            fields["device"] = device
+        record = self.logger.makeRecord(
+            self.name, level, "(trace)", 0, event, None, None, extra={TRACE_ATTRIBUTE: fields}
+        )
+        # handle() no vuelve a mirar el nivel del logger: así pasan los eventos
+        # DEBUG de un dispositivo trazado aunque el nivel global sea INFO
+        self.logger.handle(record)
+
+
+def get_tracer(name: str) -> Tracer:
+    return Tracer(name)
+
+
+# ==================== SALIDA ====================
+
+def _render_value(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex().upper()
+    return value
+
+
+def _trace_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: _render_value(value) for key, value in getattr(record, TRACE_ATTRIBUTE, {}).items()}
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formateador sin dependencias: ``clave=valor`` o una línea JSON por evento"""
+
+    def __init__(self, json_output: bool = False):
+        super().__init__()
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = _trace_fields(record)
+        if self.json_output:
+            entry = {
+                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+                "level": record.levelname.lower(),
+                "logger": record.name,
+                "event": record.getMessage(),
+                **fields,
+            }
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name} {record.getMessage()}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def _add_trace_fields(logger, method_name, event_dict):
+    """Procesador structlog: añade los campos del evento al diccionario."""
+    record = event_dict.get("_record")
+    if record is not None:
+        event_dict.update(_trace_fields(record))
+    return event_dict
+
+
+def _build_formatter(json_output: bool) -> logging.Formatter:
+    if STRUCTLOG_AVAILABLE:
+        renderer = structlog.processors.JSONRenderer() if json_output else structlog.dev.ConsoleRenderer(colors=False)
+        return structlog.stdlib.ProcessorFormatter(
+            processor=renderer,
+            foreign_pre_chain=[
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.add_logger_name,
+                structlog.processors.TimeStamper(fmt="iso"),
+                _add_trace_fields,
+            ],
+        )
+    return StructuredFormatter(json_output)
+
+
+class _TraceQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que no formatea en el hilo emisor (lo hace el listener)."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO,
+    json_output: bool = False,
+    stream=None
+) -> logging.handlers.QueueListener:
+    """
+    Configura el logging raíz con un QueueHandler y un hilo escritor.
+
+    Idempotente: una segunda llamada sólo cambia el nivel.
+
+    Args:
+        level: Nivel global ("DEBUG", "INFO"... o el entero); si no es válido, INFO con un aviso
+        json_output: Una línea JSON por evento en lugar de texto
+        stream: Destino (por defecto stderr)
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    resolved = _resolve_level(level)
+    root.setLevel(logging.INFO if resolved is None else resolved)
+    if _listener is None:
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(_build_formatter(json_output))
+        records: "queue.SimpleQueue" = queue.SimpleQueue()
+        _queue_handler = _TraceQueueHandler(records)
+        root.addHandler(_queue_handler)
+        _listener = logging.handlers.QueueListener(records, output)
+        _listener.start()
+    if resolved is None:
+        logging.getLogger(__name__).warning(f"⚠️ Nivel de log no válido {level!r}, se usa INFO")
+    return _listener
+
+
+def _resolve_level(level: Union[int, str]) -> Optional[int]:
+    """Nivel numérico de ``level`` ("debug", "INFO", "10", 10...), o None si no es válido."""
+    if isinstance(level, int):
+        return level
+    level = str(level).strip().upper()
+    if level.isdigit():
+        return int(level)
+    resolved = logging.getLevelName(level)
+    # Un nombre desconocido devuelve el texto "Level X", no un número
+    return resolved if isinstance(resolved, int) else None
+
+
+def shutdown_logging() -> None:
+    """Vacía la cola y para el hilo escritor."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
@@ -4,20 +4,22 @@ DRS Validation Tool - FastAPI Web Application
 Provides web interface for technicians to validate device communications
 """
 
+import asyncio
+import ipaddress
 import os
 import sys
 import json
 import yaml
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # Determine project root for correct path resolution
 project_root = Path(__file__).parent  # This will be the 'src' directory
@@ -40,19 +42,34 @@ except ImportError as e:
 
 # Import batch commands validator
 try:
-    from validation.batch_commands_validator import BatchCommandsValidator, CommandType
+    from validation.batch_commands_validator import (
+        BatchCommandsValidator, CommandType, BATCH_EVENT_RESULT, BATCH_EVENT_SUMMARY
+    )
+    from validation.async_batch_engine import AsyncBatchEngine
+    from validation.mock_profiles import MockProfile, configure_latency_samples_from_env
     BATCH_VALIDATION_AVAILABLE = True
     print("✅ Batch commands validator loaded successfully")
 except ImportError as e:
     print(f"Warning: Could not import batch commands validator: {e}")
     BATCH_VALIDATION_AVAILABLE = False
 
+from validation.job_queue import JobQueue, JobStatus, QueueFullError
+from validation.blocking_executor import BlockingExecutor, ExecutorSaturatedError
+from validation.reachability import ReachabilityProber, probe_host
+from validation.device_discovery import DEFAULT_MAX_CONCURRENT_HOSTS, DiscoveryEngine, expand_cidr
+from validation.result_store import ResultStore
+from validation.result_writer import ResultWriter
+from validation.result_archive import ResultArchive
+from validation.metrics import (
+    CONTENT_TYPE_LATEST, EXECUTOR_ACTIVE, EXECUTOR_QUEUED, JOB_QUEUE_JOBS,
+    REGISTRY as METRICS_REGISTRY, RESULT_WRITER_PENDING
+)
+from validation.spans import configure_span_export_from_env, shutdown_span_export, span_export_stats
+from validation.tracing import configure_logging, shutdown_logging, trace_device, traced_devices
+
 # Alternative simple validation function if imports fail
 def simple_validation(device_ip: str, device_type: str, hostname: str = None, live_mode: bool = False):
     """Simple validation function as fallback"""
-    import subprocess
-    import time
-    
     results = {
         "status": "success" if not live_mode else "unknown",
         "device_ip": device_ip,
@@ -66,9 +83,7 @@ def simple_validation(device_ip: str, device_type: str, hostname: str = None, li
     # Simple ping test
     try:
         if live_mode:
-            ping_result = subprocess.run(['ping', '-n', '1', device_ip], 
-                                       capture_output=True, text=True, timeout=5)
-            ping_success = ping_result.returncode == 0
+            ping_success = probe_host(device_ip, timeout=5).reachable
         else:
             ping_success = True  # Mock mode always succeeds
             
@@ -100,10 +115,55 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory=Path(__file__).parent / "web/static"), name="static")
 templates = Jinja2Templates(directory=Path(__file__).parent / "web/templates")
 
+# Structured logging: LOG_LEVEL=DEBUG traces every frame; LOG_FORMAT=json for log shippers
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+LOG_JSON = os.environ.get("LOG_FORMAT", "text").lower() == "json"
+
 # Results storage directory - use relative path for development
 PROJECT_ROOT = Path(__file__).parent.parent
-RESULTS_DIR = PROJECT_ROOT / "results"
-RESULTS_DIR.mkdir(exist_ok=True)
+RESULTS_DIR = Path(os.environ.get("RESULTS_DIR", PROJECT_ROOT / "results"))
+RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Indexed results history (SQLite, WAL); replaces one JSON file per run
+result_store = ResultStore(RESULTS_DIR / "results.db")
+
+# Write-behind persistence: requests only enqueue results, a single writer
+# thread commits them in batches. Flushed on shutdown.
+RESULT_WRITER_BACKLOG = 1000
+result_writer = ResultWriter(result_store, max_backlog=RESULT_WRITER_BACKLOG)
+
+# Retention: runs younger than RESULTS_HOT_DAYS stay in SQLite, older ones are
+# moved to rotated, compressed JSONL segments and deleted after RESULTS_RETENTION_DAYS
+RESULTS_HOT_DAYS = int(os.environ.get("RESULTS_HOT_DAYS", "30"))
+RESULTS_RETENTION_DAYS = int(os.environ.get("RESULTS_RETENTION_DAYS", "365"))
+RESULTS_MAINTENANCE_INTERVAL = 3600
+result_archive = ResultArchive(
+    RESULTS_DIR / "archive",
+    max_segment_bytes=int(os.environ.get("RESULTS_SEGMENT_MB", "64")) * 1024 * 1024,
+    max_segment_age=timedelta(hours=int(os.environ.get("RESULTS_SEGMENT_HOURS", "24"))),
+    compression=os.environ.get("RESULTS_ARCHIVE_COMPRESSION", "gzip")
+)
+maintenance_task: Optional[asyncio.Task] = None
+
+# Background validation jobs: POST endpoints enqueue and return a run_id,
+# results are polled from /api/validation/report/{run_id}
+JOB_MAX_WORKERS = 8
+JOB_MAX_PENDING = 1000
+job_queue = JobQueue(max_workers=JOB_MAX_WORKERS, max_pending=JOB_MAX_PENDING)
+
+# Bounded thread pools for blocking calls, so they never run on the event loop.
+# One pool per kind of work: a burst of validations cannot starve history reads.
+validation_executor = BlockingExecutor("validation", max_workers=JOB_MAX_WORKERS)
+io_executor = BlockingExecutor("io", max_workers=4)
+BLOCKING_EXECUTORS = (validation_executor, io_executor)
+
+# Fleet batches: each device holds one socket while in flight, so both the
+# fleet size and its concurrency are capped well below the fd limit
+MAX_FLEET_DEVICES = 1024
+MAX_FLEET_CONCURRENT_DEVICES = 256
+
+# In-process ICMP/TCP reachability probe (no ping subprocess)
+reachability_prober = ReachabilityProber()
 
 
 # Pydantic models for API
@@ -146,6 +206,24 @@ class BatchCommandsRequest(BaseModel):
     mode: str = "mock"  # 'mock' or 'live'
     selected_commands: Optional[List[str]] = None
     timeout_seconds: Optional[int] = 3
+    mock_profile: Optional[str] = "fast"  # 'fast' or 'realistic' (mock mode only)
+
+
+class DiscoveryRequest(BaseModel):
+    """Request model for subnet device discovery"""
+    cidr: str  # e.g. '192.168.11.0/24'
+    port: Optional[int] = 65050
+    max_concurrent: Optional[int] = 256
+    connect_timeout_ms: Optional[int] = 500
+
+
+class FleetBatchCommandsRequest(BaseModel):
+    """Request model for live batch validation across several devices"""
+    ip_addresses: List[str]
+    command_type: str = "remote"  # 'master', 'remote' or 'set'
+    selected_commands: Optional[List[str]] = None
+    timeout_seconds: Optional[int] = 3
+    max_concurrent_devices: Optional[int] = Field(50, ge=1, le=MAX_FLEET_CONCURRENT_DEVICES)
 
 
 class BatchCommandResult(BaseModel):
@@ -182,37 +260,32 @@ class SupportedCommandsResponse(BaseModel):
     set_commands: List[str] = []
 
 
-def save_validation_result(result: Dict[str, Any], request: ValidationRequest) -> str:
+async def save_validation_result(result: Dict[str, Any], request: ValidationRequest) -> bool:
     """Save validation result to persistent storage"""
+    return await store_job_result(
+        result,
+        ip_address=request.device_config.ip_address,
+        device_type=request.device_config.device_type,
+        hostname=request.device_config.device_name,
+        mode=request.mode
+    )
+
+
+async def store_job_result(result: Dict[str, Any], **metadata) -> bool:
+    """
+    Queue a result for write-behind persistence.
+    
+    If the writer backlog is full the result is written directly on the
+    I/O pool instead, so it is never dropped.
+    """
+    if result_writer.submit(result, **metadata):
+        return True
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        device_type = request.device_config.device_type
-        ip_address = request.device_config.ip_address.replace(".", "_")
-        
-        filename = f"{timestamp}_{device_type}_{ip_address}.json"
-        filepath = RESULTS_DIR / filename
-        
-        # Add metadata to result
-        result_data = {
-            "timestamp": datetime.now().isoformat(),
-            "request": {
-                "ip_address": request.device_config.ip_address,
-                "device_type": request.device_config.device_type,
-                "hostname": request.device_config.device_name,
-                "live_mode": request.mode == "live"
-            },
-            "result": result
-        }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, indent=2, ensure_ascii=False)
-        
-        logging.info(f"💾 Resultado guardado: {filepath}")
-        return str(filepath)
-        
+        await io_executor.run(result_store.save, result, **metadata)
+        return True
     except Exception as e:
         logging.error(f"❌ Error guardando resultado: {e}")
-        return ""
+        return False
 
 
 # API Endpoints
@@ -240,9 +313,8 @@ class ValidationService:
                 raise ValueError(f"Invalid mode: {request.mode}")
             
             # Save result to persistent storage
-            saved_path = save_validation_result(result.dict(), request)
-            if saved_path:
-                logging.info(f"✅ Validation result saved to {saved_path}")
+            if await save_validation_result(result.dict(), request):
+                logging.info(f"✅ Validation result queued for {result_store.path}")
             
             return result
                 
@@ -255,7 +327,7 @@ class ValidationService:
             )
             
             # Save error result too
-            save_validation_result(error_result.dict(), request)
+            await save_validation_result(error_result.dict(), request)
             
             return error_result
     
@@ -292,6 +364,60 @@ class ValidationService:
 validation_service = ValidationService()
 
 
+def maintain_results() -> Dict[str, Any]:
+    """Move runs older than RESULTS_HOT_DAYS to the archive and apply the archive retention"""
+    cutoff = (datetime.now() - timedelta(days=RESULTS_HOT_DAYS)).isoformat()
+    archived = result_archive.archive_store(result_store, before=cutoff)
+    removed = result_archive.apply_retention(RESULTS_RETENTION_DAYS)
+    return {"archived": archived, "removed_segments": removed}
+
+
+async def results_maintenance_loop():
+    """Periodic archiving/retention on the I/O pool"""
+    while True:
+        try:
+            summary = await io_executor.run(maintain_results)
+            if summary["archived"] or summary["removed_segments"]:
+                logging.info(f"🗄️ Mantenimiento de resultados: {summary}")
+        except Exception as e:
+            logging.error(f"❌ Error archivando resultados: {e}")
+        await asyncio.sleep(RESULTS_MAINTENANCE_INTERVAL)
+
+
+# Lifecycle
+@app.on_event("startup")
+async def start_job_queue():
+    configure_logging(LOG_LEVEL, json_output=LOG_JSON)
+    # Per-command phase spans: OTEL_EXPORTER_OTLP_ENDPOINT (collector) or DRS_SPANS_FILE (JSONL)
+    configure_span_export_from_env()
+    # Recorded latencies for the realistic mock profile (live report, JSON list or capture JSONL)
+    if BATCH_VALIDATION_AVAILABLE:
+        configure_latency_samples_from_env()
+    job_queue.start()
+    result_writer.start()
+    # One-time import of the JSON files written before the SQLite store
+    counts = await io_executor.run(result_store.import_legacy_directory, RESULTS_DIR)
+    if counts:
+        logging.info(f"📥 Resultados JSON importados: {counts}")
+    global maintenance_task
+    maintenance_task = asyncio.create_task(results_maintenance_loop())
+
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+    await job_queue.stop()
+    # Write every queued result before the store is closed
+    if not await io_executor.run(result_writer.stop):
+        logging.warning(f"⚠️ Resultados sin guardar al apagar: {result_writer.stats()['pending']}")
+    for executor in BLOCKING_EXECUTORS:
+        executor.shutdown(wait=False)
+    result_store.close()
+    shutdown_span_export()
+    shutdown_logging()
+
+
 # API Routes
 @app.get("/health")
 async def health_check():
@@ -347,213 +473,529 @@ async def get_validation_scenarios():
     }
 
 
-@app.post("/api/validation/run")
-async def run_validation(request: Dict[str, Any]):
-    """Execute device validation with current configuration"""
+async def _enqueue_job(kind: str, key: Any, runner, params: Dict[str, Any], wait: bool, error_prefix: str):
+    """
+    Encola un trabajo de validación.
+
+    Sin ``wait`` responde 202 con el run_id al instante; con ``wait`` espera
+    al resultado y lo devuelve como antes (compatibilidad con scripts).
+    """
     try:
-        # Validate required fields
-        required_fields = ["scenario_id", "ip_address", "hostname", "mode"]
-        for field in required_fields:
-            if field not in request:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
-        
-        # Get scenario details to determine device_type
-        scenario_id = request["scenario_id"]
-        device_type_mapping = {
-            "dmu_basic_check": "dmu_ethernet",
-            "dru_remote_check": "dru_ethernet", 
-            "device_discovery": "discovery_ethernet",
-            "batch_remote_commands": "drs_remote"
-        }
-        
-        # Build validation config
-        validation_config = {
-            "device_type": device_type_mapping.get(scenario_id, "dmu_ethernet"),
-            "ip_address": request["ip_address"],
-            "hostname": request["hostname"],
-            "mode": request["mode"]
+        job, created = job_queue.submit(kind, key, runner, params)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    if wait:
+        job = await job_queue.wait(job.job_id)
+        if job.status is JobStatus.FAILED:
+            raise HTTPException(status_code=500, detail=f"{error_prefix}: {job.error}")
+        return job.result
+    
+    return JSONResponse(
+        status_code=202,
+        content={
+            "run_id": job.job_id,
+            "status": job.status.value,
+            "deduplicated": not created,
+            "report_url": f"/api/validation/report/{job.job_id}",
+            "timestamp": datetime.now().isoformat()
         }
-        
-        # Add additional parameters for DRU
-        if scenario_id == "dru_remote_check":
-            validation_config["optical_port"] = 1
-            validation_config["command"] = 155
-        
-        # Add thresholds if provided
-        if "thresholds" in request:
-            validation_config.update(request["thresholds"])
-        
-        # Execute validation
-        if scenario_id == "batch_remote_commands":
-            # Special handling for batch remote commands scenario
-            if BATCH_VALIDATION_AVAILABLE:
-                try:
+    )
+
+
+@app.post("/api/validation/run")
+async def run_validation(request: Dict[str, Any], wait: bool = False):
+    """
+    Queue a device validation with current configuration.
+    
+    Returns 202 with a run_id; poll /api/validation/report/{run_id} for the
+    result. With ?wait=true the result is returned directly.
+    """
+    # Validate required fields
+    required_fields = ["scenario_id", "ip_address", "hostname", "mode"]
+    for field in required_fields:
+        if field not in request:
+            raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
+    
+    # Get scenario details to determine device_type
+    scenario_id = request["scenario_id"]
+    device_type_mapping = {
+        "dmu_basic_check": "dmu_ethernet",
+        "dru_remote_check": "dru_ethernet", 
+        "device_discovery": "discovery_ethernet",
+        "batch_remote_commands": "drs_remote"
+    }
+    
+    # Build validation config
+    validation_config = {
+        "device_type": device_type_mapping.get(scenario_id, "dmu_ethernet"),
+        "ip_address": request["ip_address"],
+        "hostname": request["hostname"],
+        "mode": request["mode"]
+    }
+    
+    # Add additional parameters for DRU
+    if scenario_id == "dru_remote_check":
+        validation_config["optical_port"] = 1
+        validation_config["command"] = 155
+    
+    # Discovery scans a CIDR range (default: the /24 of the given IP)
+    if scenario_id == "device_discovery":
+        validation_config["cidr"] = request.get("cidr") or f"{request['ip_address']}/24"
+        try:
+            expand_cidr(validation_config["cidr"])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid discovery range: {e}")
+    
+    # Add thresholds if provided
+    if "thresholds" in request:
+        validation_config.update(request["thresholds"])
+    
+    # Identical validations already queued or running are reused
+    key = (scenario_id, validation_config["ip_address"], validation_config["mode"], validation_config.get("cidr"),
+           json.dumps(request.get("thresholds"), sort_keys=True, default=str))
+    return await _enqueue_job(
+        "validation", key,
+        lambda: _execute_validation(scenario_id, validation_config),
+        {"scenario_id": scenario_id, "ip_address": validation_config["ip_address"], "mode": validation_config["mode"]},
+        wait, "Validation execution failed"
+    )
+
+
+def _discovery_to_validation(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a discovery report to the standard validation result format"""
+    devices = report["devices"]
+    identified = [d for d in devices if d["device_type"] != "unknown"]
+    tests = [{
+        "name": "Subnet Scan",
+        "status": "PASS" if identified else "WARNING",
+        "message": f"Found {len(devices)} device(s) listening in {report['cidr']}",
+        "details": f"{report['hosts_scanned']} hosts scanned on port {report['port']} in {report['duration_ms']}ms",
+        "duration_ms": report["duration_ms"]
+    }]
+    for device in devices:
+        ports = ", ".join(f"P{port}={count}" for port, count in sorted(device["optical_ports"].items()))
+        tests.append({
+            "name": f"{device['device_type'].upper()} {device['ip_address']}",
+            "status": "PASS" if device["device_type"] != "unknown" else "WARNING",
+            "message": f"device_id {device['device_id']}" if device["device_id"] is not None else device["error"],
+            "details": f"Optical ports: {ports or 'N/A'}",
+            "duration_ms": int(device["connect_ms"])
+        })
+    
+    return {
+        "overall_status": "PASS" if identified else "WARNING",
+        "message": f"Discovery completed: {report['statistics']['dmu']} DMU, {report['statistics']['dru']} DRU, "
+                   f"{report['statistics']['unknown']} unknown in {report['cidr']}",
+        "tests": tests,
+        "discovery": report,
+        "duration_ms": report["duration_ms"],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+async def _execute_validation(scenario_id: str, validation_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one validation scenario (job body of /api/validation/run)"""
+    # Execute validation
+    if scenario_id == "batch_remote_commands":
+        # Special handling for batch remote commands scenario
+        if BATCH_VALIDATION_AVAILABLE:
+            try:
+                if validation_config["mode"] == "live":
+                    # Live: motor asyncio, no bloquea el event loop
+                    batch_result = await AsyncBatchEngine().validate_device(
+                        ip_address=validation_config["ip_address"],
+                        command_type=CommandType.REMOTE,
+                        selected_commands=None  # None means all remote commands
+                    )
+                else:
                     validator = BatchCommandsValidator()
-                    batch_result = validator.validate_batch_commands(
+                    batch_result = await validation_executor.run(
+                        validator.validate_batch_commands,
                         ip_address=validation_config["ip_address"],
                         command_type=CommandType.REMOTE,
                         mode=validation_config["mode"],
                         selected_commands=None  # None means all remote commands
                     )
-                    
-                    # Convert batch result to standard validation format
-                    # Ensure status values are strings
-                    results_list = batch_result["results"]
-                    for cmd in results_list:
-                        if hasattr(cmd["status"], 'value'):
-                            cmd["status"] = cmd["status"].value
-                    
-                    result = {
-                        "overall_status": batch_result["overall_status"],  # Use batch validator's overall status (80% threshold)
-                        "message": f"Batch remote commands validation completed. {len([c for c in results_list if c['status'] == 'PASS'])}/{len(results_list)} commands passed.",
-                        "mode": validation_config["mode"],
-                        "tests": [
-                            {
-                                "name": f"Remote Command: {cmd['command']}",
-                                "status": cmd["status"],
-                                "message": cmd.get("message", "Command executed"),
-                                "details": f"Response: {cmd.get('response_data', 'N/A')}",
-                                "duration_ms": cmd.get("duration_ms", 0)
-                            }
-                            for cmd in results_list
-                        ],
-                        "duration_ms": batch_result.get("duration_ms", 0),
-                        "timestamp": datetime.now().isoformat(),
-                        "command_type": "remote",
-                        "total_commands": len(results_list)
-                    }
-                except Exception as e:
-                    result = {
-                        "overall_status": "FAIL",
-                        "message": f"Batch remote commands validation failed: {str(e)}",
-                        "mode": validation_config["mode"],
-                        "tests": [
-                            {
-                                "name": "Batch Remote Commands",
-                                "status": "FAIL",
-                                "message": f"Validation error: {str(e)}",
-                                "details": "Failed to execute remote commands batch"
-                            }
-                        ],
-                        "duration_ms": 0,
-                        "timestamp": datetime.now().isoformat()
-                    }
-            else:
+                
+                # Convert batch result to standard validation format
+                # Ensure status values are strings
+                results_list = batch_result["results"]
+                for cmd in results_list:
+                    if hasattr(cmd["status"], 'value'):
+                        cmd["status"] = cmd["status"].value
+                
+                result = {
+                    "overall_status": batch_result["overall_status"],  # Use batch validator's overall status (80% threshold)
+                    "message": f"Batch remote commands validation completed. {len([c for c in results_list if c['status'] == 'PASS'])}/{len(results_list)} commands passed.",
+                    "mode": validation_config["mode"],
+                    "tests": [
+                        {
+                            "name": f"Remote Command: {cmd['command']}",
+                            "status": cmd["status"],
+                            "message": cmd.get("message", "Command executed"),
+                            "details": f"Response: {cmd.get('response_data', 'N/A')}",
+                            "duration_ms": cmd.get("duration_ms", 0)
+                        }
+                        for cmd in results_list
+                    ],
+                    "duration_ms": batch_result.get("duration_ms", 0),
+                    "timestamp": datetime.now().isoformat(),
+                    "command_type": "remote",
+                    "total_commands": len(results_list)
+                }
+            except Exception as e:
                 result = {
                     "overall_status": "FAIL",
-                    "message": "Batch commands validator not available",
+                    "message": f"Batch remote commands validation failed: {str(e)}",
                     "mode": validation_config["mode"],
                     "tests": [
                         {
                             "name": "Batch Remote Commands",
                             "status": "FAIL",
-                            "message": "Batch commands validator not available",
-                            "details": "Required dependencies not installed"
+                            "message": f"Validation error: {str(e)}",
+                            "details": "Failed to execute remote commands batch"
                         }
                     ],
                     "duration_ms": 0,
                     "timestamp": datetime.now().isoformat()
                 }
-        elif VALIDATION_AVAILABLE:
-            result = validate_device(validation_config)
         else:
-            # Fallback mock result if validation not available
             result = {
-                "overall_status": "WARNING",
-                "message": "Validation logic not available - returning mock result",
+                "overall_status": "FAIL",
+                "message": "Batch commands validator not available",
                 "mode": validation_config["mode"],
                 "tests": [
                     {
-                        "name": "Mock Test",
-                        "status": "WARNING",
-                        "message": "Validation system not fully initialized",
-                        "details": "Import dependencies missing"
+                        "name": "Batch Remote Commands",
+                        "status": "FAIL",
+                        "message": "Batch commands validator not available",
+                        "details": "Required dependencies not installed"
                     }
                 ],
-                "duration_ms": 100,
+                "duration_ms": 0,
                 "timestamp": datetime.now().isoformat()
             }
-        
-        # Add request context to result
-        result["scenario_id"] = scenario_id
-        result["mode"] = validation_config["mode"]
-        
-        return {
-            "status": "success",
-            "result": result,
-            "scenario_id": scenario_id,
-            "mode": validation_config["mode"]
+    elif scenario_id == "device_discovery" and validation_config["mode"] == "live":
+        report = await DiscoveryEngine().discover(validation_config["cidr"])
+        result = _discovery_to_validation(report)
+    elif VALIDATION_AVAILABLE:
+        result = await validation_executor.run(validate_device, validation_config)
+    else:
+        # Fallback mock result if validation not available
+        result = {
+            "overall_status": "WARNING",
+            "message": "Validation logic not available - returning mock result",
+            "mode": validation_config["mode"],
+            "tests": [
+                {
+                    "name": "Mock Test",
+                    "status": "WARNING",
+                    "message": "Validation system not fully initialized",
+                    "details": "Import dependencies missing"
+                }
+            ],
+            "duration_ms": 100,
+            "timestamp": datetime.now().isoformat()
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Validation execution failed: {str(e)}")
+    
+    # Add request context to result
+    result["scenario_id"] = scenario_id
+    result["mode"] = validation_config["mode"]
+    
+    await store_job_result(
+        result,
+        ip_address=validation_config["ip_address"],
+        device_type=validation_config["device_type"],
+        hostname=validation_config["hostname"],
+        scenario_id=scenario_id,
+        mode=validation_config["mode"]
+    )
+    
+    return {
+        "status": "success",
+        "result": result,
+        "scenario_id": scenario_id,
+        "mode": validation_config["mode"]
+    }
 
 
 @app.post("/api/validation/ping/{ip_address}")
 async def ping_device_endpoint(ip_address: str):
-    """Test basic network connectivity to device"""
+    """Test basic network connectivity to device (ICMP echo or TCP connect to 65050)"""
     try:
-        if VALIDATION_AVAILABLE:
-            validator = TechnicianTCPValidator()
-            result = validator.ping_device(ip_address)
-            return result
-        else:
-            # Simple fallback ping using subprocess
-            import subprocess
-            import platform
-            
-            ping_cmd = ["ping", "-n", "1"] if platform.system() == "Windows" else ["ping", "-c", "1"]
-            ping_cmd.append(ip_address)
-            
-            try:
-                result = subprocess.run(ping_cmd, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    return {
-                        "status": "PASS",
-                        "ip_address": ip_address,
-                        "message": f"✅ Device at {ip_address} is reachable",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    return {
-                        "status": "FAIL",
-                        "ip_address": ip_address,
-                        "message": f"❌ Device at {ip_address} is not reachable",
-                        "timestamp": datetime.now().isoformat()
-                    }
-            except subprocess.TimeoutExpired:
-                return {
-                    "status": "FAIL",
-                    "ip_address": ip_address,
-                    "message": "❌ Ping timeout - device not responding",
-                    "timestamp": datetime.now().isoformat()
-                }
-                
+        probe = await reachability_prober.probe(ip_address)
+        return {
+            **probe.to_test_dict(),
+            "ip_address": ip_address,
+            "reachable": probe.reachable,
+            "method": probe.method,
+            "rtt_ms": probe.rtt_ms,
+            "timestamp": datetime.now().isoformat()
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ping test failed: {str(e)}")
 
 @app.get("/api/validation/report/{run_id}")
 async def get_validation_report(run_id: str):
-    """Get detailed validation report"""
-    # TODO: Implement report storage and retrieval
-    return {
-        "run_id": run_id,
-        "status": "not_implemented",
-        "message": "Report storage system not yet implemented",
-        "timestamp": datetime.now().isoformat()
-    }
+    """Get the state of a queued validation job and, once finished, its result"""
+    job = job_queue.get(run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown run_id: {run_id}")
+    return job.to_dict(include_result=job.finished)
 
 
 # New Batch Commands Endpoints
+def _resolve_batch_request(request: BatchCommandsRequest):
+    """Validate a batch request and return (CommandType, mock profile name)"""
+    if not BATCH_VALIDATION_AVAILABLE:
+        raise HTTPException(
+            status_code=503, 
+            detail="Batch commands validator not available"
+        )
+    
+    # Validate command_type parameter
+    if request.command_type.lower() not in ['master', 'remote', 'set']:
+        raise HTTPException(
+            status_code=400,
+            detail="command_type must be 'master', 'remote', or 'set'"
+        )
+    
+    # Convert command_type string to enum
+    command_type_map = {
+        'master': CommandType.MASTER,
+        'remote': CommandType.REMOTE,
+        'set': CommandType.SET
+    }
+    command_type = command_type_map[request.command_type.lower()]
+    
+    # Validate mode parameter
+    if request.mode.lower() not in ['mock', 'live']:
+        raise HTTPException(
+            status_code=400,
+            detail="mode must be 'mock' or 'live'"
+        )
+    
+    # Validate mock_profile parameter
+    mock_profile = (request.mock_profile or MockProfile.FAST.value).lower()
+    if mock_profile not in [profile.value for profile in MockProfile]:
+        raise HTTPException(
+            status_code=400,
+            detail="mock_profile must be 'fast' or 'realistic'"
+        )
+    return command_type, mock_profile
+
+
 @app.post("/api/validation/batch-commands")
-async def run_batch_commands(request: BatchCommandsRequest) -> BatchCommandsResponse:
+async def run_batch_commands(request: BatchCommandsRequest, wait: bool = False):
     """
-    Execute batch validation of DRS commands using Santone protocol.
+    Queue a batch validation of DRS commands using Santone protocol.
     
     Supports both mock and live testing modes with comprehensive
-    command validation and SantoneDecoder integration.
+    command validation and SantoneDecoder integration. Returns 202 with a
+    run_id; with ?wait=true the BatchCommandsResponse is returned directly.
+    """
+    command_type, mock_profile = _resolve_batch_request(request)
+    return await _enqueue_job(
+        "batch_commands", _batch_job_key(request, command_type, mock_profile),
+        lambda: _execute_batch_commands(request, command_type, mock_profile),
+        {"ip_address": request.ip_address, "command_type": command_type.value, "mode": request.mode.lower()},
+        wait, "Batch commands validation failed"
+    )
+
+
+def _batch_job_key(request: BatchCommandsRequest, command_type, mock_profile: str) -> Tuple:
+    """Same device, command type and mode already queued or running -> same job"""
+    mode = request.mode.lower()
+    selected = tuple(request.selected_commands) if request.selected_commands else None
+    return (request.ip_address, command_type.value, mode, selected, mock_profile if mode != "live" else None)
+
+
+async def _batch_events(request: BatchCommandsRequest, command_type, mock_profile: str):
+    """Batch events of a request: async engine for live, mock generator on the validation pool"""
+    timeout = request.timeout_seconds or 3
+    
+    if request.mode.lower() == "live":
+        # Live: motor asyncio, no bloquea el event loop mientras espera al dispositivo
+        engine = AsyncBatchEngine(timeout_per_command=timeout)
+        batch_events = engine.iter_device(request.ip_address, command_type, request.selected_commands)
+        try:
+            async for item in batch_events:
+                yield item
+        finally:
+            # Libera la sesión y BATCHES_IN_FLIGHT aunque se cancele a mitad
+            await batch_events.aclose()
+        return
+    
+    # Mock: tiempo virtual, el batch entero se genera de una vez fuera del event loop
+    validator = BatchCommandsValidator(timeout_per_command=timeout)
+    for item in await validation_executor.run(lambda: list(validator.iter_batch_commands(
+        request.ip_address, command_type, request.mode.lower(), request.selected_commands, mock_profile
+    ))):
+        yield item
+
+
+async def _execute_batch_commands(
+    request: BatchCommandsRequest,
+    command_type,
+    mock_profile: str,
+    progress: Optional["BatchProgress"] = None
+) -> Dict[str, Any]:
+    """Run one batch validation (job body of /api/validation/batch-commands and its stream)"""
+    result = None
+    try:
+        async for event, payload in _batch_events(request, command_type, mock_profile):
+            if event == BATCH_EVENT_SUMMARY:
+                result = payload
+            elif progress is not None:
+                progress.publish(event, payload.__dict__)
+        
+        await store_job_result(result, scenario_id=f"batch_{command_type.value}")
+        if progress is not None:
+            progress.publish(BATCH_EVENT_SUMMARY, _batch_summary(result))
+    except Exception as e:
+        if progress is not None:
+            progress.publish("error", {"error": f"Batch commands validation failed: {str(e)}"})
+        raise
+    finally:
+        if progress is not None:
+            progress.close()
+    
+    # Return structured response
+    return BatchCommandsResponse(
+        overall_status=result["overall_status"],
+        command_type=result["command_type"],
+        mode=result["mode"],
+        ip_address=result["ip_address"],
+        total_commands=result["total_commands"],
+        commands_tested=result["commands_tested"],
+        statistics=result["statistics"],
+        results=result["results"],
+        duration_ms=result["duration_ms"],
+        timestamp=result["timestamp"]
+    ).dict()
+
+
+def _batch_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch report without the per-command results (already streamed)"""
+    return {k: v for k, v in result.items() if k != "results"}
+
+
+class BatchProgress:
+    """
+    Eventos de un batch en curso para los clientes SSE que lo siguen.
+    
+    Guarda todos los eventos, así que un cliente que se une a un trabajo
+    deduplicado ya empezado recibe también los resultados anteriores.
+    """
+    
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+        self.closed = False
+        self._changed = asyncio.Event()
+    
+    def publish(self, event: str, data: Any) -> None:
+        self.events.append((event, data))
+        self._notify()
+    
+    def close(self) -> None:
+        self.closed = True
+        self._notify()
+    
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+    
+    async def follow(self):
+        """Todos los eventos desde el principio, y los nuevos según llegan."""
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self.closed:
+                return
+            await self._changed.wait()
+
+
+# Progreso de los batches encolados desde /stream, por job_id (se borra al terminar)
+batch_progress: Dict[str, BatchProgress] = {}
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Serialize one Server-Sent Event (enums are sent by value)"""
+    payload = json.dumps(data, default=lambda value: getattr(value, "value", str(value)), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@app.post("/api/validation/batch-commands/stream")
+async def stream_batch_commands(request: BatchCommandsRequest):
+    """
+    Execute a batch validation streaming results as Server-Sent Events.
+    
+    Emits one ``result`` event per command as soon as it completes, then a
+    ``summary`` event with the batch report (statistics, without the
+    results already sent). Failures are reported as an ``error`` event.
+    
+    The batch runs as a job of the validation queue, like
+    /api/validation/batch-commands: an identical batch already queued or
+    running is followed instead of started again, and the result is
+    stored in history. The run_id is returned in the X-Run-Id header.
+    """
+    command_type, mock_profile = _resolve_batch_request(request)
+    
+    progress = BatchProgress()
+    
+    async def runner() -> Dict[str, Any]:
+        try:
+            return await _execute_batch_commands(request, command_type, mock_profile, progress)
+        finally:
+            batch_progress.pop(job.job_id, None)
+    
+    try:
+        job, created = job_queue.submit(
+            "batch_commands", _batch_job_key(request, command_type, mock_profile), runner,
+            {"ip_address": request.ip_address, "command_type": command_type.value, "mode": request.mode.lower()}
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if created:
+        batch_progress[job.job_id] = progress
+    
+    # Deduplicated onto a job started elsewhere: follow its progress, or its final result
+    followed = batch_progress.get(job.job_id)
+    
+    async def events():
+        # The job keeps running (and is persisted) if the client disconnects
+        if followed is not None:
+            async for event, data in followed.follow():
+                yield _sse_event(event, data)
+            return
+        
+        await job.done.wait()
+        if job.status is JobStatus.FAILED:
+            yield _sse_event("error", {"error": f"Batch commands validation failed: {job.error}"})
+            return
+        for result in job.result["results"]:
+            yield _sse_event(BATCH_EVENT_RESULT, result)
+        yield _sse_event(BATCH_EVENT_SUMMARY, _batch_summary(job.result))
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Run-Id": job.job_id}
+    )
+
+
+@app.post("/api/validation/batch-commands/fleet")
+async def run_fleet_batch_commands(request: FleetBatchCommandsRequest, wait: bool = False):
+    """
+    Queue the same live batch of DRS commands against several devices.
+    
+    Devices are validated concurrently (up to max_concurrent_devices in
+    flight), each over its own session with one outstanding command, and
+    each device's report is stored in history. Returns 202 with a run_id;
+    with ?wait=true the fleet report is returned directly.
     """
     if not BATCH_VALIDATION_AVAILABLE:
         raise HTTPException(
@@ -561,52 +1003,74 @@ async def run_batch_commands(request: BatchCommandsRequest) -> BatchCommandsResp
             detail="Batch commands validator not available"
         )
     
-    try:
-        # Validate command_type parameter
-        if request.command_type.lower() not in ['master', 'remote', 'set']:
-            raise HTTPException(
-                status_code=400,
-                detail="command_type must be 'master', 'remote', or 'set'"
-            )
-        
-        # Convert command_type string to enum
-        command_type_map = {
-            'master': CommandType.MASTER,
-            'remote': CommandType.REMOTE,
-            'set': CommandType.SET
-        }
-        command_type = command_type_map[request.command_type.lower()]
-        
-        # Initialize batch validator
-        validator = BatchCommandsValidator()
-        
-        # Execute batch validation
-        result = validator.validate_batch_commands(
-            ip_address=request.ip_address,
-            command_type=command_type,
-            mode=request.mode,
-            selected_commands=request.selected_commands
-        )
-        
-        # Return structured response
-        return BatchCommandsResponse(
-            overall_status=result["overall_status"],
-            command_type=result["command_type"],
-            mode=result["mode"],
-            ip_address=result["ip_address"],
-            total_commands=result["total_commands"],
-            commands_tested=result["commands_tested"],
-            statistics=result["statistics"],
-            results=result["results"],
-            duration_ms=result["duration_ms"],
-            timestamp=result["timestamp"]
+    command_type_map = {
+        'master': CommandType.MASTER,
+        'remote': CommandType.REMOTE,
+        'set': CommandType.SET
+    }
+    command_type = command_type_map.get(request.command_type.lower())
+    if command_type is None:
+        raise HTTPException(
+            status_code=400,
+            detail="command_type must be 'master', 'remote', or 'set'"
         )
-        
-    except Exception as e:
+    if not request.ip_addresses:
+        raise HTTPException(status_code=400, detail="ip_addresses must not be empty")
+    if len(request.ip_addresses) > MAX_FLEET_DEVICES:
         raise HTTPException(
-            status_code=500,
-            detail=f"Batch commands validation failed: {str(e)}"
+            status_code=400,
+            detail=f"ip_addresses accepts at most {MAX_FLEET_DEVICES} devices per request"
+        )
+    
+    selected = tuple(request.selected_commands) if request.selected_commands else None
+    key = (tuple(sorted(set(request.ip_addresses))), command_type.value, selected)
+    return await _enqueue_job(
+        "fleet_batch_commands", key,
+        lambda: _execute_fleet_batch_commands(request, command_type),
+        {"devices": len(request.ip_addresses), "command_type": command_type.value, "mode": "live"},
+        wait, "Fleet batch validation failed"
+    )
+
+
+async def _execute_fleet_batch_commands(request: FleetBatchCommandsRequest, command_type) -> Dict[str, Any]:
+    """Run one fleet batch (job body of /api/validation/batch-commands/fleet)"""
+    engine = AsyncBatchEngine(
+        timeout_per_command=request.timeout_seconds or 3,
+        max_concurrent_devices=request.max_concurrent_devices or 50
+    )
+    result = await engine.validate_fleet(
+        ip_addresses=request.ip_addresses,
+        command_type=command_type,
+        selected_commands=request.selected_commands
+    )
+    # One history entry per device, like single-device batches
+    for device_result in result["devices"]:
+        await store_job_result(device_result, scenario_id=f"batch_{command_type.value}")
+    return result
+
+
+@app.post("/api/validation/discovery")
+async def run_discovery(request: DiscoveryRequest) -> Dict[str, Any]:
+    """
+    Scan a CIDR range for DRS devices and classify them as DMU or DRU.
+    
+    Hosts are probed concurrently (TCP connect on the Santone port); each
+    responder is queried for device_id and its optical ports.
+    """
+    try:
+        expand_cidr(request.cidr)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid discovery range: {e}")
+    
+    try:
+        engine = DiscoveryEngine(
+            port=request.port or 65050,
+            connect_timeout=(request.connect_timeout_ms or 500) / 1000,
+            max_concurrent=min(request.max_concurrent or DEFAULT_MAX_CONCURRENT_HOSTS, DEFAULT_MAX_CONCURRENT_HOSTS)
         )
+        return await engine.discover(request.cidr)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Discovery failed: {str(e)}")
 
 
 @app.get("/api/validation/supported-commands")
@@ -666,48 +1130,156 @@ async def get_batch_commands_status():
             "timeout_handling": True,
             "detailed_statistics": True,
             "mock_testing": True,
-            "live_device_testing": True
+            "live_device_testing": True,
+            "async_live_engine": True,
+            "fleet_validation": True,
+            "background_jobs": True,
+            "result_streaming": True,
+            "subnet_discovery": True,
+            "phase_spans": True
         },
+        "job_queue": job_queue.stats(),
+        "executors": {executor.name: executor.stats() for executor in BLOCKING_EXECUTORS},
+        "result_writer": result_writer.stats(),
         "timestamp": datetime.now().isoformat()
     }
 
 
 @app.get("/api/results/history")
-async def get_results_history(limit: int = 50) -> Dict[str, Any]:
-    """Get validation results history"""
+async def get_results_history(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    device_type: Optional[str] = None,
+    scenario_id: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    fields: Optional[str] = None,
+    summary: bool = False,
+    archived: bool = False
+) -> Dict[str, Any]:
+    """
+    Get validation results history (newest first).
+    
+    - ``cursor``: ``next_cursor`` of the previous page (keyset pagination)
+    - ``fields``: comma-separated projection, e.g. ``fields=timestamp,status``
+    - ``summary=true``: only counts per status, no documents
+    - ``archived=true``: page through the compressed archive instead of recent runs
+    """
+    filters = {
+        "ip_address": ip_address,
+        "device_type": device_type,
+        "scenario_id": scenario_id,
+        "status": status
+    }
+    
+    if summary:
+        counts = await io_executor.run(result_store.summary, since=since, until=until, **filters)
+        return {"status": "success", "summary": counts}
+    
     try:
-        results = []
-        
-        if RESULTS_DIR.exists():
-            # Get all JSON files sorted by modification time (newest first)
-            result_files = sorted(
-                RESULTS_DIR.glob("*.json"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )[:limit]
-            
-            for filepath in result_files:
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        data['filename'] = filepath.name
-                        results.append(data)
-                except Exception as e:
-                    logging.warning(f"Error reading result file {filepath}: {e}")
-        
-        return {
-            "status": "success",
-            "count": len(results),
-            "results": results
-        }
-        
-    except Exception as e:
-        logging.error(f"Error getting results history: {e}")
-        return {
-            "status": "error",
-            "message": f"Failed to get results history: {str(e)}",
-            "results": []
-        }
+        results, next_cursor = await io_executor.run(
+            result_archive.history if archived else result_store.history,
+            limit=max(1, min(limit, 500)),
+            cursor=cursor,
+            fields=[name.strip() for name in fields.split(",") if name.strip()] if fields else None,
+            since=since,
+            until=until,
+            **filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "status": "success",
+        "count": len(results),
+        "next_cursor": next_cursor,
+        "results": results
+    }
+
+
+@app.get("/api/results/archive")
+async def get_results_archive() -> Dict[str, Any]:
+    """Segments, size and retention settings of the compressed results archive"""
+    segments = await io_executor.run(result_archive.segments)
+    return {
+        "status": "success",
+        "archive": result_archive.stats(),
+        "segments": [segment.to_dict() for segment in segments],
+        "hot_days": RESULTS_HOT_DAYS,
+        "retention_days": RESULTS_RETENTION_DAYS,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.get("/api/results/{result_id}")
+async def get_result_detail(result_id: int) -> Dict[str, Any]:
+    """Get one stored result with its per-command rows (recent runs first, then the archive)"""
+    record = await io_executor.run(result_store.get, result_id)
+    if record is None:
+        record = await io_executor.run(result_archive.get, result_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown result id: {result_id}")
+    return record
+
+
+@app.get("/api/system/executors")
+async def get_executor_metrics() -> Dict[str, Any]:
+    """Queue depth and counters of the blocking-work pools, the job queue, the result writer and the span exporter"""
+    return {
+        "executors": {executor.name: executor.stats() for executor in BLOCKING_EXECUTORS},
+        "job_queue": job_queue.stats(),
+        "result_writer": result_writer.stats(),
+        "span_export": span_export_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.get("/api/system/tracing")
+async def get_tracing() -> Dict[str, Any]:
+    """Global log level and the devices whose frames are traced at DEBUG"""
+    return {
+        "level": logging.getLevelName(logging.getLogger().getEffectiveLevel()),
+        "devices": sorted(traced_devices()),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@app.put("/api/system/tracing/devices/{ip_address}")
+async def enable_device_tracing(ip_address: str) -> Dict[str, Any]:
+    """Trace every frame sent to and received from one device, without raising the global log level"""
+    try:
+        ipaddress.ip_address(ip_address)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid IP address: {ip_address}")
+    trace_device(ip_address)
+    return {"status": "success", "devices": sorted(traced_devices())}
+
+
+@app.delete("/api/system/tracing/devices/{ip_address}")
+async def disable_device_tracing(ip_address: str) -> Dict[str, Any]:
+    """Stop tracing one device"""
+    trace_device(ip_address, enabled=False)
+    return {"status": "success", "devices": sorted(traced_devices())}
+
+
+@app.get("/metrics")
+async def prometheus_metrics() -> Response:
+    """
+    Prometheus metrics: per-command latency histograms and outcome counters,
+    connect vs response latency, in-flight batches, queue depths and
+    result-store write latency.
+    """
+    jobs = job_queue.stats()
+    JOB_QUEUE_JOBS.labels("queued").set(jobs["queued"])
+    JOB_QUEUE_JOBS.labels("running").set(jobs["active"])
+    for executor in BLOCKING_EXECUTORS:
+        stats = executor.stats()
+        EXECUTOR_QUEUED.labels(executor.name).set(stats["queued"])
+        EXECUTOR_ACTIVE.labels(executor.name).set(stats["active"])
+    RESULT_WRITER_PENDING.set(result_writer.stats()["pending"])
+    return Response(content=METRICS_REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Error handlers
@@ -722,6 +1294,17 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        status_code=503,
+        content={
+            "error": str(exc),
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
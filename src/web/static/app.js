@@ -10,6 +10,107 @@ function initializeApp() {
     setupBatchCommandsForm();
 }
 
+// Background validation jobs: POST returns a run_id, the result is polled
+const JOB_POLL_INTERVAL_MS = 500;
+const JOB_POLL_TIMEOUT_MS = 10 * 60 * 1000;
+
+async function submitValidationJob(url, payload) {
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(payload),
+    });
+
+    if (!response.ok){
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const job = await response.json();
+    if (!job.run_id) {
+        // Respuesta síncrona (?wait=true)
+        return job;
+    }
+    return await waitForJob(job.report_url || `/api/validation/report/${job.run_id}`);
+}
+
+async function waitForJob(reportUrl) {
+    const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+
+    while (Date.now() < deadline) {
+        const response = await fetch(reportUrl);
+        if (!response.ok){
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const job = await response.json();
+        if (job.status === 'completed') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Validation job failed');
+        }
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    }
+    throw new Error('Timeout esperando el resultado de la validación');
+}
+
+// Stream batch results (Server-Sent Events over a POST response body).
+// onResult is called with each command result as soon as it completes.
+async function streamBatchCommands(batchData, onResult) {
+    const response = await fetch('/api/validation/batch-commands/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(batchData),
+    });
+
+    if (!response.ok){
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const results = [];
+    let summary = null;
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let eventName = 'message';
+            let data = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event:')) eventName = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            if (!data) continue;
+
+            const payload = JSON.parse(data);
+            if (eventName === 'result') {
+                results.push(payload);
+                if (onResult) onResult(payload, results);
+            } else if (eventName === 'summary') {
+                summary = payload;
+            } else if (eventName === 'error') {
+                throw new Error(payload.error || 'Batch stream failed');
+            }
+        }
+    }
+
+    return { ...(summary || {}), results: results };
+}
+
 // Format validation results into HTML
 function formatValidationResults(result) {
     const data = result.result || result;
@@ -256,20 +357,8 @@ async function runValidation() {
             // Execute batch commands instead of regular validation
             result = await runBatchCommandsForValidation(validationData);
         } else {
-            // Make regular validation API call
-            const response = await fetch('/api/validation/run', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify(validationData),
-            });
-
-            if (!response.ok){
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-
-            result = await response.json();
+            // Queue regular validation and poll for the result
+            result = await submitValidationJob('/api/validation/run', validationData);
         }
 
         // Show results area
@@ -333,21 +422,23 @@ async function runBatchCommandsForValidation(validationData) {
         mode: validationData.mode
     };
 
-    // Make API call to batch commands endpoint
-    const response = await fetch('/api/validation/batch-commands', {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(batchData),
+    // Stream results and show each command as soon as it completes
+    const resultsArea = document.getElementById('resultsArea');
+    const resultsContainer = document.getElementById('validationResults');
+    const batchResult = await streamBatchCommands(batchData, (commandResult, partialResults) => {
+        if (resultsArea) {
+            resultsArea.style.display = 'block';
+        }
+        if (resultsContainer) {
+            const partial = formatBatchResultsAsValidation({ results: partialResults }, validationData);
+            resultsContainer.innerHTML = `
+                <div class="validation-results-compact">
+                    ${formatValidationResults(partial)}
+                </div>
+            `;
+        }
     });
 
-    if (!response.ok){
-        throw new Error(`HTTP error! status: ${response.status}`);
-    }
-
-    const batchResult = await response.json();
-
     // Convert batch results to validation format
     return formatBatchResultsAsValidation(batchResult, validationData);
 }
@@ -411,20 +502,8 @@ async function runBatchCommands() {
     runButton.textContent = 'Ejecutando...';
 
     try {
-        // Make API call to backend
-        const response = await fetch('/api/validation/batch-commands', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(batchData),
-        });
-
-        if (!response.ok){
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-
-        const result = await response.json();
+        // Queue batch commands job and poll for the result
+        const result = await submitValidationJob('/api/validation/batch-commands', batchData);
 
         // Show results
         alert(`✅ Comandos ejecutados exitosamente. Resultados: ${JSON.stringify(result)}`);
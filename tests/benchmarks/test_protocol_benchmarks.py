@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of the Santone protocol layer (pytest-benchmark)
+
+Each benchmark runs one operation over every command of a frame set
+(master, remote, set) or over every captured device response, so a
+regression in a single decoder or frame shape shows up in its group.
+
+Run and keep a baseline::
+
+    pytest tests/benchmarks --benchmark-only --benchmark-save=baseline
+
+Compare against the last saved run and fail on a slowdown::
+
+    pytest tests/benchmarks --benchmark-only --benchmark-compare \\
+        --benchmark-compare-fail=mean:15%
+
+Skipped when pytest-benchmark is not installed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.batch_commands_validator import BatchCommandsValidator
+from validation.crc16 import verify_frame_crc
+from validation.decoder_integration import create_mock_decoder_response
+from validation.hex_frames import (
+    DRS_MASTER_FRAMES, DRS_REMOTE_FRAMES, DRS_SET_FRAMES, FRAME_REGISTRY, validate_frame_format
+)
+from validation.real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES
+from validation.santone_codec import BODY_OFFSET, parse_frame
+from validation.set_commands import build_santone_frame, calculate_crc16_ccitt
+
+FRAME_SETS = {
+    "master": DRS_MASTER_FRAMES,
+    "remote": DRS_REMOTE_FRAMES,
+    "set": DRS_SET_FRAMES,
+}
+
+# (command, body) of every registered frame, to rebuild it
+FRAME_PARTS = {
+    command_type: [(parse_frame(frame).command, parse_frame(frame).body) for frame in frames.values()]
+    for command_type, frames in FRAME_REGISTRY.items()
+}
+
+CAPTURED_RESPONSES = {
+    command: bytes.fromhex(response.replace(" ", "")) for command, response in REAL_DRS_RESPONSES.items()
+}
+
+
+@pytest.mark.benchmark(group="build_santone_frame")
+@pytest.mark.parametrize("command_type", list(FRAME_PARTS))
+def test_build_santone_frame(benchmark, command_type):
+    parts = FRAME_PARTS[command_type]
+
+    def build_all():
+        return [build_santone_frame(command, body) for command, body in parts]
+
+    frames = benchmark(build_all)
+    assert frames == list(FRAME_REGISTRY[command_type].values())
+
+
+@pytest.mark.benchmark(group="calculate_crc16_ccitt")
+@pytest.mark.parametrize("command_type", list(FRAME_PARTS))
+def test_calculate_crc16_ccitt(benchmark, command_type):
+    # CRC over header + body, without flags or CRC
+    payloads = [
+        frame[1:BODY_OFFSET + len(body)]
+        for frame, (_, body) in zip(FRAME_REGISTRY[command_type].values(), FRAME_PARTS[command_type])
+    ]
+
+    crcs = benchmark(lambda: [calculate_crc16_ccitt(payload) for payload in payloads])
+    assert all(len(crc) >= 4 for crc in crcs)
+
+
+@pytest.mark.benchmark(group="validate_frame_format")
+@pytest.mark.parametrize("command_type", list(FRAME_SETS))
+def test_validate_frame_format(benchmark, command_type):
+    frames = list(FRAME_SETS[command_type].values())
+
+    valid = benchmark(lambda: [validate_frame_format(frame) for frame in frames])
+    assert all(valid)
+
+
+@pytest.mark.benchmark(group="captured_responses")
+def test_parse_and_verify_captured(benchmark):
+    responses = list(CAPTURED_RESPONSES.values())
+
+    valid = benchmark(lambda: [verify_frame_crc(response) and parse_frame(response).crc_valid for response in responses])
+    assert all(valid)
+
+
+@pytest.mark.benchmark(group="captured_responses")
+def test_decode_response_captured(benchmark):
+    validator = BatchCommandsValidator()
+    responses = list(CAPTURED_RESPONSES.items())
+
+    decoded = benchmark(lambda: [validator._decode_response(command, response) for command, response in responses])
+    assert not any("decode_error" in values for values in decoded)
+
+
+@pytest.mark.benchmark(group="captured_responses")
+def test_create_mock_decoder_response_captured(benchmark):
+    bodies = [(command, parse_frame(response).body) for command, response in CAPTURED_RESPONSES.items()]
+
+    decoded = benchmark(lambda: [create_mock_decoder_response(command, body) for command, body in bodies])
+    assert len(decoded) == len(bodies)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the asyncio live batch engine
+
+Runs a local asyncio server that answers Santone frames with the captured
+responses after a fixed delay, and checks that devices are validated
+concurrently while each session keeps one command in flight.
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.async_batch_engine import AsyncBatchEngine, AsyncSantoneSession
+from validation.batch_commands_validator import (
+    BatchCommandsValidator, CommandType, BATCH_EVENT_RESULT, BATCH_EVENT_SUMMARY
+)
+from validation.frame_reader import SantoneFrameReader
+from validation.santone_session import MAX_STALE_FRAMES
+from validation.real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES
+
+CAPTURED_BY_COMMAND = {}
+for _hex in REAL_DRS_RESPONSES.values():
+    _frame = bytes.fromhex(_hex.replace(" ", ""))
+    CAPTURED_BY_COMMAND[_frame[4]] = _frame
+
+RESPONSE_DELAY = 0.1
+COMMANDS = ["device_id", "temperature", "datt"]
+
+
+class TestAsyncBatchEngine(unittest.IsolatedAsyncioTestCase):
+    """Test suite for AsyncBatchEngine"""
+
+    async def asyncSetUp(self):
+        self.max_outstanding = 0
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        frame_reader = SantoneFrameReader()
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                frames = frame_reader.feed(data)
+                self.max_outstanding = max(self.max_outstanding, len(frames))
+                for frame in frames:
+                    await asyncio.sleep(RESPONSE_DELAY)
+                    writer.write(CAPTURED_BY_COMMAND[frame[4]])
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_single_device_matches_sync_report(self):
+        """The async report has the same shape as the sync live report"""
+        engine = AsyncBatchEngine(timeout_per_command=2, device_port=self.port)
+        result = await engine.validate_device("127.0.0.1", CommandType.MASTER, COMMANDS)
+
+        sync_keys = set(BatchCommandsValidator()._build_batch_report(
+            "127.0.0.1", CommandType.MASTER, "live", [], [], 0, {}).keys())
+        self.assertEqual(set(result.keys()), sync_keys)
+        self.assertEqual(result["overall_status"], "PASS")
+        self.assertEqual(result["session"]["connections"], 1)
+        self.assertEqual(result["statistics"]["passed"], len(COMMANDS))
+
+    async def test_iter_device_streams_results(self):
+        """Each result is delivered after one round trip, before the batch finishes"""
+        engine = AsyncBatchEngine(timeout_per_command=2, device_port=self.port)
+        start = time.perf_counter()
+        arrivals = []
+
+        async for event, payload in engine.iter_device("127.0.0.1", CommandType.MASTER, COMMANDS):
+            arrivals.append((event, time.perf_counter() - start))
+
+        self.assertEqual([event for event, _ in arrivals], [BATCH_EVENT_RESULT] * len(COMMANDS) + [BATCH_EVENT_SUMMARY])
+        self.assertLess(arrivals[0][1], RESPONSE_DELAY * 2)
+        self.assertEqual(payload["statistics"]["passed"], len(COMMANDS))
+
+    async def test_fleet_runs_devices_concurrently(self):
+        """Fleet wall time is close to one device, not the sum of all devices"""
+        devices = 10
+        engine = AsyncBatchEngine(timeout_per_command=2, device_port=self.port, max_concurrent_devices=devices)
+
+        start = time.perf_counter()
+        result = await engine.validate_fleet(["127.0.0.1"] * devices, CommandType.MASTER, COMMANDS)
+        elapsed = time.perf_counter() - start
+
+        sequential = devices * len(COMMANDS) * RESPONSE_DELAY
+        self.assertLess(elapsed, sequential / 3)
+        self.assertEqual(result["total_devices"], devices)
+        self.assertEqual(result["statistics"]["devices_passed"], devices)
+        self.assertEqual(self.max_outstanding, 1)
+
+    async def test_stale_frames_are_not_taken_as_the_answer(self):
+        """A device that only sends replies to other commands yields a mismatch error"""
+        async def stale(reader, writer):
+            await reader.read(1024)
+            writer.write(CAPTURED_BY_COMMAND[0x02] * MAX_STALE_FRAMES)
+            await writer.drain()
+            await reader.read(1024)
+            writer.close()
+
+        server = await asyncio.start_server(stale, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with AsyncSantoneSession("127.0.0.1", port, timeout=2) as session:
+            response = await session.request(bytes.fromhex("7E070000970000E8357E"))
+        server.close()
+        await server.wait_closed()
+
+        self.assertIsNone(response.data)
+        self.assertFalse(response.timed_out)
+        self.assertIn("mismatch", response.error)
+        self.assertEqual(session.stale_frames, MAX_STALE_FRAMES)
+
+    async def test_fleet_respects_concurrency_cap(self):
+        """No more than max_concurrent_devices sessions are open at once"""
+        in_flight = {"current": 0, "max": 0}
+
+        class CountingEngine(AsyncBatchEngine):
+            async def validate_device(self, *args, **kwargs):
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+                try:
+                    return await super().validate_device(*args, **kwargs)
+                finally:
+                    in_flight["current"] -= 1
+
+        engine = CountingEngine(timeout_per_command=2, device_port=self.port, max_concurrent_devices=2)
+        result = await engine.validate_fleet(["127.0.0.1"] * 6, CommandType.MASTER, ["device_id"])
+
+        self.assertEqual(result["statistics"]["devices_passed"], 6)
+        self.assertEqual(in_flight["max"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
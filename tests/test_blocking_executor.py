@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the bounded executor used for blocking validator calls
+
+Checks that blocking calls leave the event loop responsive, that the pool
+never runs more than max_workers calls at once and that saturation and
+queue depth are reported.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.blocking_executor import BlockingExecutor, ExecutorSaturatedError
+from validation.metrics import REGISTRY
+
+
+class TestBlockingExecutor(unittest.IsolatedAsyncioTestCase):
+    """Test suite for BlockingExecutor"""
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_loop_stays_responsive(self):
+        """A blocking call does not stall other coroutines"""
+        self.executor = BlockingExecutor("test", max_workers=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        result = await self.executor.run(lambda: time.sleep(0.2) or "done")
+        ticker_task.cancel()
+
+        self.assertEqual(result, "done")
+        self.assertGreater(ticks, 10)
+
+    async def test_bounded_concurrency_and_metrics(self):
+        self.executor = BlockingExecutor("bounded", max_workers=2, max_queued=3)
+        self.assertIn('drs_executor_rejected_calls_total{executor="bounded"} 0', REGISTRY.render())
+        lock = threading.Lock()
+        running = {"current": 0, "max": 0}
+
+        def work(value):
+            with lock:
+                running["current"] += 1
+                running["max"] = max(running["max"], running["current"])
+            time.sleep(0.05)
+            with lock:
+                running["current"] -= 1
+            return value * 2
+
+        tasks = [asyncio.create_task(self.executor.run(work, value)) for value in range(5)]
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.executor.stats()["active"], 2)
+        self.assertEqual(self.executor.stats()["queued"], 3)
+
+        with self.assertRaises(ExecutorSaturatedError):
+            await self.executor.run(work, 99)
+
+        self.assertEqual(await asyncio.gather(*tasks), [0, 2, 4, 6, 8])
+        stats = self.executor.stats()
+        self.assertEqual(running["max"], 2)
+        self.assertEqual(stats["completed"], 5)
+        self.assertEqual(stats["rejected"], 1)
+        self.assertIn('drs_executor_rejected_calls_total{executor="bounded"} 1', REGISTRY.render())
+        self.assertEqual(stats["peak_queued"], 3)
+        self.assertGreater(stats["average_wait_ms"], 0)
+
+    async def test_exceptions_propagate(self):
+        self.executor = BlockingExecutor("test", max_workers=1)
+
+        def fail():
+            raise OSError("ping failed")
+
+        with self.assertRaises(OSError):
+            await self.executor.run(fail)
+        self.assertEqual(self.executor.stats()["failed"], 1)
+        self.assertEqual(self.executor.stats()["active"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
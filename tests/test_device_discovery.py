@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for subnet device discovery
+
+Serves simulated DMU and DRU devices on several loopback addresses, scans
+the range and checks responders are found and classified.
+"""
+
+import asyncio
+import socket
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.device_discovery import DeviceKind, DiscoveryEngine, classify_device, expand_cidr
+from validation.drs_simulator import DRSSimulator
+from validation.real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES as MASTER_RESPONSES
+
+# A DRU only answers optical ports 1-2 (the simulator ACKs 3-4 with an empty body)
+DRU_RESPONSES = {
+    name: response for name, response in MASTER_RESPONSES.items()
+    if name not in ("optical_port_devices_connected_3", "optical_port_devices_connected_4")
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestDeviceDiscovery(unittest.IsolatedAsyncioTestCase):
+    """Test suite for DiscoveryEngine"""
+
+    async def asyncSetUp(self):
+        self.port = _free_port()
+        self.dmu = DRSSimulator(hosts=["127.0.0.2", "127.0.0.3"], ports=[self.port])
+        self.dru = DRSSimulator(hosts=["127.0.0.5"], ports=[self.port], responses=DRU_RESPONSES)
+        self.silent = await asyncio.start_server(lambda r, w: None, "127.0.0.6", self.port)
+        await self.dmu.start()
+        await self.dru.start()
+
+    async def asyncTearDown(self):
+        await self.dmu.stop()
+        await self.dru.stop()
+        self.silent.close()
+        await self.silent.wait_closed()
+
+    async def test_discover_and_classify(self):
+        engine = DiscoveryEngine(port=self.port, connect_timeout=0.5, command_timeout=0.3)
+        start = time.perf_counter()
+        report = await engine.discover("127.0.0.0/29")
+        elapsed = time.perf_counter() - start
+
+        by_ip = {device["ip_address"]: device for device in report["devices"]}
+        self.assertEqual(report["hosts_scanned"], 6)
+        self.assertEqual(sorted(by_ip), ["127.0.0.2", "127.0.0.3", "127.0.0.5", "127.0.0.6"])
+        self.assertEqual(by_ip["127.0.0.2"]["device_type"], DeviceKind.DMU)
+        self.assertEqual(by_ip["127.0.0.2"]["device_id"], 0x0BA8)
+        self.assertEqual(by_ip["127.0.0.5"]["device_type"], DeviceKind.DRU)
+        self.assertEqual(sorted(by_ip["127.0.0.5"]["optical_ports"]), [1, 2])
+        self.assertEqual(by_ip["127.0.0.6"]["device_type"], DeviceKind.UNKNOWN)
+        self.assertEqual(report["statistics"]["dmu"], 2)
+        self.assertLess(elapsed, 2.0)
+
+    async def test_scan_is_concurrent(self):
+        """A /24 of closed ports plus a few devices scans in under two seconds"""
+        engine = DiscoveryEngine(port=self.port, connect_timeout=1.5, command_timeout=0.5, max_concurrent=256)
+        start = time.perf_counter()
+        report = await engine.discover("127.0.0.0/24")
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertEqual(report["hosts_scanned"], 254)
+        self.assertEqual(report["statistics"]["dmu"] + report["statistics"]["dru"], 3)
+
+
+class TestDiscoveryHelpers(unittest.TestCase):
+    """Test suite for range expansion and classification"""
+
+    def test_expand_cidr(self):
+        self.assertEqual(len(expand_cidr("192.168.11.0/24")), 254)
+        self.assertEqual(expand_cidr("192.168.11.22"), ["192.168.11.22"])
+        self.assertEqual(len(expand_cidr("192.168.11.22/24")), 254)
+        with self.assertRaises(ValueError):
+            expand_cidr("10.0.0.0/8")
+        with self.assertRaises(ValueError):
+            expand_cidr("not-a-range")
+
+    def test_classify(self):
+        self.assertEqual(classify_device(None, {}), DeviceKind.UNKNOWN)
+        self.assertEqual(classify_device(1, {1: 0, 2: 0, 3: 0, 4: 1}), DeviceKind.DMU)
+        self.assertEqual(classify_device(1, {1: 2, 2: 0, 3: 0, 4: 0}), DeviceKind.DMU)
+        self.assertEqual(classify_device(1, {1: 0, 2: 0}), DeviceKind.DRU)
+
+    def test_classify_cascaded_dru(self):
+        """A DRU with remotes hanging off optical ports 1/2 is still a DRU"""
+        self.assertEqual(classify_device(1, {1: 2, 2: 1}), DeviceKind.DRU)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the DRS response collector
+
+Captures a small fleet of simulated devices into a JSONL capture file and
+checks that a second run only asks for the commands that are missing.
+"""
+
+import json
+import socket
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.drs_response_collector import CaptureLog, DRSResponseCollector, collect_fleet
+from validation.drs_simulator import DRSSimulator
+from validation.hex_frames import DRS_MASTER_FRAMES, DRS_REMOTE_FRAMES
+
+TOTAL_COMMANDS = len(DRS_MASTER_FRAMES) + len(DRS_REMOTE_FRAMES)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestDRSResponseCollector(unittest.IsolatedAsyncioTestCase):
+    """Test suite for DRSResponseCollector"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.capture_path = Path(self.tmp.name) / "capture.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_fleet_capture_and_resume(self):
+        hosts = ["127.0.0.1", "127.0.0.2"]
+        port = _free_port()
+        async with DRSSimulator(hosts=hosts, ports=[port]) as simulator:
+            collectors = await collect_fleet(hosts, self.capture_path, port=port, timeout=2, max_concurrent_devices=2)
+
+            self.assertEqual(set(collectors), set(hosts))
+            for collector in collectors.values():
+                self.assertEqual(collector.successful_commands, TOTAL_COMMANDS)
+                self.assertEqual(collector.connection_attempts, 1)
+            self.assertEqual(simulator.stats.connections, 2)
+            lines = self.capture_path.read_text().splitlines()
+            self.assertEqual(len(lines), 2 * TOTAL_COMMANDS)
+
+            # Interrupted run: the last line is cut and one response is missing
+            self.capture_path.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10])
+            requests_before = simulator.stats.responses
+            collectors = await collect_fleet(hosts, self.capture_path, port=port, timeout=2)
+
+            self.assertEqual(simulator.stats.responses - requests_before, 1)
+            resumed = collectors[json.loads(lines[-1])["target_host"]]
+            self.assertEqual(resumed.successful_commands, TOTAL_COMMANDS)
+            self.assertEqual(len(CaptureLog(self.capture_path).records()), 2 * TOTAL_COMMANDS)
+
+    async def test_unreachable_device_fails_fast(self):
+        collector = DRSResponseCollector("127.0.0.1", _free_port(), timeout=2)
+        await collector.capture()
+
+        self.assertEqual(collector.failed_commands, TOTAL_COMMANDS)
+        self.assertEqual(collector.connection_attempts, 0)
+        self.assertTrue(all(record["error_message"] for record in collector.responses.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the DRS simulator
+
+Runs the asyncio live engine end to end against the simulator serving the
+captured responses, including the drop and truncation fault profiles.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.async_batch_engine import AsyncBatchEngine
+from validation.batch_commands_validator import CommandType, ValidationResult
+from validation.drs_simulator import DRSSimulator, SimulatorProfile, load_response_table
+from validation.real_drs_remote_responses import REAL_DRS_RESPONSES as REMOTE_RESPONSES
+from validation.santone_codec import parse_frame
+
+
+class TestDRSSimulator(unittest.IsolatedAsyncioTestCase):
+    """Test suite for DRSSimulator"""
+
+    async def test_full_master_batch(self):
+        """Every master command gets its captured response"""
+        async with DRSSimulator(ports=[0]) as simulator:
+            host, port = simulator.addresses[0]
+            engine = AsyncBatchEngine(timeout_per_command=2, device_port=port)
+            result = await engine.validate_device(host, CommandType.MASTER)
+
+        self.assertEqual(result["statistics"]["passed"], result["total_commands"])
+        self.assertEqual(simulator.stats.connections, 1)
+        self.assertEqual(simulator.stats.responses, result["total_commands"])
+
+    async def test_many_virtual_devices(self):
+        """One process serves several listeners, validated as a fleet"""
+        async with DRSSimulator(ports=[0, 0, 0, 0], profile=SimulatorProfile(latency_ms=20, jitter_ms=5, seed=1)) as simulator:
+            results = []
+            for host, port in simulator.addresses:
+                engine = AsyncBatchEngine(timeout_per_command=2, device_port=port)
+                results.append(await engine.validate_device(host, CommandType.REMOTE, ["device_id", "temperature"]))
+
+        self.assertTrue(all(r["overall_status"] == "PASS" for r in results))
+        self.assertEqual(len(simulator.stats.per_listener), 4)
+
+    async def test_drop_and_truncate(self):
+        async with DRSSimulator(ports=[0], profile=SimulatorProfile(drop_rate=1.0)) as simulator:
+            host, port = simulator.addresses[0]
+            engine = AsyncBatchEngine(timeout_per_command=0.2, device_port=port)
+            result = await engine.validate_device(host, CommandType.MASTER, ["device_id"])
+        self.assertEqual(result["results"][0]["status"], ValidationResult.TIMEOUT)
+
+        async with DRSSimulator(ports=[0], profile=SimulatorProfile(truncate_rate=1.0)) as simulator:
+            host, port = simulator.addresses[0]
+            engine = AsyncBatchEngine(timeout_per_command=0.5, device_port=port)
+            result = await engine.validate_device(host, CommandType.MASTER, ["device_id"])
+        self.assertNotEqual(result["results"][0]["status"], ValidationResult.PASS)
+        self.assertGreaterEqual(simulator.stats.truncated, 1)
+
+    def test_remote_responses_are_resigned(self):
+        """Hand-edited remote captures are served with a valid CRC"""
+        for frame in load_response_table(REMOTE_RESPONSES).values():
+            self.assertTrue(parse_frame(frame).crc_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
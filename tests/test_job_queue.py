@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the background validation job queue
+
+Checks the bounded worker pool, deduplication of identical in-flight jobs,
+the pending limit and retrieval of finished results.
+"""
+
+import asyncio
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.job_queue import JobQueue, JobStatus, QueueFullError
+from validation.batch_commands_validator import BatchCommandsValidator, CommandType
+
+
+class TestJobQueue(unittest.IsolatedAsyncioTestCase):
+    """Test suite for JobQueue"""
+
+    async def asyncTearDown(self):
+        await self.queue.stop()
+
+    async def test_bounded_workers(self):
+        """Hundreds of jobs queue instantly and never run more than max_workers at once"""
+        self.queue = JobQueue(max_workers=4)
+        running = 0
+        peak = 0
+
+        async def runner(index):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return {"index": index}
+
+        jobs = [self.queue.submit("batch", index, lambda index=index: runner(index))[0] for index in range(200)]
+        self.assertEqual(self.queue.stats()["queued"], 200)
+
+        for job in jobs:
+            await self.queue.wait(job.job_id, timeout=5)
+        self.assertEqual(peak, 4)
+        self.assertEqual(jobs[-1].result, {"index": 199})
+        self.assertEqual(self.queue.stats()["completed"], 200)
+
+    async def test_deduplicates_in_flight_jobs(self):
+        self.queue = JobQueue(max_workers=1)
+        release = asyncio.Event()
+
+        async def runner():
+            await release.wait()
+            return {}
+
+        first, created = self.queue.submit("batch", ("10.0.0.1", "remote", "live"), runner)
+        second, created_again = self.queue.submit("batch", ("10.0.0.1", "remote", "live"), runner)
+        other, _ = self.queue.submit("batch", ("10.0.0.2", "remote", "live"), runner)
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+        release.set()
+        await self.queue.wait(first.job_id, timeout=5)
+        third, created = self.queue.submit("batch", ("10.0.0.1", "remote", "live"), runner)
+        self.assertTrue(created)
+        self.assertNotEqual(third.job_id, first.job_id)
+
+    async def test_failures_and_limits(self):
+        self.queue = JobQueue(max_workers=1, max_pending=2, max_finished=1)
+
+        async def failing():
+            raise RuntimeError("device unreachable")
+
+        job, _ = self.queue.submit("validation", "a", failing)
+        self.queue.submit("validation", "b", failing)
+        with self.assertRaises(QueueFullError):
+            self.queue.submit("validation", "c", failing)
+
+        await self.queue.wait(job.job_id, timeout=5)
+        self.assertIs(job.status, JobStatus.FAILED)
+        self.assertEqual(job.to_dict()["error"], "device unreachable")
+
+        await asyncio.sleep(0.01)
+        self.assertIsNone(self.queue.get(job.job_id))  # Retention limit
+        self.assertEqual(self.queue.stats()["failed"], 2)
+
+    async def test_batch_validation_job(self):
+        """A mock batch validation runs as a job and its report is retrievable"""
+        self.queue = JobQueue(max_workers=2)
+
+        async def runner():
+            return BatchCommandsValidator().validate_batch_commands(
+                "192.168.1.100", CommandType.MASTER, mode="mock", selected_commands=["device_id"]
+            )
+
+        job, _ = self.queue.submit("batch_commands", ("192.168.1.100", "master", "mock"), runner)
+        self.assertEqual(job.to_dict(include_result=False)["status"], "queued")
+        await self.queue.wait(job.job_id, timeout=5)
+
+        report = self.queue.get(job.job_id).to_dict()
+        self.assertEqual(report["status"], "completed")
+        self.assertEqual(report["result"]["commands_tested"], ["device_id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
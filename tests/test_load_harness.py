@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the load harness report
+
+Checks the request mix parser and the latency/error summary; the HTTP
+run itself needs httpx, uvicorn and the simulator processes.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.load_harness import LoadConfig, Sample, build_report, build_request, parse_mix
+
+
+class TestLoadHarness(unittest.TestCase):
+    """Test suite for the load harness helpers"""
+
+    def test_parse_mix(self):
+        self.assertEqual(parse_mix("batch=4,ping"), {"batch": 4.0, "ping": 1.0})
+        with self.assertRaises(ValueError):
+            parse_mix("batch=4,reboot=1")
+        with self.assertRaises(ValueError):
+            parse_mix("batch=0")
+
+    def test_report(self):
+        samples = [Sample("ping", float(ms), 200) for ms in range(1, 101)]
+        samples += [Sample("batch", 900.0, 503), Sample("batch", 60000.0, 0, "ReadTimeout: timed out")]
+        report = build_report(samples, elapsed_s=10.0, config=LoadConfig(), peak_rss_mb=210.5)
+
+        overall = report["overall"]
+        self.assertEqual(overall["requests"], 102)
+        self.assertEqual(overall["errors"], 2)
+        self.assertEqual(overall["throughput_rps"], 10.2)
+        self.assertEqual(report["endpoints"]["ping"]["latency_ms"]["p50"], 50.0)
+        self.assertEqual(report["endpoints"]["ping"]["latency_ms"]["p99"], 99.0)
+        self.assertEqual(report["endpoints"]["batch"]["status_codes"], {"503": 1, "no_response": 1})
+        self.assertEqual(report["app"]["peak_rss_mb"], 210.5)
+        self.assertEqual(report["sample_errors"], ["ReadTimeout: timed out"])
+
+    def test_requests_target_the_device(self):
+        method, path, body = build_request("batch", "127.0.10.7", LoadConfig(mode="live"))
+        self.assertEqual((method, body["ip_address"], body["mode"]), ("POST", "127.0.10.7", "live"))
+        self.assertIn("wait=true", path)
+        self.assertEqual(build_request("ping", "127.0.10.7", LoadConfig())[1], "/api/validation/ping/127.0.10.7")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Prometheus metrics registry
+
+Checks the text exposition format of counters, gauges and histograms and
+that batch validations record per-command latency and outcomes.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.metrics import REGISTRY, MetricsRegistry
+from validation.batch_commands_validator import BatchCommandsValidator, CommandType
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test suite for MetricsRegistry"""
+
+    def test_exposition_format(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("path",))
+        in_flight = registry.gauge("in_flight", "In flight")
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        requests.labels(path='/a"b').inc()
+        requests.labels(path='/a"b').inc(2)
+        with in_flight.track_inprogress():
+            self.assertIn("in_flight 1", registry.render())
+        for value in (0.05, 0.5, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        self.assertIn("# TYPE requests_total counter", lines)
+        self.assertIn('requests_total{path="/a\\"b"} 3', lines)
+        self.assertIn("in_flight 0", lines)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("latency_seconds_sum 4.05", lines)
+        self.assertIn("latency_seconds_count 4", lines)
+
+        with self.assertRaises(ValueError):
+            requests.inc()
+        with self.assertRaises(ValueError):
+            registry.counter("requests_total", "Duplicate")
+
+    def test_batch_records_command_metrics(self):
+        def count(status):
+            for line in REGISTRY.render().splitlines():
+                if line.startswith('drs_command_results_total{command_type="master",mode="mock",status="%s"}' % status):
+                    return float(line.rsplit(" ", 1)[1])
+            return 0.0
+
+        before = count("PASS")
+        report = BatchCommandsValidator().validate_batch_commands(
+            "192.168.1.100", CommandType.MASTER, mode="mock", selected_commands=["device_id", "temperature"]
+        )
+        self.assertEqual(count("PASS") - before, report["statistics"]["passed"])
+
+        rendered = REGISTRY.render()
+        self.assertIn('drs_command_duration_seconds_count{command="device_id",command_type="master",mode="mock"}', rendered)
+        self.assertIn("# TYPE drs_command_duration_seconds histogram", rendered)
+
+    def test_unknown_commands_share_one_label(self):
+        """User-supplied command names do not create new series"""
+        BatchCommandsValidator().validate_batch_commands(
+            "192.168.1.100", CommandType.MASTER, mode="mock", selected_commands=["no_such_command_1", "no_such_command_2"]
+        )
+        rendered = REGISTRY.render()
+        self.assertNotIn("no_such_command", rendered)
+        self.assertIn('drs_command_duration_seconds_count{command="unknown",command_type="master",mode="mock"}', rendered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the in-process reachability prober
+
+Probes local listeners over TCP, checks that a refused connection counts as
+reachable, that silent hosts time out and that results keep the
+"Network Ping" test shape.
+"""
+
+import asyncio
+import socket
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.reachability import (
+    ReachabilityProber, ProbeResult, build_echo_request, icmp_available, probe_host, _checksum
+)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestReachabilityProber(unittest.IsolatedAsyncioTestCase):
+    """Test suite for ReachabilityProber"""
+
+    async def asyncSetUp(self):
+        self.server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_tcp_probe(self):
+        prober = ReachabilityProber(timeout=1, tcp_port=self.port, use_icmp=False)
+        result = await prober.probe("127.0.0.1")
+        self.assertTrue(result.reachable)
+        self.assertEqual(result.method, "tcp")
+        self.assertIsNotNone(result.rtt_ms)
+
+        test = result.to_test_dict()
+        self.assertEqual(test["name"], "Network Ping")
+        self.assertEqual(test["status"], "PASS")
+        self.assertEqual(set(test), {"name", "status", "message", "details", "duration_ms"})
+
+    async def test_refused_port_is_reachable(self):
+        """A RST proves the host is up even with the DRS port closed"""
+        prober = ReachabilityProber(timeout=1, tcp_port=_free_port(), use_icmp=False)
+        result = await prober.probe("127.0.0.1")
+        self.assertTrue(result.reachable)
+        self.assertIn("closed", result.error)
+
+    async def test_unreachable_host(self):
+        """A host that never answers fails after the timeout"""
+        async def silent(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        prober = ReachabilityProber(timeout=0.3, use_icmp=False)
+        start = time.perf_counter()
+        with mock.patch("validation.reachability.asyncio.open_connection", silent):
+            result = await prober.probe("192.0.2.1")
+        self.assertFalse(result.reachable)
+        self.assertIn("timeout", result.error)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(result.to_test_dict()["status"], "FAIL")
+
+    async def test_probe_many_concurrently(self):
+        prober = ReachabilityProber(timeout=1, tcp_port=self.port, max_concurrent=50, use_icmp=False)
+        hosts = ["127.0.0.1"] * 100
+        results = await prober.probe_many(hosts)
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all(result.reachable for result in results))
+
+    @unittest.skipUnless(icmp_available(), "unprivileged ICMP sockets not permitted")
+    async def test_icmp_probe(self):
+        prober = ReachabilityProber(timeout=1, tcp_port=self.port, use_icmp=True)
+        result = await prober._probe_icmp("127.0.0.1")
+        self.assertTrue(result.reachable, result.error)
+        self.assertEqual(result.method, "icmp")
+
+        result = await prober.probe("127.0.0.1")
+        self.assertTrue(result.reachable)
+
+    async def test_probe_never_raises(self):
+        """An unexpected error in one probe becomes a failed result"""
+        async def broken(ip_address):
+            raise AttributeError("sock_sendto")
+
+        prober = ReachabilityProber(timeout=1, tcp_port=self.port, use_icmp=True)
+        with mock.patch.object(prober, "_probe_icmp", broken):
+            result = await prober.probe("127.0.0.1")
+        self.assertTrue(result.reachable)
+        self.assertEqual(result.method, "tcp")
+
+        with mock.patch.object(prober, "_probe_icmp", broken), mock.patch.object(prober, "_probe_tcp", broken):
+            result = await prober.probe("127.0.0.1")
+        self.assertFalse(result.reachable)
+        self.assertIn("AttributeError", result.error)
+
+
+class TestEchoRequest(unittest.TestCase):
+    """Test suite for the ICMP packet builder and the sync wrapper"""
+
+    def test_checksum(self):
+        packet = build_echo_request(0x1234, 7)
+        self.assertEqual(packet[0], 8)
+        self.assertEqual(_checksum(packet), 0)
+
+    def test_probe_host_sync(self):
+        result = probe_host("127.0.0.1", timeout=1, tcp_port=_free_port())
+        self.assertIsInstance(result, ProbeResult)
+        self.assertTrue(result.reachable)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the compressed JSONL results archive
+
+Moves old runs out of the SQLite store into rotated segments, checks that
+lookups only decompress the indexed block, and applies retention.
+"""
+
+import gzip
+import json
+import tempfile
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.result_archive import ResultArchive, Segment
+from validation.result_store import ResultStore
+
+
+class TestResultArchive(unittest.TestCase):
+    """Test suite for ResultArchive"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.store = ResultStore(self.root / "results.db")
+        for index in range(40):
+            self.store.save(
+                {
+                    "overall_status": "FAIL" if index % 4 == 0 else "PASS",
+                    "results": [{"command": "device_id", "status": "PASS", "response_data": "7E" * 40}],
+                    "index": index,
+                },
+                ip_address=f"10.0.0.{index % 2}", mode="live",
+                timestamp=(datetime(2025, 1, 1) + timedelta(days=index)).isoformat()
+            )
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_archive_and_lookup(self):
+        archive = ResultArchive(self.root / "archive", block_bytes=2048)
+        moved = archive.archive_store(self.store, before="2025-01-31T00:00:00", batch_size=7)
+        self.assertEqual(moved, 30)
+        self.assertEqual(self.store.count(), 10)
+
+        # Every segment is a valid concatenation of gzip members
+        segment = archive.segments()[0]
+        with gzip.open(segment.path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 30)
+        self.assertEqual(lines[0]["commands"][0]["command"], "device_id")
+
+        # A lookup decompresses a single block
+        with mock.patch.object(Segment, "read_block", autospec=True, side_effect=Segment.read_block) as read_block:
+            record = archive.get(lines[12]["id"])
+        self.assertEqual(record["result"]["index"], 12)
+        self.assertEqual(read_block.call_count, 1)
+
+        page, cursor = archive.history(limit=4, status="FAIL", ip_address="10.0.0.0")
+        self.assertEqual([r["result"]["index"] for r in page], [28, 24, 20, 16])
+        page, cursor = archive.history(limit=4, cursor=cursor, status="FAIL", ip_address="10.0.0.0")
+        self.assertEqual([r["result"]["index"] for r in page], [12, 8, 4, 0])
+        self.assertIsNone(cursor)
+
+        # Index-only projections never touch the segment data
+        with mock.patch.object(Segment, "read_block") as read_block:
+            page, _ = archive.history(limit=2, fields=["timestamp", "status", "mode"], since="2025-01-10")
+        read_block.assert_not_called()
+        self.assertEqual(page[0], {"timestamp": "2025-01-30T00:00:00", "status": "PASS", "mode": "live"})
+
+        # The index survives a restart
+        reopened = ResultArchive(self.root / "archive")
+        self.assertEqual(reopened.stats()["records"], 30)
+        self.assertEqual(reopened.get(lines[0]["id"])["result"]["index"], 0)
+
+    def test_resume_after_crash_before_delete(self):
+        archive = ResultArchive(self.root / "archive", block_bytes=2048)
+        # Crash between append and delete: the batch is archived but still in SQLite
+        with mock.patch.object(ResultStore, "delete", side_effect=RuntimeError("crash")):
+            with self.assertRaises(RuntimeError):
+                archive.archive_store(self.store, before="2025-01-31T00:00:00", batch_size=7)
+        self.assertEqual(archive.stats()["records"], 7)
+        self.assertEqual(self.store.count(), 40)
+
+        reopened = ResultArchive(self.root / "archive", block_bytes=2048)
+        moved = reopened.archive_store(self.store, before="2025-01-31T00:00:00", batch_size=7)
+        self.assertEqual(moved, 23)
+        self.assertEqual(self.store.count(), 10)
+        self.assertEqual(reopened.stats()["records"], 30)
+        page, cursor = reopened.history(limit=100, fields=["id"])
+        ids = [record["id"] for record in page]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertIsNone(cursor)
+
+    def test_rotation_and_retention(self):
+        archive = ResultArchive(self.root / "archive", max_segment_bytes=1, max_segment_age=timedelta(days=1))
+        now = datetime(2025, 6, 1)
+        for start in range(0, 40, 10):
+            records = self.store.oldest(before="2026-01-01", limit=10)
+            archive.append(records, now=now + timedelta(seconds=start))
+            self.store.delete([record["id"] for record in records])
+        self.assertEqual(len(archive.segments()), 4)  # Size limit: one segment per append
+
+        by_age = ResultArchive(self.root / "by_age", max_segment_age=timedelta(hours=1))
+        by_age.append([{"id": 1, "timestamp": "2025-01-01T00:00:00"}], now=now)
+        by_age.append([{"id": 2, "timestamp": "2025-01-01T00:00:01"}], now=now + timedelta(minutes=30))
+        by_age.append([{"id": 3, "timestamp": "2025-01-01T00:00:02"}], now=now + timedelta(hours=2))
+        self.assertEqual([len(segment.entries) for segment in by_age.segments()], [2, 1])
+
+        removed = archive.apply_retention(365, now=datetime(2026, 1, 25))
+        self.assertEqual(len(removed), 2)
+        self.assertEqual(archive.stats()["records"], 20)
+        self.assertEqual(len(list((self.root / "archive").glob("*.idx"))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the SQLite result store
+
+Stores batch and scenario results, checks per-command rows, indexed
+filtering/pagination and the one-time import of legacy JSON files.
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.batch_commands_validator import BatchCommandsValidator, CommandType
+from validation.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    """Test suite for ResultStore"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(Path(self.tmp.name) / "results.db")
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_save_batch_with_command_rows(self):
+        batch = BatchCommandsValidator().validate_batch_commands(
+            "192.168.11.22", CommandType.MASTER, "mock", ["device_id", "temperature"]
+        )
+        run_pk = self.store.save(batch, scenario_id="batch_master")
+
+        record = self.store.get(run_pk)
+        self.assertEqual(record["request"]["ip_address"], "192.168.11.22")
+        self.assertEqual(record["request"]["device_type"], "master")
+        self.assertEqual(record["overall_status"], "PASS")
+        self.assertEqual([c["command"] for c in record["commands"]], ["device_id", "temperature"])
+        self.assertEqual(record["commands"][0]["status"], "PASS")
+        self.assertEqual(record["result"]["results"][0]["status"], "PASS")
+
+    def test_filters_and_pagination(self):
+        for index in range(30):
+            self.store.save(
+                {"overall_status": "FAIL" if index % 3 == 0 else "PASS", "tests": [{"name": "Network Ping", "status": "PASS"}]},
+                ip_address=f"10.0.0.{index % 5}", device_type="dmu_ethernet", scenario_id="dmu_basic_check",
+                mode="live", timestamp=f"2025-10-01T00:00:{index:02d}"
+            )
+
+        page, cursor = self.store.history(limit=10)
+        self.assertEqual(len(page), 10)
+        self.assertEqual(page[0]["timestamp"], "2025-10-01T00:00:29")
+
+        # Walking the cursor visits every run exactly once
+        seen = [record["id"] for record in page]
+        while cursor:
+            page, cursor = self.store.history(limit=7, cursor=cursor)
+            seen.extend(record["id"] for record in page)
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(len(set(seen)), 30)
+
+        self.assertEqual(self.store.count(status="FAIL"), 10)
+        self.assertEqual(self.store.count(ip_address="10.0.0.1"), 6)
+        self.assertEqual(self.store.count(since="2025-10-01T00:00:20"), 10)
+        failed, _ = self.store.history(status="FAIL")
+        self.assertTrue(all(r["request"]["live_mode"] for r in failed))
+
+        plan = self.store._connection().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE ip_address = ? ORDER BY timestamp DESC", ("10.0.0.1",)
+        ).fetchall()
+        self.assertIn("idx_runs_ip_timestamp", " ".join(row[-1] for row in plan))
+
+    def test_projection_and_summary(self):
+        for index in range(6):
+            self.store.save(
+                {"overall_status": "PASS" if index % 2 else "FAIL", "results": [{"command": "device_id", "status": "PASS"}]},
+                ip_address="10.0.0.1", timestamp=f"2025-10-02T00:00:0{index}"
+            )
+        self.store.save({"overall_status": "PASS"}, ip_address="10.0.0.2", timestamp="2025-10-02T00:01:00")
+
+        page, cursor = self.store.history(limit=2, fields=["timestamp", "status"], ip_address="10.0.0.1")
+        self.assertEqual(page, [
+            {"timestamp": "2025-10-02T00:00:05", "status": "PASS"},
+            {"timestamp": "2025-10-02T00:00:04", "status": "FAIL"},
+        ])
+        page, _ = self.store.history(limit=2, cursor=cursor, fields=["timestamp"], ip_address="10.0.0.1")
+        self.assertEqual(page[0]["timestamp"], "2025-10-02T00:00:03")
+
+        with self.assertRaises(ValueError):
+            self.store.history(fields=["password"])
+        with self.assertRaises(ValueError):
+            self.store.history(cursor="!!!")
+
+        summary = self.store.summary(ip_address="10.0.0.1")
+        self.assertEqual(summary["total"], 6)
+        self.assertEqual(summary["by_status"], {"PASS": 3, "FAIL": 3})
+        self.assertEqual(summary["last_timestamp"], "2025-10-02T00:00:05")
+
+    def test_wal_and_threads(self):
+        self.assertEqual(self.store._connection().execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        def writer():
+            for _ in range(20):
+                self.store.save({"overall_status": "PASS"}, ip_address="10.0.0.9")
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.store.count(ip_address="10.0.0.9"), 80)
+
+    def test_legacy_json_import(self):
+        legacy_dir = Path(self.tmp.name) / "legacy"
+        legacy_dir.mkdir()
+        for index in range(3):
+            with open(legacy_dir / f"20250926_19400{index}_dmu_ethernet_192_168_11_22.json", "w", encoding="utf-8") as f:
+                json.dump({
+                    "timestamp": f"2025-09-26T19:40:0{index}",
+                    "request": {"ip_address": "192.168.11.22", "device_type": "dmu_ethernet", "hostname": "dmu", "live_mode": True},
+                    "result": {"status": "PASS", "message": "ok"}
+                }, f, indent=2)
+        (legacy_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        counts = self.store.import_legacy_directory(legacy_dir)
+        self.assertEqual(counts, {"imported": 3, "skipped": 0, "failed": 1})
+        self.assertIsNone(self.store.import_legacy_directory(legacy_dir))
+        self.assertEqual(self.store.import_json_files(legacy_dir.glob("*.json"))["skipped"], 3)
+
+        latest = self.store.history(limit=1, device_type="dmu_ethernet")[0][0]
+        self.assertEqual(latest["filename"], "20250926_194002_dmu_ethernet_192_168_11_22.json")
+        self.assertEqual(latest["overall_status"], "PASS")
+
+
+if __name__ == "__main__":
+    unittest.main()
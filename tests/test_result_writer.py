@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for write-behind result persistence
+
+Checks that queued results are committed in batches, that the backlog is
+bounded and that stopping the writer flushes everything still queued.
+"""
+
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.result_store import ResultStore
+from validation.result_writer import ResultWriter
+
+
+class BlockingStore(ResultStore):
+    """ResultStore whose first batch waits until the test releases it"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.batch_sizes = []
+
+    def save_many(self, items):
+        items = list(items)
+        self.batch_sizes.append(len(items))
+        self.entered.set()
+        self.release.wait(5)
+        return super().save_many(items)
+
+
+class TestResultWriter(unittest.TestCase):
+    """Test suite for ResultWriter"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = BlockingStore(Path(self.tmp.name) / "results.db")
+
+    def tearDown(self):
+        self.store.release.set()
+        self.writer.stop(timeout=5)
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_batches_while_writing(self):
+        """Results queued during a slow commit are written together in the next one"""
+        self.writer = ResultWriter(self.store, batch_size=100)
+        self.assertTrue(self.writer.submit({"overall_status": "PASS"}, ip_address="10.0.0.1"))
+        self.assertTrue(self.store.entered.wait(5))
+
+        for index in range(50):
+            self.writer.submit({"overall_status": "PASS", "index": index}, ip_address="10.0.0.2")
+        self.assertEqual(self.writer.stats()["queued"], 50)
+
+        self.store.release.set()
+        self.assertTrue(self.writer.flush(timeout=5))
+        self.assertEqual(self.store.batch_sizes, [1, 50])
+        self.assertEqual(self.store.count(), 51)
+
+        stats = self.writer.stats()
+        self.assertEqual(stats["written"], 51)
+        self.assertEqual(stats["batches"], 2)
+        self.assertEqual(stats["pending"], 0)
+
+        # Submission time is kept as the run timestamp, so history order is preserved
+        page, _ = self.store.history(limit=1, fields=["ip_address"])
+        self.assertEqual(page[0]["ip_address"], "10.0.0.2")
+
+    def test_bounded_backlog_and_flush_on_stop(self):
+        self.writer = ResultWriter(self.store, max_backlog=5)
+        self.writer.submit({"overall_status": "PASS"})
+        self.assertTrue(self.store.entered.wait(5))
+
+        accepted = [self.writer.submit({"overall_status": "FAIL"}) for _ in range(8)]
+        self.assertEqual(accepted.count(True), 5)
+        self.assertEqual(self.writer.stats()["rejected"], 3)
+
+        self.store.release.set()
+        self.assertTrue(self.writer.stop(timeout=5))
+        self.assertFalse(self.writer.running)
+        self.assertEqual(self.store.count(), 6)
+        self.assertFalse(self.writer.submit({"overall_status": "PASS"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
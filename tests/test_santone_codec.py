@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Santone codec
+
+Parses the captured device responses and checks header fields, the
+length-driven body slice, CRC verification, escape handling and decoder
+dispatch by command number.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation import santone_codec
+from validation.santone_codec import (
+    DECODERS, FrameError, parse_frame, decode_body, decode_frame, decode_stacked, unescape, register_decoder
+)
+from validation.crc16 import escape_crc, crc16_xmodem
+from validation.real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES
+
+
+def _captured(command_name):
+    return bytes.fromhex(REAL_DRS_RESPONSES[command_name].replace(" ", ""))
+
+
+class TestSantoneCodec(unittest.TestCase):
+    """Test suite for parse_frame / decode_body"""
+
+    def test_parse_captured_responses(self):
+        """Every captured response parses with a valid CRC and the declared body length"""
+        for command_name in REAL_DRS_RESPONSES:
+            frame = parse_frame(_captured(command_name))
+            self.assertTrue(frame.crc_valid, command_name)
+            self.assertEqual(len(frame.body), frame.length)
+            self.assertEqual(frame.command_name, command_name)
+
+    def test_body_is_length_driven(self):
+        """The 64-byte channel_frequency_configuration body is sliced by LEN"""
+        frame = parse_frame(_captured("channel_frequency_configuration"))
+        self.assertEqual(frame.command, 0x36)
+        self.assertEqual(frame.length, 0x40)
+        self.assertEqual(frame.body[:4], bytes.fromhex("F2241600"))
+
+    def test_escaped_frame(self):
+        """Raw wire frames with 5E escapes in the body are unescaped before parsing"""
+        inner = bytes.fromhex("0700009700027E5E")
+        crc = crc16_xmodem(inner)
+        wire = b"\x7e" + inner.replace(b"\x5e", b"\x5e\x5d").replace(b"\x7e", b"\x5e\x7d") + escape_crc(crc) + b"\x7e"
+
+        frame = parse_frame(wire, escaped=True)
+        self.assertEqual(frame.body, bytes.fromhex("7E5E"))
+        self.assertTrue(frame.crc_valid)
+        self.assertEqual(unescape(bytes.fromhex("5E5D7D")), bytes.fromhex("5E7D"))
+
+    def test_malformed_frames(self):
+        with self.assertRaises(FrameError):
+            parse_frame(bytes.fromhex("010302000179847E"))
+        with self.assertRaises(FrameError):
+            parse_frame(bytes.fromhex("7E070000970010A80B9ACD7E"))
+
+    def test_decode_dispatch(self):
+        """Decoders are selected by the command byte of the frame"""
+        decoded = decode_frame(_captured("device_id"))
+        self.assertEqual(decoded["device_id"], 0x0BA8)
+        self.assertTrue(decoded["_frame"]["crc_valid"])
+
+        generic = decode_body(0x81, b"\x03")
+        self.assertEqual(generic, {"broadband_switching": "raw_hex_03"})
+
+    def test_register_decoder(self):
+        """New commands plug into the dispatch table without touching existing decoders"""
+        @register_decoder(0x09)
+        def _decode_datt(command_name, body):
+            return {"datt_raw": list(body)}
+
+        try:
+            decoded = decode_frame(_captured("datt"))
+            self.assertEqual(decoded["datt_raw"], [0] * 6)
+            with self.assertRaises(ValueError):
+                register_decoder(0x97)(_decode_datt)
+        finally:
+            del DECODERS[0x09]
+
+
+class TestStackedDecoding(unittest.TestCase):
+    """Test suite for multi-channel decoding across many devices"""
+
+    def setUp(self):
+        self.frequency_body = parse_frame(_captured("channel_frequency_configuration")).body
+        self.switch_body = parse_frame(_captured("channel_switch")).body
+
+    def test_single_frame_frequencies(self):
+        decoded = decode_frame(_captured("channel_frequency_configuration"))
+        self.assertEqual(len(decoded["channel_frequencies_mhz"]), 16)
+        self.assertEqual(decoded["channel_frequencies_mhz"][0], 145.125)
+        self.assertEqual(decode_frame(_captured("channel_switch"))["active_channels"], 12)
+
+    def test_struct_fallback(self):
+        with mock.patch.object(santone_codec, "NUMPY_AVAILABLE", False):
+            matrix = decode_stacked(0x36, [self.frequency_body] * 3)
+        self.assertEqual(len(matrix), 3)
+        self.assertEqual(matrix[2], decode_frame(_captured("channel_frequency_configuration"))["channel_frequencies_mhz"])
+
+        with self.assertRaises(ValueError):
+            decode_stacked(0x36, [self.frequency_body[:-4]])
+        with self.assertRaises(ValueError):
+            decode_stacked(0x97, [b"\x00\x00"])
+
+    @unittest.skipUnless(santone_codec.NUMPY_AVAILABLE, "numpy not installed")
+    def test_numpy_matches_fallback(self):
+        for command, body in ((0x36, self.frequency_body), (0x42, self.switch_body)):
+            matrix = decode_stacked(command, [body] * 4)
+            self.assertEqual(matrix.shape, (4, 16))
+            with mock.patch.object(santone_codec, "NUMPY_AVAILABLE", False):
+                self.assertEqual(matrix.tolist(), decode_stacked(command, [body] * 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the persistent Santone session and the frame reader
+
+Uses a local threaded TCP server that answers every frame with the
+captured response for that command, so the live batch path can be
+exercised without a real DRS device.
+"""
+
+import unittest
+import socket
+import socketserver
+import threading
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.batch_commands_validator import BatchCommandsValidator, CommandType, ValidationResult
+from validation.santone_session import MAX_STALE_FRAMES, SantoneSession
+from validation.frame_reader import SantoneFrameReader
+from validation.crc16 import verify_frame_crc
+from validation.set_commands import build_santone_frame, calculate_crc16_ccitt
+from validation.real_drs_responses_20250926_194004 import REAL_DRS_RESPONSES
+
+# Captured responses keyed by COMMAND_NUMBER
+CAPTURED_BY_COMMAND = {}
+for _hex in REAL_DRS_RESPONSES.values():
+    _frame = bytes.fromhex(_hex.replace(" ", ""))
+    CAPTURED_BY_COMMAND[_frame[4]] = _frame
+
+DEVICE_ID_RESPONSE = CAPTURED_BY_COMMAND[0x97]
+
+
+class _FakeDeviceHandler(socketserver.BaseRequestHandler):
+    """Answers each received frame with the captured response, split in two segments"""
+
+    def handle(self):
+        self.server.connections += 1
+        reader = SantoneFrameReader()
+        while True:
+            data = self.request.recv(1024)
+            if not data:
+                return
+            for frame in reader.feed(data):
+                self.server.frames += 1
+                response = self.server.responses.get(frame[4], CAPTURED_BY_COMMAND[frame[4]])
+                self.request.sendall(response[:5])
+                self.request.sendall(response[5:])
+                if self.server.drop_after and self.server.frames == self.server.drop_after:
+                    return
+
+
+class _FakeDeviceServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, drop_after: int = 0):
+        super().__init__(("127.0.0.1", 0), _FakeDeviceHandler)
+        self.connections = 0
+        self.frames = 0
+        self.drop_after = drop_after
+        self.responses = {}
+
+
+class TestSantoneSession(unittest.TestCase):
+    """Test suite for SantoneSession and the live batch path"""
+
+    def _start_server(self, drop_after: int = 0) -> _FakeDeviceServer:
+        server = _FakeDeviceServer(drop_after)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_batch_uses_single_connection(self):
+        """A whole live batch is sent over one TCP connection"""
+        server = self._start_server()
+        validator = BatchCommandsValidator(timeout_per_command=2, device_port=server.server_address[1])
+
+        commands = ["device_id", "temperature", "datt", "channel_switch"]
+        result = validator.validate_batch_commands(
+            ip_address="127.0.0.1",
+            command_type=CommandType.MASTER,
+            mode="live",
+            selected_commands=commands
+        )
+
+        self.assertEqual(result["statistics"]["passed"], len(commands))
+        for cmd_result in result["results"]:
+            frame = bytes.fromhex(cmd_result["response_data"])
+            self.assertEqual(frame[4], CAPTURED_BY_COMMAND[frame[4]][4])
+        self.assertEqual(server.connections, 1)
+        self.assertEqual(server.frames, len(commands))
+        self.assertEqual(result["session"]["connections"], 1)
+        self.assertEqual(result["session"]["requests"], len(commands))
+
+        # Only the first command pays the handshake
+        self.assertGreater(result["results"][0]["connect_ms"], 0)
+        for cmd_result in result["results"][1:]:
+            self.assertEqual(cmd_result["connect_ms"], 0)
+
+        # Every command is split into contiguous phases that add up to its duration
+        for cmd_result in result["results"]:
+            phases = cmd_result["phases_ms"]
+            self.assertEqual(list(phases), ["connect", "send", "first_byte", "frame_complete", "crc_check", "decode"])
+            self.assertAlmostEqual(sum(phases.values()), cmd_result["duration_ms"], delta=0.5)
+
+    def test_reconnects_after_device_drop(self):
+        """Session reconnects transparently when the device closes the socket"""
+        server = self._start_server(drop_after=1)
+
+        with SantoneSession("127.0.0.1", server.server_address[1], timeout=2) as session:
+            first = session.request(bytes.fromhex("7E070000970000E8357E"))
+            second = session.request(bytes.fromhex("7E070000970000E8357E"))
+
+        self.assertEqual(first.data, DEVICE_ID_RESPONSE)
+        self.assertEqual(second.data, DEVICE_ID_RESPONSE)
+        self.assertTrue(second.reconnected)
+        self.assertEqual(session.reconnects, 1)
+
+    def test_stale_frames_are_not_taken_as_the_answer(self):
+        """Only replies to other commands: a mismatch error, never a wrong frame"""
+        server = self._start_server()
+        server.responses[0x97] = CAPTURED_BY_COMMAND[0x02] * MAX_STALE_FRAMES
+
+        with SantoneSession("127.0.0.1", server.server_address[1], timeout=2) as session:
+            response = session.request(bytes.fromhex("7E070000970000E8357E"))
+
+        self.assertIsNone(response.data)
+        self.assertFalse(response.timed_out)
+        self.assertIn("mismatch", response.error)
+        self.assertEqual(session.stale_frames, MAX_STALE_FRAMES)
+
+    def test_connection_refused(self):
+        """Connect errors are reported without raising"""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            free_port = probe.getsockname()[1]
+
+        validator = BatchCommandsValidator(timeout_per_command=1, device_port=free_port)
+        result = validator.validate_batch_commands(
+            ip_address="127.0.0.1",
+            command_type=CommandType.MASTER,
+            mode="live",
+            selected_commands=["device_id"]
+        )
+
+        self.assertEqual(result["results"][0]["status"], ValidationResult.ERROR)
+        self.assertIn("Connect error", result["results"][0]["error"])
+        self.assertEqual(result["session"]["connections"], 0)
+
+    def test_mismatch_is_not_reported_as_timeout(self):
+        """Eight replies to another command are an ERROR with the mismatch, not a TCP timeout"""
+        server = self._start_server()
+        server.responses[0x97] = CAPTURED_BY_COMMAND[0x02] * 8
+
+        validator = BatchCommandsValidator(timeout_per_command=2, device_port=server.server_address[1])
+        result = validator.validate_batch_commands(
+            ip_address="127.0.0.1",
+            command_type=CommandType.MASTER,
+            mode="live",
+            selected_commands=["device_id"]
+        )
+
+        command_result = result["results"][0]
+        self.assertEqual(command_result["status"], ValidationResult.ERROR)
+        self.assertIn("Response mismatch", command_result["error"])
+        self.assertLess(command_result["duration_ms"], 1000)
+
+
+class TestSantoneFrameReader(unittest.TestCase):
+    """Test suite for incremental frame reassembly"""
+
+    def test_frame_split_across_segments(self):
+        """The 64-byte channel_frequency_configuration body survives any split"""
+        frame = CAPTURED_BY_COMMAND[0x36]
+        for split in range(1, len(frame)):
+            reader = SantoneFrameReader()
+            self.assertEqual(reader.feed(frame[:split]), [])
+            self.assertEqual(reader.feed(frame[split:]), [frame])
+
+    def test_merged_frames(self):
+        """Two frames in one segment are returned separately"""
+        first = CAPTURED_BY_COMMAND[0x97]
+        second = CAPTURED_BY_COMMAND[0x02]
+        reader = SantoneFrameReader()
+        self.assertEqual(reader.feed(first + second[:4]), [first])
+        self.assertEqual(reader.feed(second[4:]), [second])
+
+    def test_escape_sequences(self):
+        """5E7D and 5E5D are unescaped, also when split between segments"""
+        reader = SantoneFrameReader()
+        self.assertEqual(reader.feed(bytes.fromhex("7E0700005E")), [])
+        frames = reader.feed(bytes.fromhex("7D5E5D7E"))
+        self.assertEqual(frames, [bytes.fromhex("7E0700007E5E7E")])
+
+    def test_leading_garbage_is_discarded(self):
+        """Bytes outside 7E...7E are skipped"""
+        reader = SantoneFrameReader()
+        frame = CAPTURED_BY_COMMAND[0xF8]
+        self.assertEqual(reader.feed(b"\x00\x01" + frame), [frame])
+        self.assertEqual(reader.bytes_discarded, 2)
+
+
+class TestCRC16(unittest.TestCase):
+    """Test suite for the CRC16/XMODEM helpers"""
+
+    def test_captured_responses_verify(self):
+        """Every captured device response carries a valid CRC"""
+        for frame in CAPTURED_BY_COMMAND.values():
+            self.assertTrue(verify_frame_crc(frame), frame.hex())
+
+    def test_corrupted_frame_fails(self):
+        frame = bytearray(CAPTURED_BY_COMMAND[0x02])
+        frame[7] ^= 0xFF
+        self.assertFalse(verify_frame_crc(bytes(frame)))
+
+    def test_built_set_frame_matches_legacy_hex(self):
+        """Byte-level builder keeps the frames the device already accepts"""
+        self.assertEqual(calculate_crc16_ccitt(bytes.fromhex("070000F8000100")), "FB30")
+        frame = build_santone_frame(0xF8, b"")
+        self.assertEqual(frame[0], 0x7E)
+        self.assertEqual(frame[-1], 0x7E)
+        self.assertTrue(verify_frame_crc(frame))
+
+    def test_corrupted_response_is_reported(self):
+        """A live response with a bad CRC is a FAIL, not a PASS"""
+        frame = bytearray(CAPTURED_BY_COMMAND[0x97])
+        frame[-3] ^= 0x01
+
+        server = _FakeDeviceServer()
+        server.responses = {0x97: bytes(frame)}
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            validator = BatchCommandsValidator(timeout_per_command=2, device_port=server.server_address[1])
+            result = validator.validate_batch_commands(
+                ip_address="127.0.0.1",
+                command_type=CommandType.MASTER,
+                mode="live",
+                selected_commands=["device_id"]
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(result["results"][0]["status"], ValidationResult.FAIL)
+        self.assertEqual(result["results"][0]["error"], "CRC mismatch")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for per-command phase spans
+
+Checks the phase breakdown of a command timeline and the OTLP/JSON
+document written by the file exporter (batch -> command -> phase).
+"""
+
+import json
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation.batch_commands_validator import CommandTestResult, CommandType, ValidationResult
+from validation.spans import (
+    CommandTimeline, FileSpanExporter, build_batch_spans, configure_span_export, export_batch_spans,
+    shutdown_span_export
+)
+
+
+def _timed_result(command: str, status: ValidationResult = ValidationResult.PASS) -> CommandTestResult:
+    timeline = CommandTimeline()
+    for phase in ("connect", "send", "first_byte", "frame_complete", "crc_check", "decode"):
+        time.sleep(0.001)
+        timeline.mark(phase)
+    return CommandTestResult(
+        command=command,
+        command_type=CommandType.MASTER,
+        status=status,
+        message="",
+        error="" if status == ValidationResult.PASS else "CRC mismatch",
+        duration_ms=round(timeline.elapsed_ms(), 2),
+        phases_ms=timeline.phases_ms(),
+        started_unix_ns=timeline.start_unix_ns
+    )
+
+
+class TestSpans(unittest.TestCase):
+    """Test suite for CommandTimeline and the span exporters"""
+
+    def test_timeline_phases(self):
+        timeline = CommandTimeline()
+        timeline.mark("connect")
+        timeline.mark("send")
+        timeline.mark_once("first_byte")
+        timeline.mark_once("first_byte")
+        timeline.mark_wait()  # Timeout after the first byte: the rest of the frame
+        phases = timeline.phases_ms()
+        self.assertEqual(list(phases), ["connect", "send", "first_byte", "frame_complete"])
+        self.assertLessEqual(sum(phases.values()), timeline.elapsed_ms())
+
+    def test_batch_spans_hierarchy(self):
+        results = [_timed_result("device_id"), _timed_result("temperature", ValidationResult.FAIL)]
+        results.append(CommandTestResult("datt", CommandType.MASTER, ValidationResult.ERROR, "", error="Frame not found"))
+        spans = build_batch_spans("10.0.0.1", "master", "live", results)
+
+        root, first_command = spans[0], spans[1]
+        self.assertEqual(len(spans), 1 + 2 * 7)  # Commands without phases are skipped
+        self.assertEqual(len({span["traceId"] for span in spans}), 1)
+        self.assertEqual(first_command["parentSpanId"], root["spanId"])
+        phases = [span for span in spans if span.get("parentSpanId") == first_command["spanId"]]
+        self.assertEqual([span["name"] for span in phases][0], "connect")
+        self.assertEqual(phases[0]["startTimeUnixNano"], first_command["startTimeUnixNano"])
+        self.assertLessEqual(int(phases[-1]["endTimeUnixNano"]), int(first_command["endTimeUnixNano"]))
+        self.assertEqual(spans[8]["status"], {"code": 2, "message": "CRC mismatch"})
+
+    def test_file_exporter(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "spans" / "drs.jsonl"
+            processor = configure_span_export(FileSpanExporter(path))
+            export_batch_spans("10.0.0.1", "master", "live", [_timed_result("device_id")])
+            export_batch_spans("10.0.0.1", "master", "mock", [])  # Nothing to export
+            shutdown_span_export()
+            export_batch_spans("10.0.0.1", "master", "live", [_timed_result("device_id")])  # Disabled: no-op
+
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+            self.assertEqual(len(lines), 1)
+            self.assertEqual(processor.stats()["exported"], 1)
+            resource = lines[0]["resourceSpans"][0]
+            self.assertEqual(resource["resource"]["attributes"][0]["value"], {"stringValue": "drs-validator"})
+            self.assertEqual(len(resource["scopeSpans"][0]["spans"]), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for structured tracing
+
+Checks that disabled events cost a level check, that per-device tracing
+overrides the global level, and that frames are rendered as hex by the
+queue listener thread.
+"""
+
+import io
+import json
+import logging
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from validation import tracing
+from validation.tracing import StructuredFormatter, Tracer, configure_logging, shutdown_logging, trace_device
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestTracing(unittest.TestCase):
+    """Test suite for Tracer and configure_logging"""
+
+    def setUp(self):
+        self.tracer = Tracer("test.tracing")
+        self.collect = _Collect()
+        self.tracer.logger.addHandler(self.collect)
+        self.tracer.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        self.tracer.logger.removeHandler(self.collect)
+        self.tracer.logger.setLevel(logging.NOTSET)
+        trace_device("10.0.0.7", enabled=False)
+        shutdown_logging()
+
+    def test_per_device_override(self):
+        self.tracer.event("frame_tx", device="10.0.0.7", frame=b"\x7e\x01")
+        self.assertEqual(self.collect.records, [])
+        self.assertFalse(self.tracer.enabled(device="10.0.0.7"))
+
+        trace_device("10.0.0.7")
+        self.tracer.event("frame_tx", device="10.0.0.7", frame=b"\x7e\x01")
+        self.tracer.event("frame_tx", device="10.0.0.8", frame=b"\x7e\x02")
+        self.assertEqual(len(self.collect.records), 1)
+        record = self.collect.records[0]
+        self.assertEqual(record.levelno, logging.DEBUG)
+        self.assertEqual(record.trace, {"frame": b"\x7e\x01", "device": "10.0.0.7"})
+
+    def test_formatter_renders_frames_as_hex(self):
+        self.tracer.event("frame_rx", level=logging.INFO, device="10.0.0.7", frame=b"\x7e\xff", request_ms=1.5)
+        record = self.collect.records[0]
+        self.assertTrue(StructuredFormatter().format(record).endswith("frame_rx frame=7EFF request_ms=1.5 device=10.0.0.7"))
+        entry = json.loads(StructuredFormatter(json_output=True).format(record))
+        self.assertEqual((entry["event"], entry["level"], entry["frame"]), ("frame_rx", "info", "7EFF"))
+
+    def test_queue_listener_writes_events(self):
+        output = io.StringIO()
+        with mock.patch.object(tracing, "STRUCTLOG_AVAILABLE", False):
+            configure_logging("INFO", json_output=True, stream=output)
+        self.tracer.logger.setLevel(logging.NOTSET)
+        self.tracer.event("command_failed", level=logging.WARNING, command="device_id", error="Timeout")
+        self.tracer.event("frame_tx", frame=b"\x01")  # DEBUG: filtered by the root level
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([line["event"] for line in lines], ["command_failed"])
+        self.assertEqual(lines[0]["command"], "device_id")
+
+    def test_invalid_level_falls_back_to_info(self):
+        output = io.StringIO()
+        with mock.patch.object(tracing, "STRUCTLOG_AVAILABLE", False):
+            configure_logging("VERBOSE", json_output=True, stream=output)
+        self.assertEqual(logging.getLogger().level, logging.INFO)
+        shutdown_logging()
+
+        warning = json.loads(output.getvalue().splitlines()[0])
+        self.assertEqual(warning["level"], "warning")
+        self.assertIn("VERBOSE", warning["event"])
+
+
+if __name__ == "__main__":
+    unittest.main()